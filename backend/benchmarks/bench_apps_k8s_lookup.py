@@ -0,0 +1,184 @@
+"""
+Benchmark: per-component kubectl lookups vs. the batched deployment index used by /apps.
+
+Starts a fake Kubernetes API server on localhost that serves APPS x ENVS x COMPONENTS
+deployments, then resolves every component both ways:
+
+- legacy:  one process per component (`kubectl get deploy ... -o jsonpath`, or a
+           python subprocess doing the same single GET when kubectl is not installed)
+- batched: services.app_k8s.list_deployments_by_namespace through K8sClientManager
+
+Usage (from backend/):
+    python benchmarks/bench_apps_k8s_lookup.py [--apps 40] [--envs 4] [--components 3] [--latency-ms 5]
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.app_k8s import list_deployments_by_namespace  # noqa: E402
+from services.k8s_client import K8sClientManager  # noqa: E402
+
+
+def _deployment(ns: str, name: str) -> dict:
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": name, "namespace": ns, "resourceVersion": "1"},
+        "spec": {
+            "replicas": 2,
+            "selector": {"matchLabels": {"app": name}},
+            "template": {
+                "metadata": {"labels": {"app": name}},
+                "spec": {"containers": [{"name": name, "image": f"registry/{name}:v1.0.0"}]},
+            },
+        },
+        "status": {"replicas": 2, "readyReplicas": 2},
+    }
+
+
+DISCOVERY = {
+    "/api": {"kind": "APIVersions", "versions": ["v1"], "serverAddressByClientCIDRs": []},
+    "/api/v1": {"kind": "APIResourceList", "groupVersion": "v1", "resources": []},
+    "/apis": {
+        "kind": "APIGroupList", "apiVersion": "v1",
+        "groups": [{
+            "name": "apps",
+            "versions": [{"groupVersion": "apps/v1", "version": "v1"}],
+            "preferredVersion": {"groupVersion": "apps/v1", "version": "v1"},
+        }],
+    },
+    "/apis/apps/v1": {
+        "kind": "APIResourceList", "apiVersion": "v1", "groupVersion": "apps/v1",
+        "resources": [{
+            "name": "deployments", "singularName": "deployment", "namespaced": True,
+            "kind": "Deployment", "verbs": ["get", "list"], "shortNames": ["deploy"],
+        }],
+    },
+}
+
+
+def start_fake_api_server(deployments: dict, latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body: dict):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            time.sleep(latency)
+            path = self.path.split("?", 1)[0]
+            if path in DISCOVERY:
+                return self._send(200, DISCOVERY[path])
+            parts = path.strip("/").split("/")
+            # /apis/apps/v1/deployments
+            if parts == ["apis", "apps", "v1", "deployments"]:
+                items = [d for by_name in deployments.values() for d in by_name.values()]
+                return self._send(200, {"kind": "DeploymentList", "apiVersion": "apps/v1",
+                                        "metadata": {"resourceVersion": "1"}, "items": items})
+            # /apis/apps/v1/namespaces/{ns}/deployments[/{name}]
+            if parts[:4] == ["apis", "apps", "v1", "namespaces"] and len(parts) >= 6 and parts[5] == "deployments":
+                by_name = deployments.get(parts[4], {})
+                if len(parts) == 6:
+                    return self._send(200, {"kind": "DeploymentList", "apiVersion": "apps/v1",
+                                            "metadata": {"resourceVersion": "1"}, "items": list(by_name.values())})
+                if parts[6] in by_name:
+                    return self._send(200, by_name[parts[6]])
+            self._send(404, {"kind": "Status", "status": "Failure", "reason": "NotFound", "code": 404})
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def write_kubeconfig(server_url: str, directory: str) -> str:
+    path = os.path.join(directory, "config")
+    with open(path, "w") as f:
+        json.dump({
+            "apiVersion": "v1", "kind": "Config", "current-context": "fake",
+            "clusters": [{"name": "fake", "cluster": {"server": server_url}}],
+            "users": [{"name": "fake", "user": {"token": "fake"}}],
+            "contexts": [{"name": "fake", "context": {"cluster": "fake", "user": "fake"}}],
+        }, f)
+    return path
+
+
+_SINGLE_GET = (
+    "import sys, urllib.request; "
+    "urllib.request.urlopen(sys.argv[1] + '/apis/apps/v1/namespaces/' + sys.argv[2] + '/deployments/' + sys.argv[3]).read()"
+)
+
+
+def run_legacy(targets: list[tuple[str, str]], server_url: str, kubeconfig: str) -> float:
+    kubectl = shutil.which("kubectl")
+    env = {**os.environ, "KUBECONFIG": kubeconfig}
+    start = time.perf_counter()
+    for ns, name in targets:
+        if kubectl:
+            cmd = [kubectl, "get", "deploy", name, "-n", ns, "-o",
+                   "jsonpath={.spec.replicas} {.status.readyReplicas} {.spec.template.spec.containers[0].image}"]
+        else:
+            cmd = [sys.executable, "-c", _SINGLE_GET, server_url, ns, name]
+        subprocess.run(cmd, capture_output=True, text=True, env=env, timeout=60)
+    return time.perf_counter() - start
+
+
+def run_batched(namespaces: set[str], kubeconfig: str) -> tuple[float, int]:
+    manager = K8sClientManager(kubeconfig)
+    start = time.perf_counter()
+    index = list_deployments_by_namespace(manager.apps_v1(""), namespaces)
+    elapsed = time.perf_counter() - start
+    manager.close_all()
+    return elapsed, len(index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apps", type=int, default=40)
+    parser.add_argument("--envs", type=int, default=4)
+    parser.add_argument("--components", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated API server latency per request")
+    args = parser.parse_args()
+
+    deployments: dict[str, dict] = {}
+    targets = []
+    for a in range(args.apps):
+        for e in range(args.envs):
+            ns = f"env{e}-app{a}"
+            deployments[ns] = {}
+            for c in range(args.components):
+                name = f"app{a}-c{c}-ui"
+                deployments[ns][name] = _deployment(ns, name)
+                targets.append((ns, name))
+
+    server = start_fake_api_server(deployments, args.latency_ms / 1000)
+    server_url = f"http://127.0.0.1:{server.server_address[1]}"
+    with tempfile.TemporaryDirectory() as tmp:
+        kubeconfig = write_kubeconfig(server_url, tmp)
+        legacy = run_legacy(targets, server_url, kubeconfig)
+        batched, resolved = run_batched(set(deployments), kubeconfig)
+    server.shutdown()
+
+    mode = "kubectl" if shutil.which("kubectl") else "python subprocess (kubectl not found)"
+    print(f"components: {len(targets)}  namespaces: {len(deployments)}  latency: {args.latency_ms}ms")
+    print(f"legacy  [{mode}]: {legacy:8.3f}s  ({len(targets)} processes)")
+    print(f"batched [K8sClientManager]: {batched:8.3f}s  ({resolved} deployments indexed)")
+    print(f"speedup: {legacy / batched:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Load test: the asyncio exec bridge vs. the old thread-per-session polling bridge.
+
+Starts a fake Kubernetes exec endpoint (v4.channel.k8s.io, echoes stdin back on stdout)
+and a uvicorn app exposing both bridges, then opens SESSIONS concurrent shells through
+each one and types KEYS keystrokes per session, measuring the keystroke -> echo latency
+and the number of threads the server process needed.
+
+- legacy: k8s_stream.stream + one reader thread per session polling update(timeout=1)
+- async:  services.exec_bridge.open_exec + bridge (no per-session threads)
+
+Usage (from backend/):
+    python benchmarks/bench_exec_bridge.py [--sessions 300] [--keys 20] [--mode both]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from kubernetes import stream as k8s_stream
+from websockets.asyncio.client import connect
+from websockets.asyncio.server import serve
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.exec_bridge import bridge, open_exec  # noqa: E402
+from services.k8s_client import K8sClientManager  # noqa: E402
+
+
+async def _fake_exec(conn):
+    """One fake shell: stdin (channel 0) is echoed on stdout (channel 1), resizes are ignored."""
+    async for frame in conn:
+        data = frame if isinstance(frame, bytes) else frame.encode()  # the old client sends text frames
+        if data[:1] == b"\x00":
+            await conn.send(b"\x01" + data[1:])
+
+
+def start_fake_api_server() -> tuple[int, threading.Event]:
+    ready = threading.Event()
+    holder = {}
+
+    async def main():
+        async with serve(_fake_exec, "127.0.0.1", 0, subprotocols=["v4.channel.k8s.io"], compression=None) as server:
+            holder["port"] = server.sockets[0].getsockname()[1]
+            ready.set()
+            await asyncio.Future()
+
+    threading.Thread(target=lambda: asyncio.run(main()), daemon=True).start()
+    ready.wait()
+    return holder["port"], ready
+
+
+def write_kubeconfig(server_url: str, directory: str) -> str:
+    path = os.path.join(directory, "config")
+    with open(path, "w") as f:
+        json.dump({
+            "apiVersion": "v1", "kind": "Config", "current-context": "fake",
+            "clusters": [{"name": "fake", "cluster": {"server": server_url}}],
+            "users": [{"name": "fake", "user": {"token": "fake"}}],
+            "contexts": [{"name": "fake", "context": {"cluster": "fake", "user": "fake"}}],
+        }, f)
+    return path
+
+
+def build_app(k8s: K8sClientManager) -> FastAPI:
+    app = FastAPI()
+
+    @app.websocket("/async")
+    async def async_exec(ws: WebSocket):
+        await ws.accept()
+        k8s_ws = await open_exec(k8s.api_client("fake"), "ns", "pod", "app", ["/bin/sh"])
+        await bridge(ws, k8s_ws)
+
+    @app.websocket("/legacy")
+    async def legacy_exec(ws: WebSocket):
+        # The bridge this benchmark replaces, kept as it was
+        await ws.accept()
+        exec_stream = await asyncio.to_thread(
+            k8s_stream.stream, k8s.core_v1("fake").connect_get_namespaced_pod_exec, "pod", "ns",
+            container="app", command=["/bin/sh"], stderr=True, stdin=True, stdout=True, tty=True,
+            _preload_content=False,
+        )
+        closed = False
+        loop = asyncio.get_running_loop()
+
+        def read_from_k8s():
+            nonlocal closed
+            try:
+                while not closed and exec_stream.is_open():
+                    exec_stream.update(timeout=1)
+                    if exec_stream.peek_stdout():
+                        asyncio.run_coroutine_threadsafe(ws.send_text(exec_stream.read_stdout()), loop)
+            except Exception:
+                pass
+            finally:
+                closed = True
+
+        threading.Thread(target=read_from_k8s, daemon=True).start()
+        try:
+            while not closed:
+                data = await ws.receive_text()
+                if exec_stream.is_open():
+                    exec_stream.write_stdin(data)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            closed = True
+            exec_stream.close()
+
+    return app
+
+
+async def _session(url: str, keys: int, legacy: bool, latencies: list[float]):
+    async with connect(url, compression=None, open_timeout=60, ping_interval=None) as ws:
+        for i in range(keys):
+            key = chr(ord("a") + i % 26)
+            start = time.perf_counter()
+            if legacy:
+                await ws.send(key)
+            else:
+                await ws.send(key.encode())
+            while True:
+                echo = await ws.recv()
+                if (echo if isinstance(echo, str) else echo.decode()).endswith(key):
+                    break
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0.05)  # typing speed
+
+
+async def run(base: str, mode: str, sessions: int, keys: int) -> dict:
+    latencies: list[float] = []
+    threads_before = threading.active_count()
+    peak_threads = threads_before
+    stop = asyncio.Event()
+
+    async def sample_threads():
+        nonlocal peak_threads
+        while not stop.is_set():
+            peak_threads = max(peak_threads, threading.active_count())
+            await asyncio.sleep(0.05)
+
+    sampler = asyncio.create_task(sample_threads())
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_session(f"{base}/{mode}", keys, mode == "legacy", latencies) for _ in range(sessions)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await sampler
+    errors = [r for r in results if isinstance(r, Exception)]
+    latencies.sort()
+    return {
+        "mode": mode,
+        "sessions": sessions - len(errors),
+        "errors": len(errors),
+        "elapsed_s": round(elapsed, 2),
+        "echo_p50_ms": round(statistics.median(latencies) * 1000, 1) if latencies else None,
+        "echo_p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 1)
+        if latencies else None,
+        "extra_threads": peak_threads - threads_before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--keys", type=int, default=20)
+    parser.add_argument("--mode", choices=["async", "legacy", "both"], default="both")
+    args = parser.parse_args()
+
+    port, _ = start_fake_api_server()
+    k8s = K8sClientManager(write_kubeconfig(f"http://127.0.0.1:{port}", tempfile.mkdtemp()))
+
+    config = uvicorn.Config(build_app(k8s), host="127.0.0.1", port=0, log_level="warning", ws_max_queue=64)
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    base = f"ws://127.0.0.1:{server.servers[0].sockets[0].getsockname()[1]}"
+
+    # Sessions share this process with the server: its thread count is the server's
+    modes = ["legacy", "async"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        print(json.dumps(asyncio.run(run(base, mode, args.sessions, args.keys))))
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Benchmark: client-model list deserialization vs. the raw-JSON fast path (K8S_RAW_LISTS).
+
+Serves node, deployment and pod lists from a fake Kubernetes API server on localhost and
+builds the /k8s response rows from each both ways, checking that the rows are identical:
+
+- models: list_* through the generated client, rows from V1* model objects
+- raw:    K8sClientManager.list_raw (orjson when installed, else json), rows from dicts
+
+Fixtures are generated as kubectl would return them (managedFields, annotations, probes,
+conditions), COUNT objects per kind. To use recorded lists instead, pass a directory
+holding nodes.json / deployments.json / pods.json from `kubectl get <kind> -A -o json`.
+
+Usage (from backend/):
+    python benchmarks/bench_raw_lists.py [--count 10000] [--repeat 3] [--fixtures DIR]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from kubernetes import client
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routers import k8s as k8s_router  # noqa: E402
+from services.k8s_client import K8sClientManager, json_loads  # noqa: E402
+
+TS = "2024-05-01T08:00:00Z"
+
+
+def _managed_fields(manager: str) -> list[dict]:
+    return [{
+        "manager": manager, "operation": "Update", "apiVersion": "v1", "time": TS, "fieldsType": "FieldsV1",
+        "fieldsV1": {"f:metadata": {"f:labels": {".": {}, "f:app": {}}}, "f:spec": {"f:replicas": {}}},
+    }]
+
+
+def _container(name: str) -> dict:
+    return {
+        "name": name, "image": f"registry.example.com/{name}:1.2.3", "imagePullPolicy": "IfNotPresent",
+        "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+        "env": [{"name": f"VAR_{i}", "value": f"value-{i}"} for i in range(8)],
+        "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}, "limits": {"cpu": "1", "memory": "512Mi"}},
+        "readinessProbe": {"httpGet": {"path": "/healthz", "port": 8080, "scheme": "HTTP"}, "periodSeconds": 10},
+        "volumeMounts": [{"name": "config", "mountPath": "/etc/app"}],
+        "terminationMessagePath": "/dev/termination-log", "terminationMessagePolicy": "File",
+    }
+
+
+def _meta(name: str, ns: str, i: int, manager: str) -> dict:
+    return {
+        "name": name, "namespace": ns, "uid": f"00000000-0000-0000-0000-{i:012d}", "resourceVersion": str(1000 + i),
+        "generation": 3, "creationTimestamp": TS, "labels": {"app": name, "team": f"team-{i % 7}"},
+        "annotations": {"deployment.kubernetes.io/revision": "3", "example.com/owner": "platform"},
+        "managedFields": _managed_fields(manager),
+    }
+
+
+def deployment(i: int) -> dict:
+    name, ns = f"app-{i}", f"ns-{i % 50}"
+    return {
+        "apiVersion": "apps/v1", "kind": "Deployment", "metadata": _meta(name, ns, i, "kubectl"),
+        "spec": {
+            "replicas": 3, "selector": {"matchLabels": {"app": name}},
+            "strategy": {"type": "RollingUpdate", "rollingUpdate": {"maxSurge": "25%", "maxUnavailable": "25%"}},
+            "template": {
+                "metadata": {"labels": {"app": name}},
+                "spec": {"containers": [_container(name), _container("sidecar")],
+                         "volumes": [{"name": "config", "configMap": {"name": name}}]},
+            },
+        },
+        "status": {
+            "replicas": 3, "readyReplicas": 3 if i % 10 else 0, "availableReplicas": 3 if i % 10 else 0,
+            "updatedReplicas": 3, "observedGeneration": 3,
+            "conditions": [
+                {"type": "Available", "status": "True", "reason": "MinimumReplicasAvailable",
+                 "lastUpdateTime": TS, "lastTransitionTime": TS},
+                {"type": "Progressing", "status": "True", "reason": "NewReplicaSetAvailable",
+                 "lastUpdateTime": f"2024-05-0{1 + i % 9}T09:00:00Z", "lastTransitionTime": TS},
+            ],
+        },
+    }
+
+
+def pod(i: int) -> dict:
+    name, ns = f"app-{i}-7d9c5b", f"ns-{i % 50}"
+    return {
+        "apiVersion": "v1", "kind": "Pod", "metadata": _meta(name, ns, i, "kube-controller-manager"),
+        "spec": {"containers": [_container(f"app-{i}"), _container("sidecar")], "nodeName": f"node-{i % 100}",
+                 "volumes": [{"name": "config", "configMap": {"name": f"app-{i}"}}]},
+        "status": {
+            "phase": "Running", "podIP": f"10.0.{i // 250 % 256}.{i % 250}", "startTime": TS,
+            "conditions": [{"type": t, "status": "True", "lastTransitionTime": TS}
+                           for t in ("Initialized", "Ready", "ContainersReady", "PodScheduled")],
+            "containerStatuses": [
+                {"name": c, "ready": True, "restartCount": 0, "image": "registry.example.com/app:1.2.3",
+                 "imageID": "sha256:abc", "containerID": "containerd://abc", "started": True,
+                 "state": {"running": {"startedAt": TS}}}
+                for c in (f"app-{i}", "sidecar")
+            ],
+        },
+    }
+
+
+def node(i: int) -> dict:
+    meta = _meta(f"node-{i}", None, i, "kubelet")
+    del meta["namespace"]
+    meta["labels"].update({"kubernetes.io/hostname": f"node-{i}", "node-role.kubernetes.io/worker": ""})
+    return {
+        "apiVersion": "v1", "kind": "Node", "metadata": meta,
+        "spec": {"podCIDR": "10.244.0.0/24", "taints": [{"key": "dedicated", "value": "gpu", "effect": "NoSchedule"}]},
+        "status": {
+            "allocatable": {"cpu": "7910m", "memory": "32000000Ki", "pods": "110"},
+            "capacity": {"cpu": "8", "memory": "32500000Ki", "pods": "110"},
+            "addresses": [{"type": "InternalIP", "address": f"10.1.{i // 250 % 256}.{i % 250}"},
+                          {"type": "Hostname", "address": f"node-{i}"}],
+            "conditions": [{"type": t, "status": "True" if t == "Ready" else "False", "lastHeartbeatTime": TS,
+                            "lastTransitionTime": TS, "reason": "KubeletReady", "message": "ok"}
+                           for t in ("MemoryPressure", "DiskPressure", "PIDPressure", "Ready")],
+            "nodeInfo": {
+                "architecture": "amd64", "bootID": "b", "containerRuntimeVersion": "containerd://1.7.2",
+                "kernelVersion": "5.15.0", "kubeProxyVersion": "v1.30.1", "kubeletVersion": "v1.30.1",
+                "machineID": "m", "operatingSystem": "linux", "osImage": "Ubuntu 22.04", "systemUUID": "s",
+            },
+            "images": [{"names": [f"registry.example.com/img-{j}:1.0"], "sizeBytes": 1000000 * j} for j in range(20)],
+        },
+    }
+
+
+def load_fixtures(count: int, directory: str | None) -> dict[str, bytes]:
+    if directory:
+        fixtures = {}
+        for kind in ("nodes", "deployments", "pods"):
+            with open(os.path.join(directory, f"{kind}.json"), "rb") as f:
+                fixtures[kind] = f.read()
+        return fixtures
+    make = {"nodes": node, "deployments": deployment, "pods": pod}
+    return {
+        kind: json.dumps({"kind": "List", "apiVersion": "v1", "metadata": {"resourceVersion": "1"},
+                          "items": [fn(i) for i in range(count)]}).encode()
+        for kind, fn in make.items()
+    }
+
+
+def start_fake_api_server(fixtures: dict[str, bytes]) -> int:
+    routes = {
+        "/api/v1/nodes": fixtures["nodes"],
+        "/apis/apps/v1/deployments": fixtures["deployments"],
+        "/api/v1/namespaces/bench/pods": fixtures["pods"],
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = routes.get(self.path.split("?")[0])
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_address[1]
+
+
+def write_kubeconfig(server_url: str, directory: str) -> str:
+    path = os.path.join(directory, "config")
+    with open(path, "w") as f:
+        json.dump({
+            "apiVersion": "v1", "kind": "Config", "current-context": "bench",
+            "clusters": [{"name": "bench", "cluster": {"server": server_url}}],
+            "users": [{"name": "bench", "user": {"token": "bench"}}],
+            "contexts": [{"name": "bench", "context": {"cluster": "bench", "user": "bench"}}],
+        }, f)
+    return path
+
+
+def cases(k8s: K8sClientManager) -> dict:
+    """kind -> (model path, raw path); each returns the response rows."""
+    no_metrics: dict = {}
+    return {
+        "nodes": (
+            lambda: [k8s_router._node_info(n, no_metrics) for n in k8s.core_v1("bench").list_node().items],
+            lambda: [k8s_router._node_info_raw(n, no_metrics)
+                     for n in k8s.list_raw("bench", client.CoreV1Api, "list_node")["items"]],
+        ),
+        "deployments": (
+            lambda: [k8s_router._deployment_info(d)
+                     for d in k8s.apps_v1("bench").list_deployment_for_all_namespaces().items],
+            lambda: [k8s_router._deployment_info_raw(d) for d in k8s.list_raw(
+                "bench", client.AppsV1Api, "list_deployment_for_all_namespaces")["items"]],
+        ),
+        "pods": (
+            lambda: [(p.metadata.name, p.status.phase, [c.name for c in p.spec.containers])
+                     for p in k8s.core_v1("bench").list_namespaced_pod("bench").items],
+            lambda: [(p["metadata"]["name"], p["status"]["phase"], [c["name"] for c in p["spec"]["containers"]])
+                     for p in k8s.list_raw("bench", client.CoreV1Api, "list_namespaced_pod", "bench")["items"]],
+        ),
+    }
+
+
+def best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(fn) -> int:
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10000, help="objects per generated fixture")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--fixtures", help="directory with recorded nodes/deployments/pods .json lists")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.count, args.fixtures)
+    port = start_fake_api_server(fixtures)
+    k8s = K8sClientManager(write_kubeconfig(f"http://127.0.0.1:{port}", tempfile.mkdtemp()))
+    print(f"json parser: {json_loads.__module__}.{json_loads.__name__}")
+
+    for kind, (models, raw) in cases(k8s).items():
+        assert models() == raw(), f"{kind}: raw rows differ from model rows"
+        t_models, t_raw = best_time(models, args.repeat), best_time(raw, args.repeat)
+        m_models, m_raw = peak_memory(models), peak_memory(raw)
+        print(
+            f"{kind:12s} {len(fixtures[kind]) / 2**20:6.1f} MiB  "
+            f"models {t_models:7.3f}s {m_models / 2**20:7.1f} MiB peak  |  "
+            f"raw {t_raw:7.3f}s {m_raw / 2**20:7.1f} MiB peak  |  "
+            f"{t_models / t_raw:4.1f}x faster, {m_models / m_raw:4.1f}x less memory"
+        )
+    k8s.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,21 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from routers import auth, apps, users, audit, k8s, servers, metrics, ansible
 
-app = FastAPI(title="Admin Dashboard API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    apps.recover_rollback_jobs()
+    apps.start_background_refresh()
+    yield
+    apps.stop_background_refresh()
+    k8s.stop_informers()
+
+
+app = FastAPI(title="Admin Dashboard API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -11,6 +23,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Snapshot-Age", "X-Snapshot-Refreshing", "X-Total-Count", "X-Next-Cursor"],
 )
 
 app.include_router(auth.router)
@@ -1,8 +1,9 @@
 from datetime import datetime
 
 from sqlalchemy import (
-    Column, Integer, String, Boolean, Enum, DateTime, JSON, Text, ForeignKey, Table
+    Column, Integer, String, Boolean, Enum, DateTime, JSON, Text, ForeignKey, Table, UniqueConstraint
 )
+from sqlalchemy.dialects.mysql import MEDIUMTEXT
 from sqlalchemy.orm import relationship
 
 from database import Base
@@ -62,6 +63,7 @@ class Group(Base):
 
 class Permission(Base):
     __tablename__ = "permissions"
+    __table_args__ = (UniqueConstraint("type", "target", "action", name="uq_permission"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     type = Column(Enum("app_deploy", "page_access"), nullable=False)
@@ -88,6 +90,22 @@ class AuditLog(Base):
     user = relationship("User", back_populates="audit_logs")
 
 
+class RollbackJob(Base):
+    __tablename__ = "rollback_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    app_name = Column(String(100), nullable=False)
+    env = Column(String(50), nullable=False)
+    target_version = Column(String(200), nullable=False)
+    status = Column(Enum("queued", "running", "success", "failed"), nullable=False, default="queued")
+    started_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    log = Column(Text().with_variant(MEDIUMTEXT, "mysql"), nullable=True)  # TEXT caps at 64 KB
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+    user = relationship("User")
+
+
 # ---------------------------------------------------------------------------
 # Phase 3: Server Management
 # ---------------------------------------------------------------------------
@@ -1,79 +1,96 @@
 import os
-import subprocess
+import uuid
+import asyncio
+import itertools
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from typing import Optional
 
-import yaml
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import DataError, OperationalError
 from sqlalchemy.orm import Session
 
 from config import (
-    BANANA_DEPLOY_GIT_URL, BANANA_DEPLOY_LOCAL_PATH, DEPLOY_GIT_BRANCH,
-    APP_REPOS_LOCAL_PATH, get_app_git_urls, inject_token,
+    BANANA_DEPLOY_GIT_URL, BANANA_DEPLOY_LOCAL_PATH, DEPLOY_GIT_BRANCH, DEPLOY_INDEX_PATH, DEPLOY_SYNC_MIN_INTERVAL,
+    APP_REPOS_LOCAL_PATH, APPS_K8S_CONTEXT, APPS_REFRESH_INTERVAL, TAG_CACHE_TTL,
+    APPS_WATCH_ENABLED, K8S_BULK_WORKERS, K8S_INFORMER_RESYNC, ROLLBACK_TIMEOUT,
+    get_app_git_urls, inject_token,
 )
-from database import get_db
-from models import User, Permission, AuditLog
+from database import SessionLocal, get_db
+from models import User, Permission, AuditLog, RollbackJob
 from schemas import (
-    AppStatusResponse, AppTagResponse, RollbackRequest, ReplicaChangeRequest, MessageResponse
+    AppStatusResponse, AppTagResponse, RollbackRequest, RollbackJobResponse, ReplicaChangeRequest,
+    ReplicaBatchRequest, ReplicaBatchItemResult, ReplicaBatchResponse, MessageResponse,
 )
 from deps import get_current_user, require_permission
+from services.app_k8s import UNKNOWN_K8S_INFO, deployment_k8s_info, list_deployments_by_namespace
+from services.deploy_index import DeployIndex, DeployIndexStore
+from services.etag import conditional, make_etag
+from services.event_hub import EventHub
+from services.job_runner import JobOutput, JobRunner, run_streaming
+from services.k8s_client import k8s_manager
+from services.k8s_informer import Informer
+from services.repo_sync import RepoSyncManager
+from services.snapshot_refresher import SnapshotRefresher
+from services.tag_cache import TagCache
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/apps", tags=["apps"])
 
-EXCLUDED_DIRS = {"common-chart", ".git", "admin-dashboard-frontend", "admin-dashboard-backend"}
-
-# Simple in-memory cache for app status (TTL: 30 seconds)
-_app_cache: dict = {"data": None, "timestamp": 0}
-CACHE_TTL = 30
+_k8s = k8s_manager
+_repo_sync = RepoSyncManager(DEPLOY_SYNC_MIN_INTERVAL)
+_deploy_index = DeployIndexStore(DEPLOY_INDEX_PATH)
+_tag_cache = TagCache(APP_REPOS_LOCAL_PATH, TAG_CACHE_TTL)
 
 
 def _invalidate_app_cache():
-    """Invalidate app cache (call after rollback/scale)"""
-    global _app_cache
-    _app_cache["data"] = None
-    _app_cache["timestamp"] = 0
+    """Schedule a background rebuild of the app status snapshot (call after rollback/scale)"""
+    _refresher.request_refresh()
     logger.info("App cache invalidated")
 
 
-def _run(cmd: list[str], cwd: str = None) -> subprocess.CompletedProcess:
-    return subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, timeout=120)
-
-
 # ---------------------------------------------------------------------------
 # Git repo sync helpers
 # ---------------------------------------------------------------------------
 
-def _sync_repo(git_url: str, local_path: str, branch: str = "master") -> str:
-    """Clone if not exists, otherwise fetch + reset to origin/{branch}. Returns local_path."""
-    if os.path.isdir(os.path.join(local_path, ".git")):
-        # Fetch latest changes from remote
-        result = _run(["git", "-C", local_path, "fetch", "--all", "--tags"])
-        if result.returncode != 0:
-            logger.warning("git fetch failed for %s: %s", local_path, result.stderr)
-            # Continue with existing state if fetch fails (network issues, etc.)
-
-        # Reset to match remote branch exactly (discards local changes)
-        result = _run(["git", "-C", local_path, "reset", "--hard", f"origin/{branch}"])
-        if result.returncode != 0:
-            logger.error("git reset failed for %s: %s", local_path, result.stderr)
-            raise HTTPException(status_code=500, detail=f"Failed to sync repo: {result.stderr}")
-
-        logger.info("Synced repo %s to %s", local_path, branch)
-    else:
-        # Clone repo for the first time
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        result = _run(["git", "clone", "-b", branch, git_url, local_path])
-        if result.returncode != 0:
-            raise HTTPException(status_code=500, detail=f"git clone failed: {result.stderr}")
-        logger.info("Cloned repo to %s", local_path)
-    return local_path
+def _sync_repo(git_url: str, local_path: str, branch: str = "master", force: bool = False) -> str:
+    """Clone if not exists, otherwise fetch + reset to origin/{branch} (coalesced, rate-limited). Returns local_path."""
+    try:
+        return _repo_sync.sync(git_url, local_path, branch, force=force)
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 
-def _sync_banana_deploy() -> str:
+def _sync_banana_deploy(force: bool = False) -> str:
     """Sync banana-deploy repo and return local path."""
-    return _sync_repo(inject_token(BANANA_DEPLOY_GIT_URL), BANANA_DEPLOY_LOCAL_PATH, DEPLOY_GIT_BRANCH)
+    return _sync_repo(inject_token(BANANA_DEPLOY_GIT_URL), BANANA_DEPLOY_LOCAL_PATH, DEPLOY_GIT_BRANCH, force=force)
+
+
+def _deploy_repo_lock():
+    """Hold while reading or modifying the banana-deploy working tree."""
+    return _repo_sync.lock(BANANA_DEPLOY_LOCAL_PATH)
+
+
+def _load_deploy_index(force: bool = False) -> DeployIndex:
+    """Sync banana-deploy and return its parsed index (re-parsed only when HEAD moves)."""
+    # Sync before taking the repo lock: sync() only coalesces with a fetch that finished
+    # while the caller was queued if the caller arrives there without already holding it
+    deploy_path = _sync_banana_deploy(force=force)
+    with _deploy_repo_lock():
+        return _deploy_index.get(deploy_path)
+
+
+def _lookup_deploy_index() -> DeployIndex:
+    """The current index for name lookups, without waiting on the repo lock (a rollback can hold
+    it for minutes). The refresher keeps it up to date; sync only before the first build."""
+    index = _deploy_index.current
+    if index is None:
+        index = _load_deploy_index()
+    return index
 
 
 def _sync_app_repo(app_name: str) -> str:
@@ -89,260 +106,384 @@ def _sync_app_repo(app_name: str) -> str:
 # K8s helpers
 # ---------------------------------------------------------------------------
 
-def _get_deploy_version(deploy_path: str, app_name: str, env: str) -> str:
-    env_yaml_path = os.path.join(deploy_path, app_name, "image", f"{env}.yaml")
-    if not os.path.isfile(env_yaml_path):
-        return "unknown"
-    with open(env_yaml_path, "r") as f:
-        data = yaml.safe_load(f)
-    return data.get("image", {}).get("tag", "unknown") if data else "unknown"
-
-
-def _get_k8s_info(component_name: str, env: str, repo_name: str = None, deploy_path: str = None) -> dict:
+def _get_k8s_info(k8s_index: dict, env: str, repo_name: str, deploy_name: str) -> dict:
     """
-    Get K8s deployment info.
+    Resolve K8s deployment info from a prefetched (namespace, name) index.
     - namespace: {env}-{repo_name} (e.g., prod-project1)
     - deployment: from common.yaml's appname or app.name field
     """
-    if repo_name:
-        # Multi-component app: read deployment name from common.yaml
-        ns = f"{env}-{repo_name}"
-
-        # Try to read deployment name from common.yaml
-        deploy_name = component_name  # fallback
-        if deploy_path:
-            # Path: {deploy_path}/{repo_name}/{component_name}/common.yaml
-            common_yaml_path = os.path.join(deploy_path, repo_name, component_name, "common.yaml")
-            logger.debug("Reading deployment name from: %s", common_yaml_path)
-            try:
-                with open(common_yaml_path, "r") as f:
-                    common_data = yaml.safe_load(f)
-                if common_data:
-                    # Try app.name first (production format), then appname (legacy)
-                    app_name_from_yaml = common_data.get("app", {}).get("name")
-                    if not app_name_from_yaml:
-                        app_name_from_yaml = common_data.get("appname")
-
-                    if app_name_from_yaml:
-                        deploy_name = app_name_from_yaml
-                        logger.debug("Using deployment name from yaml: %s", deploy_name)
-                    else:
-                        logger.warning("No app.name or appname found in %s, using folder name: %s", common_yaml_path, component_name)
-                else:
-                    logger.warning("Empty yaml data in %s", common_yaml_path)
-            except FileNotFoundError:
-                logger.warning("common.yaml not found at %s, using folder name: %s", common_yaml_path, component_name)
-            except Exception as e:
-                logger.warning("Failed to read appname from %s: %s, using folder name: %s", common_yaml_path, str(e), component_name)
-    else:
-        # Backward compatibility: single component app
-        ns = f"{env}-{component_name}"
-        deploy_name = component_name
-
-    result = _run([
-        "kubectl", "get", "deploy", deploy_name,
-        "-n", ns,
-        "-o", "jsonpath={.spec.replicas} {.status.readyReplicas} {.spec.template.spec.containers[0].image}"
-    ])
-
-    if result.returncode != 0:
-        logger.debug("kubectl get deploy failed for %s in ns %s: %s", deploy_name, ns, result.stderr)
-        return {"k8sVersion": "unknown", "replicaDesired": 0, "replicaCurrent": 0}
-
+    ns = f"{env}-{repo_name}"
+    info = k8s_index.get((ns, deploy_name))
+    if info is None:
+        logger.debug("Deployment %s not found in ns %s", deploy_name, ns)
+        return dict(UNKNOWN_K8S_INFO)
+    return info
+
+
+def _load_k8s_index(namespaces: set[str]) -> dict:
+    """Deployments in the app namespaces: from the informer cache, else a single batched lookup."""
+    if _deploy_informer.synced:
+        return {
+            (d.metadata.namespace, d.metadata.name): deployment_k8s_info(d)
+            for d in _deploy_informer.list() if d.metadata.namespace in namespaces
+        }
     try:
-        parts = result.stdout.strip().split(" ", 2)
-
-        # Parse replicas (handle empty strings and whitespace)
-        desired_str = parts[0].strip() if len(parts) > 0 else ""
-        current_str = parts[1].strip() if len(parts) > 1 else ""
-
-        desired = int(desired_str) if desired_str and desired_str.isdigit() else 0
-        current = int(current_str) if current_str and current_str.isdigit() else 0
-
-        # Parse image
-        image = parts[2].strip() if len(parts) > 2 else ""
-        k8s_version = image.split(":")[-1] if ":" in image else "unknown"
-
-        return {"k8sVersion": k8s_version, "replicaDesired": desired, "replicaCurrent": current}
-    except (ValueError, IndexError) as e:
-        logger.warning("Failed to parse kubectl output for %s: %s (output: %s)", deploy_name, str(e), result.stdout[:100])
-        return {"k8sVersion": "unknown", "replicaDesired": 0, "replicaCurrent": 0}
+        return list_deployments_by_namespace(_k8s.apps_v1(APPS_K8S_CONTEXT), namespaces)
+    except Exception as e:
+        logger.warning("Failed to list deployments for apps: %s", str(e))
+        return {}
 
 
 # ---------------------------------------------------------------------------
-# Endpoints
+# App status snapshot
 # ---------------------------------------------------------------------------
 
-@router.get("", response_model=list[AppStatusResponse])
-def get_apps(
-    force_refresh: bool = Query(False, description="Bypass cache and force refresh"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    global _app_cache
-
-    # Check cache (unless force refresh)
-    if not force_refresh and _app_cache["data"] is not None:
-        age = time.time() - _app_cache["timestamp"]
-        if age < CACHE_TTL:
-            logger.debug("Returning cached app data (age: %.1fs)", age)
-            return _app_cache["data"]
-
-    logger.info("Refreshing app data (cache miss or expired)")
+# (app, env) -> (seq, inputs, entry) from the last build; entries with unchanged inputs are reused.
+# Full builds, scoped refreshes and watch events all write here: seq orders them, and a writer
+# never replaces an entry that was written from newer inputs than its own.
+_app_entries: dict[tuple[str, str], tuple[int, tuple, dict]] = {}
+_app_entries_lock = threading.Lock()
+_app_seq = itertools.count(1)
+
+# Changed app entries, pushed to /apps/ws/status subscribers
+_status_hub = EventHub()
+
+
+def _build_app_entry(app_name: str, env: str, deploy_version: str,
+                     components_with_names: list[tuple[str, str]], k8s_infos: list[dict]) -> dict:
+    # Gather component info
+    components = []
+    total_replica_current = 0
+    total_replica_desired = 0
+    all_synced = True
+
+    for (comp_name, _), k8s_info in zip(components_with_names, k8s_infos):
+        comp_sync = "Synced" if deploy_version == k8s_info["k8sVersion"] else "OutOfSync"
+
+        if comp_sync == "OutOfSync":
+            all_synced = False
+
+        components.append({
+            "name": comp_name,
+            "deployVersion": deploy_version,
+            "k8sVersion": k8s_info["k8sVersion"],
+            "syncStatus": comp_sync,
+            "replicaCurrent": k8s_info["replicaCurrent"],
+            "replicaDesired": k8s_info["replicaDesired"],
+        })
 
-    try:
-        deploy_path = _sync_banana_deploy()
-    except Exception as e:
-        logger.warning("Failed to sync deploy repo: %s", str(e))
-        return []
+        total_replica_current += k8s_info["replicaCurrent"]
+        total_replica_desired += k8s_info["replicaDesired"]
+
+    return {
+        "appName": app_name,
+        "env": env,
+        "deployVersion": deploy_version,
+        "components": components,
+        "overallSyncStatus": "Synced" if all_synced else "OutOfSync",
+        "totalReplicaCurrent": total_replica_current,
+        "totalReplicaDesired": total_replica_desired,
+    }
 
-    apps = []
-    discovered_apps = set()
 
-    # Scan repo folders (e.g., project1, project2)
-    for repo_folder in os.listdir(deploy_path):
-        if repo_folder in EXCLUDED_DIRS:
+def _app_targets(index: DeployIndex, app_name: Optional[str] = None, env: Optional[str] = None) -> list[tuple]:
+    """(app, env, deploy_version, [(component, deployment name)]) for apps that have components."""
+    targets = []
+    for name, entry in index.apps.items():
+        if not entry.components or (app_name and name != app_name):
             continue
+        components_with_names = sorted(entry.components.items())
+        for target_env, deploy_version in entry.envs.items():
+            if env and target_env != env:
+                continue
+            targets.append((name, target_env, deploy_version, components_with_names))
+    return targets
 
-        repo_path = os.path.join(deploy_path, repo_folder)
-        if not os.path.isdir(repo_path):
-            continue
 
-        image_dir = os.path.join(repo_path, "image")
-        if not os.path.isdir(image_dir):
-            continue
+def _compute_app_entries(targets: list[tuple], seq: int) -> list[dict]:
+    """Entries for targets, from inputs read after `seq` was taken. Newer entries already stored win."""
+    # One batched deployment list instead of a kubectl call per component
+    k8s_index = _load_k8s_index({f"{env}-{app_name}" for app_name, env, _, _ in targets})
 
-        discovered_apps.add(repo_folder)
+    # Recompute only the (app, env) entries whose deploy-repo or k8s inputs changed
+    apps = []
+    recomputed = 0
+    for app_name, env, deploy_version, components_with_names in targets:
+        k8s_infos = [_get_k8s_info(k8s_index, env, app_name, deploy_name) for _, deploy_name in components_with_names]
+        inputs = (deploy_version, tuple(components_with_names), tuple(tuple(sorted(i.items())) for i in k8s_infos))
+        with _app_entries_lock:
+            cached = _app_entries.get((app_name, env))
+            if cached and cached[0] > seq:
+                # A watch event or another refresh stored newer state while we were listing
+                apps.append(cached[2])
+                continue
+            if cached and cached[1] == inputs:
+                entry = cached[2]
+            else:
+                entry = _build_app_entry(app_name, env, deploy_version, components_with_names, k8s_infos)
+                recomputed += 1
+                _status_hub.publish({"type": "app", "app": entry})
+            _app_entries[(app_name, env)] = (seq, inputs, entry)
+        apps.append(entry)
+    logger.debug("Recomputed %d of %d app entries", recomputed, len(apps))
+    return apps
 
-        # Find all component folders ending with -ui
-        component_folders = []
-        for item in os.listdir(repo_path):
-            item_path = os.path.join(repo_path, item)
-            if os.path.isdir(item_path) and item.endswith("-ui"):
-                common_yaml = os.path.join(item_path, "common.yaml")
-                if os.path.isfile(common_yaml):
-                    component_folders.append(item)
 
-        if not component_folders:
-            continue
+def _in_scope(key: tuple[str, str], app_name: Optional[str], env: Optional[str]) -> bool:
+    return (not app_name or key[0] == app_name) and (not env or key[1] == env)
 
-        # Process each environment
-        for env_file in os.listdir(image_dir):
-            if not env_file.endswith(".yaml"):
-                continue
-            env = env_file.replace(".yaml", "")
-            deploy_version = _get_deploy_version(deploy_path, repo_folder, env)
-
-            # Gather component info
-            components = []
-            total_replica_current = 0
-            total_replica_desired = 0
-            all_synced = True
-
-            for comp_name in sorted(component_folders):
-                k8s_info = _get_k8s_info(comp_name, env, repo_folder, deploy_path)
-                comp_sync = "Synced" if deploy_version == k8s_info["k8sVersion"] else "OutOfSync"
-
-                if comp_sync == "OutOfSync":
-                    all_synced = False
-
-                components.append({
-                    "name": comp_name,
-                    "deployVersion": deploy_version,
-                    "k8sVersion": k8s_info["k8sVersion"],
-                    "syncStatus": comp_sync,
-                    "replicaCurrent": k8s_info["replicaCurrent"],
-                    "replicaDesired": k8s_info["replicaDesired"],
-                })
-
-                total_replica_current += k8s_info["replicaCurrent"]
-                total_replica_desired += k8s_info["replicaDesired"]
-
-            apps.append({
-                "appName": repo_folder,
-                "env": env,
-                "deployVersion": deploy_version,
-                "components": components,
-                "overallSyncStatus": "Synced" if all_synced else "OutOfSync",
-                "totalReplicaCurrent": total_replica_current,
-                "totalReplicaDesired": total_replica_desired,
-            })
-
-    # Auto-create app_deploy permissions
-    existing_targets = {
-        p.target for p in db.query(Permission).filter(Permission.type == "app_deploy").all()
-    }
-    for app_name in discovered_apps:
-        if app_name not in existing_targets:
-            db.add(Permission(type="app_deploy", target=app_name, action="write"))
-            logger.info("Auto-created permission: app_deploy %s write", app_name)
-    db.commit()
 
-    # Update cache
-    _app_cache["data"] = apps
-    _app_cache["timestamp"] = time.time()
+def _drop_app_entries(live: set[tuple[str, str]], app_name: Optional[str], env: Optional[str], seq: int):
+    """Drop in-scope entries missing from `live`, unless they were written after `seq`."""
+    with _app_entries_lock:
+        gone = [
+            key for key, (written, _, _) in _app_entries.items()
+            if key not in live and written <= seq and _in_scope(key, app_name, env)
+        ]
+        for key in gone:
+            del _app_entries[key]
+            _status_hub.publish({"type": "removed", "appName": key[0], "env": key[1]})
+
 
+def _sync_snapshot_rows(app_name: Optional[str], env: Optional[str]):
+    """
+    Snapshot transform that makes the in-scope rows match _app_entries. It reads the entries
+    when applied, so the refresher can replay it on a newer build without reviving stale rows.
+    """
+    def _sync(current: list[dict]) -> list[dict]:
+        with _app_entries_lock:
+            latest = {key: entry for key, (_, _, entry) in _app_entries.items() if _in_scope(key, app_name, env)}
+        rows = []
+        for a in current:
+            key = (a["appName"], a["env"])
+            if not _in_scope(key, app_name, env):
+                rows.append(a)
+            elif key in latest:
+                rows.append(latest.pop(key))
+            # else: in scope but gone from the deploy repo, drop it
+        rows.extend(latest.values())
+        return rows
+    return _sync
+
+
+def _build_app_status() -> list[dict]:
+    """Sync the deploy repo and rebuild the status of every app/env (runs in the refresher thread)."""
+    logger.info("Refreshing app data")
+
+    seq = next(_app_seq)
+    index = _load_deploy_index()
+    targets = _app_targets(index)
+    apps = _compute_app_entries(targets, seq)
+
+    # Drop cached entries for app/envs that no longer exist
+    _drop_app_entries({(app_name, env) for app_name, env, _, _ in targets}, None, None, seq)
+
+    _reconcile_app_permissions(set(index.apps))
+    # Keep tag listings warm so the rollback modal opens instantly
+    _warm_tag_cache(index)
     return apps
 
 
-def _get_app_repos_config(deploy_path: str) -> dict:
+def _filter_apps(apps: list[dict], app_name: Optional[str], env: Optional[str]) -> list[dict]:
+    return [
+        a for a in apps
+        if (not app_name or a["appName"] == app_name) and (not env or a["env"] == env)
+    ]
+
+
+def _refresh_app_scope(app_name: Optional[str], env: Optional[str], force_sync: bool = False,
+                       sync: bool = True) -> list[dict]:
     """
-    Read apps-git.yaml from deploy repo.
-    Format: app_name: git_url (simple string)
+    Rebuild only the app/env entries matching the scope and merge them into the shared
+    snapshot. Falls back to a full refresh before the first snapshot exists.
+    With sync=False (cluster-only changes such as scaling) the deploy repo is neither
+    synced nor locked, so the caller never waits behind a running rollback.
     """
-    apps_git_path = os.path.join(deploy_path, "apps-git.yaml")
-    if not os.path.isfile(apps_git_path):
-        logger.warning("apps-git.yaml not found at %s", apps_git_path)
-        return {}
-
+    if _refresher.get() is None:
+        if not sync:
+            _invalidate_app_cache()
+            return []
+        snapshot = _refresher.refresh()
+        return _filter_apps(snapshot.data, app_name, env) if snapshot else []
+
+    seq = next(_app_seq)
+    index = _load_deploy_index(force=force_sync) if sync else _lookup_deploy_index()
+    fresh = _compute_app_entries(_app_targets(index, app_name, env), seq)
+    _drop_app_entries({(a["appName"], a["env"]) for a in fresh}, app_name, env, seq)
+    _refresher.update(_sync_snapshot_rows(app_name, env))
+    return fresh
+
+
+def _refresh_app_after_change(app_name: str, env: Optional[str], force_sync: bool = False, sync: bool = True):
+    """Refresh one app/env after a rollback or scale; fall back to a full background rebuild on error."""
     try:
-        with open(apps_git_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        return data or {}
+        _refresh_app_scope(app_name, env, force_sync=force_sync, sync=sync)
     except Exception as e:
-        logger.error("Failed to read apps-git.yaml: %s", str(e))
-        return {}
+        logger.warning("Scoped refresh of %s %s failed, scheduling full refresh: %s", app_name, env, str(e))
+        _invalidate_app_cache()
+
+
+# App set whose app_deploy permissions were last reconciled (None until the first success)
+_permission_apps: Optional[frozenset[str]] = None
+
+
+def _reconcile_app_permissions(app_names: set[str]):
+    """Auto-create app_deploy permissions, only when the set of discovered apps changes."""
+    global _permission_apps
+    apps = frozenset(app_names)
+    if apps == _permission_apps:
+        return
+    if apps:
+        # One INSERT ... ON DUPLICATE KEY UPDATE against uq_permission (type, target, action)
+        stmt = mysql_insert(Permission).values(
+            [{"type": "app_deploy", "target": app_name, "action": "write"} for app_name in sorted(apps)]
+        )
+        stmt = stmt.on_duplicate_key_update(id=Permission.id)
+        db = SessionLocal()
+        try:
+            db.execute(stmt)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            # Leave _permission_apps unchanged so the next refresh retries
+            logger.warning("Failed to reconcile app_deploy permissions: %s", str(e))
+            return
+        finally:
+            db.close()
+    logger.info("Reconciled app_deploy permissions for %d apps", len(apps))
+    _permission_apps = apps
+
+
+_refresher = SnapshotRefresher("apps", _build_app_status, APPS_REFRESH_INTERVAL)
+# Snapshot versions restart at 1 with the process: salt ETags so they never collide across restarts
+_snapshot_epoch = uuid.uuid4().hex[:8]
+
+
+def _on_deployment_event(event_type: str, deployment):
+    """
+    Watch handler: recompute only the component backed by this deployment and push the
+    updated app entry. Deployments outside the {env}-{app} namespaces are ignored.
+    """
+    ns, name = deployment.metadata.namespace, deployment.metadata.name
+    info = dict(UNKNOWN_K8S_INFO) if event_type == "DELETED" else deployment_k8s_info(deployment)
+    updated = []
+    with _app_entries_lock:
+        seq = next(_app_seq)
+        for (app_name, env), (_, inputs, _) in list(_app_entries.items()):
+            if f"{env}-{app_name}" != ns:
+                continue
+            deploy_version, components_with_names, infos = inputs
+            k8s_infos = [dict(i) for i in infos]
+            hit = False
+            for i, (_, deploy_name) in enumerate(components_with_names):
+                if deploy_name == name and k8s_infos[i] != info:
+                    k8s_infos[i] = info
+                    hit = True
+            if not hit:
+                continue
+
+            entry = _build_app_entry(app_name, env, deploy_version, list(components_with_names), k8s_infos)
+            _app_entries[(app_name, env)] = (
+                seq,
+                (deploy_version, components_with_names, tuple(tuple(sorted(i.items())) for i in k8s_infos)),
+                entry,
+            )
+            _status_hub.publish({"type": "app", "app": entry})
+            updated.append((app_name, env))
+
+    # Outside the entries lock: the refresher applies the transform under its own lock
+    for app_name, env in updated:
+        _refresher.update(_sync_snapshot_rows(app_name, env))
+        logger.debug("%s %s/%s: pushed %s %s", event_type, ns, name, app_name, env)
+
+
+# Cluster-wide deployment cache for the apps context; every change is pushed through _on_deployment_event
+_deploy_informer = Informer(
+    "apps/deployments",
+    lambda: _k8s.apps_v1(APPS_K8S_CONTEXT).list_deployment_for_all_namespaces,
+    resync_period=K8S_INFORMER_RESYNC,
+)
+_deploy_informer.add_handler(_on_deployment_event)
+
+
+def start_background_refresh():
+    if APPS_WATCH_ENABLED:
+        _deploy_informer.start()
+    _refresher.start()
+
+
+def stop_background_refresh():
+    _deploy_informer.stop()
+    _refresher.stop()
 
 
-def _fetch_tags_from_repo(git_url: str, local_path: str) -> str:
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+@router.get("", response_model=list[AppStatusResponse])
+def get_apps(
+    request: Request,
+    response: Response,
+    appName: Optional[str] = Query(None, description="Only this app"),
+    env: Optional[str] = Query(None, description="Only this environment"),
+    force_refresh: bool = Query(False, description="Wait for fresh data (scoped to appName/env when given)"),
+    current_user: User = Depends(get_current_user),
+):
     """
-    Fetch tags from git repo without checking out any branch.
-    Just clone (if needed) and fetch tags.
+    Return the last good app status snapshot immediately. The snapshot is rebuilt in the
+    background; X-Snapshot-Age / X-Snapshot-Refreshing report how stale it is.
+    With appName/env, only the matching slice is returned, and force_refresh rebuilds
+    just that slice and merges it into the shared snapshot.
+    The ETag is the snapshot version, so If-None-Match is answered with a 304 for free.
     """
-    if os.path.isdir(os.path.join(local_path, ".git")):
-        # Repo exists, just fetch tags
-        result = _run(["git", "-C", local_path, "fetch", "--tags", "--force"])
-        if result.returncode != 0:
-            logger.warning("git fetch tags failed for %s: %s", local_path, result.stderr)
+    scoped = bool(appName or env)
+    if force_refresh and scoped:
+        try:
+            _refresh_app_scope(appName, env)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Scoped refresh of %s %s failed: %s", appName, env, str(e))
+            raise HTTPException(status_code=503, detail=f"Failed to refresh apps: {str(e)}")
+        snapshot = _refresher.get()
+        age = "0.0"
     else:
-        # Clone repo with minimal depth (we only need tags)
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        result = _run(["git", "clone", "--filter=blob:none", git_url, local_path])
-        if result.returncode != 0:
-            raise HTTPException(status_code=500, detail=f"git clone failed: {result.stderr}")
-        logger.info("Cloned repo to %s", local_path)
+        snapshot = _refresher.get()
+        if force_refresh or snapshot is None:
+            snapshot = _refresher.refresh()
+        age = f"{snapshot.age:.1f}" if snapshot else "0.0"
+    if snapshot is None:
+        return []
 
-    return local_path
+    response.headers["X-Snapshot-Age"] = age
+    response.headers["X-Snapshot-Refreshing"] = "true" if _refresher.refreshing else "false"
+    not_modified = conditional(request, response, make_etag("apps", _snapshot_epoch, snapshot.version, appName, env))
+    if not_modified:
+        return not_modified
+    return _filter_apps(snapshot.data, appName, env) if scoped else snapshot.data
 
 
 @router.get("/tags", response_model=list[AppTagResponse])
 def get_tags(
     appName: str = Query(..., description="App name"),
     env: str = Query(..., description="Environment (not used, for API compatibility)"),
+    prefix: Optional[str] = Query(None, description="Only tags starting with this prefix"),
+    limit: Optional[int] = Query(None, ge=1, description="Return at most this many (newest first)"),
     current_user: User = Depends(get_current_user),
 ):
     """
     Get all available versions from app's git repository.
-    Returns all tags regardless of environment.
+    Returns all tags regardless of environment, newest first.
     """
+    # apps-git.yaml comes from the index the refresher keeps current
     try:
-        deploy_path = _sync_banana_deploy()
+        index = _lookup_deploy_index()
     except Exception as e:
         logger.warning("Failed to sync deploy repo: %s", str(e))
         raise HTTPException(status_code=503, detail="Deploy repository not configured.")
 
-    # Read apps-git.yaml
-    apps_config = _get_app_repos_config(deploy_path)
+    apps_config = index.app_git_urls
     if appName not in apps_config:
         logger.warning("App %s not found in apps-git.yaml", appName)
         raise HTTPException(status_code=404, detail=f"App '{appName}' not configured in apps-git.yaml")
@@ -352,43 +493,172 @@ def get_tags(
     if not git_url or not isinstance(git_url, str):
         raise HTTPException(status_code=404, detail=f"Invalid git_url for app '{appName}'")
 
-    # Fetch tags from app repo
-    local_path = os.path.join(APP_REPOS_LOCAL_PATH, appName)
     try:
-        _fetch_tags_from_repo(inject_token(git_url), local_path)
+        tags = _tag_cache.get_tags(appName, inject_token(git_url))
     except Exception as e:
         logger.error("Failed to fetch tags for %s: %s", appName, str(e))
         raise HTTPException(status_code=503, detail=f"Failed to fetch tags: {str(e)}")
 
-    # Get all git tags from app repo
-    result = _run([
-        "git", "-C", local_path, "tag",
-        "--sort=-creatordate",
-        "--format=%(refname:short) %(creatordate:iso8601)"
-    ])
+    if prefix:
+        tags = [t for t in tags if t["tag"].startswith(prefix)]
+    if limit:
+        tags = tags[:limit]
+    return tags
 
-    if result.returncode != 0:
-        logger.warning("git tag failed for %s: %s", appName, result.stderr)
-        return []
 
-    # Parse tags
-    tags = []
-    for line in result.stdout.strip().split("\n"):
-        if not line.strip():
-            continue
-        parts = line.strip().split(" ", 1)
-        tag_name = parts[0]
-        created_at = parts[1] if len(parts) > 1 else ""
+def _warm_tag_cache(index: DeployIndex):
+    repos = {name: inject_token(url) for name, url in index.app_git_urls.items() if url and isinstance(url, str)}
+    _tag_cache.warm(repos)
 
-        tags.append({
-            "tag": tag_name,
-            "createdAt": created_at
-        })
 
-    return tags
+# ---------------------------------------------------------------------------
+# Rollback jobs
+# ---------------------------------------------------------------------------
+
+# Stored rollback logs keep only their tail: 1M chars fits MEDIUMTEXT (16 MB) even as 4-byte UTF-8,
+# and the fallback fits a legacy TEXT (64 KB) column
+ROLLBACK_LOG_MAX_CHARS = 1_000_000
+ROLLBACK_LOG_FALLBACK_CHARS = 16_000
+
+
+def _log_tail(log: str, max_chars: int) -> str:
+    if len(log) <= max_chars:
+        return log
+    return f"... ({len(log) - max_chars} earlier characters truncated)\n" + log[-max_chars:]
+
+
+def _persist_rollback_job(job_id: int, status: str, log: str):
+    # A log the column rejects must not lose the status: retry once with a short tail
+    for max_chars in (ROLLBACK_LOG_MAX_CHARS, ROLLBACK_LOG_FALLBACK_CHARS):
+        db = SessionLocal()
+        try:
+            job = db.query(RollbackJob).filter(RollbackJob.id == job_id).first()
+            if job:
+                job.status = status
+                job.log = _log_tail(log, max_chars)
+                if status in ("success", "failed"):
+                    job.finished_at = datetime.utcnow()
+                db.commit()
+            return
+        except (DataError, OperationalError) as e:
+            db.rollback()
+            if max_chars == ROLLBACK_LOG_FALLBACK_CHARS:
+                raise
+            logger.warning("Rollback job %s log rejected (%d chars), saving a shorter tail: %s", job_id, len(log), e)
+        finally:
+            db.close()
+
+
+# Jobs for the same (app, env) run one at a time; every job also holds the deploy repo lock
+_rollback_jobs = JobRunner(_persist_rollback_job)
+
+
+def _run_rollback(job_id: int, req: RollbackRequest, user_id: int, ip_address: str, output: JobOutput) -> bool:
+    """
+    Job body. Calls rollback_and_deploy.sh which:
+    1. Updates image/{env}.yaml
+    2. Git commit + tag {app}-{env}-{version}
+    3. Git push
+    4. Deploys to K8s
+    """
+    returncode = None
+    # The script edits, commits and pushes the deploy checkout: hold the repo lock throughout
+    with _deploy_repo_lock():
+        try:
+            deploy_path = _repo_sync.sync(
+                inject_token(BANANA_DEPLOY_GIT_URL), BANANA_DEPLOY_LOCAL_PATH, DEPLOY_GIT_BRANCH, force=True,
+            )
+        except Exception as e:
+            logger.error("Failed to sync deploy repo: %s", str(e))
+            output.write(f"Failed to sync deploy repository: {e}\n")
+            deploy_path = None
+
+        # Re-validate against the freshly synced checkout (image/{env}.yaml)
+        if deploy_path and not _deploy_index.get(deploy_path).has_env(req.appName, req.env):
+            output.write(f"App '{req.appName}' or environment '{req.env}' not found\n")
+            deploy_path = None
+
+        if deploy_path:
+            logger.info("Rolling back %s %s to %s (job %d)", req.appName, req.env, req.targetVersion, job_id)
+            output.write(f"$ rollback_and_deploy.sh {req.appName} {req.env} {req.targetVersion}\n")
+            returncode = run_streaming(
+                ["bash", "rollback_and_deploy.sh", req.appName, req.env, req.targetVersion],
+                cwd=deploy_path, output=output, timeout=ROLLBACK_TIMEOUT,
+            )
+            if returncode != 0:
+                # Don't leave a half-applied rollback in the checkout for the next reader
+                try:
+                    _repo_sync.sync(
+                        inject_token(BANANA_DEPLOY_GIT_URL), BANANA_DEPLOY_LOCAL_PATH, DEPLOY_GIT_BRANCH, force=True,
+                    )
+                except Exception as e:
+                    logger.warning("Failed to reset deploy repo after rollback failure: %s", str(e))
+
+    success = returncode == 0
+
+    # Log the rollback attempt
+    db = SessionLocal()
+    try:
+        db.add(AuditLog(
+            user_id=user_id,
+            action="rollback",
+            menu="apps",
+            target_type="app",
+            target_name=req.appName,
+            detail={
+                "env": req.env,
+                "targetVersion": req.targetVersion,
+                "jobId": job_id,
+                "output": output.text[-1000:],
+            },
+            result="success" if success else "failed",
+            ip_address=ip_address,
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+    if success:
+        # The job already holds a freshly synced checkout: refresh just this app/env
+        _refresh_app_after_change(req.appName, req.env)
+    return success
+
+
+def _rollback_job_response(job: RollbackJob, include_log: bool = True, message: str = "") -> RollbackJobResponse:
+    output = _rollback_jobs.output(job.id)
+    # The in-memory output is ahead of the row while the job runs
+    log = output.text if output else job.log
+    return RollbackJobResponse(
+        id=job.id, appName=job.app_name, env=job.env, targetVersion=job.target_version,
+        status=output.status if output else job.status,
+        startedBy=job.started_by,
+        startedByName=job.user.user_id if job.user else "",
+        log=log if include_log else None,
+        startedAt=job.started_at.isoformat() if job.started_at else "",
+        finishedAt=job.finished_at.isoformat() if job.finished_at else None,
+        message=message,
+    )
+
+
+def recover_rollback_jobs():
+    """Mark jobs left queued/running by a previous process as failed (their threads are gone)."""
+    db = SessionLocal()
+    try:
+        stale = db.query(RollbackJob).filter(RollbackJob.status.in_(["queued", "running"])).all()
+        for job in stale:
+            job.status = "failed"
+            job.log = (job.log or "") + "\nInterrupted by backend restart\n"
+            job.finished_at = datetime.utcnow()
+        db.commit()
+        if stale:
+            logger.warning("Marked %d interrupted rollback jobs as failed", len(stale))
+    except Exception as e:
+        logger.warning("Failed to recover rollback jobs: %s", str(e))
+    finally:
+        db.close()
 
 
-@router.post("/rollback", response_model=MessageResponse)
+@router.post("/rollback", response_model=RollbackJobResponse)
 def rollback(
     req: RollbackRequest,
     request: Request,
@@ -396,61 +666,165 @@ def rollback(
     db: Session = Depends(get_db),
 ):
     """
-    Rollback app to a specific version.
-    Calls rollback_and_deploy.sh which:
-    1. Updates image/{env}.yaml
-    2. Git commit + tag {app}-{env}-{version}
-    3. Git push
-    4. Deploys to K8s
+    Queue a rollback of app/env to a specific version and return the job immediately.
+    Output streams over /apps/ws/rollback?jobId=...; the job row holds the final status and log.
     """
     require_permission(current_user, "app_deploy", req.appName, "write")
+
+    # Fail fast on unknown targets; the job re-checks after its forced sync
     try:
-        deploy_path = _sync_banana_deploy()
+        index = _lookup_deploy_index()
     except Exception as e:
         logger.error("Failed to sync deploy repo: %s", str(e))
         raise HTTPException(status_code=503, detail="Deploy repository not configured.")
-
-    # Validate app directory exists
-    env_yaml_path = os.path.join(deploy_path, req.appName, "image", f"{req.env}.yaml")
-    if not os.path.isfile(env_yaml_path):
+    if not index.has_env(req.appName, req.env):
         raise HTTPException(status_code=404, detail=f"App '{req.appName}' or environment '{req.env}' not found")
 
-    logger.info("Rolling back %s %s to %s", req.appName, req.env, req.targetVersion)
+    key = (req.appName, req.env)
+    queued_behind = _rollback_jobs.busy(key)
 
-    # Call rollback_and_deploy.sh
-    result = _run(
-        ["bash", "rollback_and_deploy.sh", req.appName, req.env, req.targetVersion],
-        cwd=deploy_path,
+    job = RollbackJob(
+        app_name=req.appName, env=req.env, target_version=req.targetVersion,
+        status="queued", started_by=current_user.id, log="",
     )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
 
-    success = result.returncode == 0
-
-    # Log the rollback attempt
-    audit = AuditLog(
-        user_id=current_user.id,
-        action="rollback",
-        menu="apps",
-        target_type="app",
-        target_name=req.appName,
-        detail={
-            "env": req.env,
-            "targetVersion": req.targetVersion,
-            "stdout": result.stdout[-500:] if result.stdout else "",
-            "stderr": result.stderr[-500:] if result.stderr else "",
-        },
-        result="success" if success else "failed",
-        ip_address=request.client.host if request.client else "",
+    user_id = current_user.id
+    ip_address = request.client.host if request.client else ""
+    job_id = job.id
+    _rollback_jobs.submit(
+        job_id, key, lambda output: _run_rollback(job_id, req, user_id, ip_address, output),
     )
-    db.add(audit)
-    db.commit()
 
-    if not success:
-        raise HTTPException(status_code=500, detail=f"Rollback failed: {result.stderr}")
+    message = f"Rollback to {req.targetVersion} queued"
+    if queued_behind:
+        message += f" (waiting for the running rollback of {req.appName} {req.env})"
+    return _rollback_job_response(job, include_log=False, message=message)
+
 
-    # Invalidate cache so next request gets fresh data
-    _invalidate_app_cache()
+@router.get("/rollback/jobs", response_model=list[RollbackJobResponse])
+def list_rollback_jobs(
+    appName: Optional[str] = Query(None),
+    env: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    q = db.query(RollbackJob)
+    if appName:
+        q = q.filter(RollbackJob.app_name == appName)
+    if env:
+        q = q.filter(RollbackJob.env == env)
+    jobs = q.order_by(RollbackJob.id.desc()).limit(limit).all()
+    return [_rollback_job_response(job, include_log=False) for job in jobs]
+
+
+@router.get("/rollback/jobs/{job_id}", response_model=RollbackJobResponse)
+def get_rollback_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    job = db.query(RollbackJob).filter(RollbackJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Rollback job {job_id} not found")
+    return _rollback_job_response(job)
 
-    return {"message": f"Rollback to {req.targetVersion} completed and deployed"}
+
+def _load_rollback_job(job_id: int) -> Optional[tuple[str, str]]:
+    db = SessionLocal()
+    try:
+        job = db.query(RollbackJob).filter(RollbackJob.id == job_id).first()
+        return (job.log or "", job.status) if job else None
+    finally:
+        db.close()
+
+
+@router.websocket("/ws/rollback")
+async def ws_rollback(ws: WebSocket):
+    """
+    Stream a rollback job's output as text, ending with a "--- STATUS ---" line. An empty
+    message is sent after 30s without output to keep idle connections alive.
+    """
+    token = ws.query_params.get("token")
+    job_id = ws.query_params.get("jobId")
+
+    if not token or not job_id or not job_id.isdigit():
+        await ws.close(code=1008, reason="Missing parameters")
+        return
+
+    try:
+        from deps import decode_token
+        decode_token(token)
+    except Exception:
+        await ws.close(code=1008, reason="Invalid token")
+        return
+
+    await ws.accept()
+
+    try:
+        output = _rollback_jobs.output(int(job_id))
+        sent = 0
+        last_sent = time.monotonic()
+        if output is not None:
+            # Live job: push output as soon as it is written
+            while True:
+                text, finished = await asyncio.to_thread(output.wait, sent, 5)
+                if text:
+                    await ws.send_text(text)
+                    sent += len(text)
+                    last_sent = time.monotonic()
+                elif time.monotonic() - last_sent >= 30:
+                    await ws.send_text("")
+                    last_sent = time.monotonic()
+                if finished:
+                    await ws.send_text(f"\n--- {output.status.upper()} ---\n")
+                    break
+        else:
+            # Finished (or pruned) job: replay the persisted log, polling while it still runs
+            while True:
+                row = await asyncio.to_thread(_load_rollback_job, int(job_id))
+                if row is None:
+                    await ws.send_text("Rollback job not found")
+                    break
+                log, status = row
+                if len(log) > sent:
+                    await ws.send_text(log[sent:])
+                    sent = len(log)
+                    last_sent = time.monotonic()
+                elif time.monotonic() - last_sent >= 30:
+                    await ws.send_text("")
+                    last_sent = time.monotonic()
+                if status in ("success", "failed"):
+                    await ws.send_text(f"\n--- {status.upper()} ---\n")
+                    break
+                await asyncio.sleep(1)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        await ws.send_text(f"\nError: {e}\n")
+    finally:
+        await ws.close()
+
+
+# ---------------------------------------------------------------------------
+# Replicas
+# ---------------------------------------------------------------------------
+
+def _scale_component(item: ReplicaChangeRequest, deploy_name: str) -> tuple[bool, str]:
+    """Scale through the Kubernetes API on APPS_K8S_CONTEXT, the cluster /apps reads from."""
+    ns = f"{item.env}-{item.appName}"
+    try:
+        _k8s.apps_v1(APPS_K8S_CONTEXT).patch_namespaced_deployment_scale(
+            deploy_name, ns, {"spec": {"replicas": item.replicas}}, _request_timeout=30,
+        )
+        return True, f"Replica changed to {item.replicas}"
+    except Exception as e:
+        reason = getattr(e, "reason", None) or str(e)
+        logger.warning("Failed to scale %s in %s: %s", deploy_name, ns, reason)
+        return False, f"Scale failed: {reason}"
 
 
 @router.post("/replica", response_model=MessageResponse)
@@ -465,41 +839,18 @@ def change_replica(
     # Namespace: {env}-{appName} (e.g., prod-project1)
     ns = f"{req.env}-{req.appName}"
 
-    # Deployment name: read from component's common.yaml
+    # Deployment name: from component's common.yaml
     try:
-        deploy_path = _sync_banana_deploy()
+        index = _lookup_deploy_index()
     except Exception as e:
         logger.error("Failed to sync deploy repo: %s", str(e))
         raise HTTPException(status_code=503, detail="Deploy repository not configured.")
 
-    # Read deployment name from common.yaml
-    common_yaml_path = os.path.join(deploy_path, req.appName, req.componentName, "common.yaml")
-    deploy_name = req.componentName  # fallback
-
-    try:
-        with open(common_yaml_path, "r") as f:
-            common_data = yaml.safe_load(f)
-        if common_data:
-            app_name_from_yaml = common_data.get("app", {}).get("name")
-            if not app_name_from_yaml:
-                app_name_from_yaml = common_data.get("appname")
-            if app_name_from_yaml:
-                deploy_name = app_name_from_yaml
-                logger.debug("Using deployment name from yaml for scale: %s", deploy_name)
-            else:
-                logger.warning("No app.name or appname found in %s for scale, using component name: %s", common_yaml_path, req.componentName)
-    except Exception as e:
-        logger.warning("Failed to read deployment name from %s for scale: %s, using component name: %s", common_yaml_path, str(e), req.componentName)
+    deploy_name = index.deploy_name(req.appName, req.componentName)
 
     logger.info("Scaling deployment %s in namespace %s to %d replicas", deploy_name, ns, req.replicas)
 
-    result = _run([
-        "kubectl", "scale", "deploy", deploy_name,
-        "-n", ns,
-        f"--replicas={req.replicas}"
-    ])
-
-    success = result.returncode == 0
+    success, message = _scale_component(req, deploy_name)
 
     audit = AuditLog(
         user_id=current_user.id,
@@ -507,13 +858,7 @@ def change_replica(
         menu="apps",
         target_type="component",
         target_name=req.componentName,
-        detail={
-            "appName": req.appName,
-            "env": req.env,
-            "replicas": req.replicas,
-            "stdout": result.stdout[-500:] if result.stdout else "",
-            "stderr": result.stderr[-500:] if result.stderr else "",
-        },
+        detail={"appName": req.appName, "env": req.env, "replicas": req.replicas, "message": message},
         result="success" if success else "failed",
         ip_address=request.client.host if request.client else "",
     )
@@ -521,9 +866,134 @@ def change_replica(
     db.commit()
 
     if not success:
-        raise HTTPException(status_code=500, detail=f"Scale failed: {result.stderr}")
+        raise HTTPException(status_code=500, detail=message)
+
+    # Refresh just this app/env so the next read shows the new replica count. Scaling doesn't
+    # touch the deploy repo, so skip the sync and its lock (a rollback may hold it for minutes)
+    _refresh_app_after_change(req.appName, req.env, sync=False)
+
+    return {"message": message}
+
+
+def _permission_error(user: User, app_name: str) -> Optional[str]:
+    """require_permission's 403 message for app_deploy write on app_name, or None if allowed."""
+    try:
+        require_permission(user, "app_deploy", app_name, "write")
+    except HTTPException as e:
+        return e.detail
+    return None
+
+
+@router.post("/replica/batch", response_model=ReplicaBatchResponse)
+def change_replicas_batch(
+    req: ReplicaBatchRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Scale many components at once. Permissions are checked once per app and the deploy
+    index is looked up once; the scale patches run in parallel through the Kubernetes API.
+    Returns one result per item (in request order) and writes all audit rows in one commit.
+    """
+    if not req.items:
+        raise HTTPException(status_code=400, detail="No replica changes given")
+
+    denied = {app_name: _permission_error(current_user, app_name) for app_name in {item.appName for item in req.items}}
+
+    try:
+        index = _lookup_deploy_index()
+    except Exception as e:
+        logger.error("Failed to sync deploy repo: %s", str(e))
+        raise HTTPException(status_code=503, detail="Deploy repository not configured.")
+
+    outcomes: dict[int, tuple[bool, str]] = {}
+    pending = []
+    for i, item in enumerate(req.items):
+        if denied[item.appName]:
+            outcomes[i] = (False, denied[item.appName])
+        elif item.replicas < 0:
+            outcomes[i] = (False, "Replicas must be >= 0")
+        elif not index.has_env(item.appName, item.env):
+            outcomes[i] = (False, f"App '{item.appName}' or environment '{item.env}' not found")
+        else:
+            pending.append(i)
+
+    logger.info("Scaling %d components in batch (%d rejected)", len(pending), len(outcomes))
+    with ThreadPoolExecutor(max_workers=K8S_BULK_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                _scale_component, req.items[i], index.deploy_name(req.items[i].appName, req.items[i].componentName),
+            ): i
+            for i in pending
+        }
+        for future in as_completed(futures):
+            outcomes[futures[future]] = future.result()
+
+    ip_address = request.client.host if request.client else ""
+    results = []
+    for i, item in enumerate(req.items):
+        success, message = outcomes[i]
+        results.append(ReplicaBatchItemResult(
+            appName=item.appName, env=item.env, componentName=item.componentName,
+            replicas=item.replicas, success=success, message=message,
+        ))
+        db.add(AuditLog(
+            user_id=current_user.id,
+            action="scale",
+            menu="apps",
+            target_type="component",
+            target_name=item.componentName,
+            detail={"appName": item.appName, "env": item.env, "replicas": item.replicas, "batch": True, "message": message},
+            result="success" if success else "failed",
+            ip_address=ip_address,
+        ))
+    db.commit()
+
+    # One scoped refresh per app that actually changed (covers all of its envs)
+    for app_name in sorted({r.appName for r in results if r.success}):
+        _refresh_app_after_change(app_name, None, sync=False)
 
-    # Invalidate cache so next request gets fresh data
-    _invalidate_app_cache()
+    succeeded = sum(1 for r in results if r.success)
+    return ReplicaBatchResponse(results=results, succeeded=succeeded, failed=len(results) - succeeded)
 
-    return {"message": f"Replica changed to {req.replicas}"}
+
+# ---------------------------------------------------------------------------
+# Live status feed
+# ---------------------------------------------------------------------------
+
+@router.websocket("/ws/status")
+async def ws_status(ws: WebSocket):
+    """
+    Push app entries as they change: {"type": "app", "app": {...}} replaces one app/env
+    row, {"type": "removed", "appName", "env"} drops one, {"type": "resync"} means the
+    client fell behind and should re-fetch /apps. A {"type": "ping"} keeps idle
+    connections alive.
+    """
+    token = ws.query_params.get("token")
+    if not token:
+        await ws.close(code=1008, reason="Missing parameters")
+        return
+
+    try:
+        from deps import decode_token
+        decode_token(token)
+    except Exception:
+        await ws.close(code=1008, reason="Invalid token")
+        return
+
+    await ws.accept()
+    queue = _status_hub.subscribe()
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout=30)
+            except asyncio.TimeoutError:
+                message = {"type": "ping"}
+            await ws.send_json(message)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.debug("Status feed closed: %s", str(e))
+    finally:
+        _status_hub.unsubscribe(queue)
@@ -1,32 +1,86 @@
+import asyncio
+import heapq
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
+from typing import Callable, Optional
 
 import yaml as yaml_lib
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from kubernetes import client
 from kubernetes.client.exceptions import ApiException
-from kubernetes import stream as k8s_stream
 from sqlalchemy.orm import Session
 
-from config import KUBECONFIG_PATH
+from config import (
+    K8S_BULK_WORKERS, K8S_CLUSTER_DEADLINE, K8S_CLUSTER_WORKERS, K8S_HEALTH_FAILURE_THRESHOLD, K8S_HEALTH_MAX_BACKOFF,
+    K8S_HEALTH_PROBE_TIMEOUT, K8S_HEALTH_TTL, K8S_INFORMER_ENABLED, K8S_INFORMER_IDLE_TIMEOUT, K8S_INFORMER_RESYNC,
+    K8S_LOG_FOLLOW_BUFFER, K8S_LOG_WORKERS, K8S_RAW_LISTS, KUBECONFIG_PATH,
+)
 from database import get_db
 from models import User, AuditLog
 from schemas import (
     ClusterInfoResponse, ClusterListResponse, NodeInfoResponse, NodeTaint,
     ResourceUsage, NodeStatus, NamespaceInfoResponse,
-    DeploymentInfoResponse, DeploymentLogsResponse, PodLogEntry,
+    DeploymentInfoResponse, DeploymentLogsResponse, PodLogEntry, MergedLogLine,
     ScaleRequest, ScaleResponse, MessageResponse,
+    DeploymentBulkRequest, DeploymentBulkScaleRequest, DeploymentBulkItemResult, DeploymentBulkResponse,
     DeploymentYamlResponse, DeploymentYamlUpdateRequest,
+    DeploymentDescribeResponse, DescribeDeployment, DescribeContainer, DescribeCondition,
+    DescribeReplicaSet, DescribePod, DescribeEvent,
     PodInfoResponse, ContainerInfo,
 )
 from deps import get_current_user
-from services.k8s_client import K8sClientManager, parse_cpu, parse_memory
+from services.cluster_health import HEALTHY, ClusterHealth
+from services.etag import conditional, content_etag, make_etag
+from services.exec_bridge import bridge, open_exec
+from services.k8s_client import k8s_manager, parse_cpu, parse_memory
+from services.k8s_informer import InformerManager
+from services.list_query import paginate, parse_sort
+from services.log_follower import LogFollower
 from services.kubeconfig_parser import KubeconfigParser
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/k8s", tags=["k8s"])
 
 _parser = KubeconfigParser(KUBECONFIG_PATH)
-_k8s = K8sClientManager(KUBECONFIG_PATH)
+_k8s = k8s_manager
+_informers = InformerManager(_k8s, resync_period=K8S_INFORMER_RESYNC, idle_timeout=K8S_INFORMER_IDLE_TIMEOUT)
+_health = ClusterHealth(
+    _k8s.probe, ttl=K8S_HEALTH_TTL, max_backoff=K8S_HEALTH_MAX_BACKOFF, probe_timeout=K8S_HEALTH_PROBE_TIMEOUT,
+    failure_threshold=K8S_HEALTH_FAILURE_THRESHOLD,
+)
+
+
+def stop_informers():
+    _informers.stop_all()
+
+
+def _require_healthy(context: str):
+    """
+    Fail fast on reads from clusters the health probes couldn't reach, instead of waiting out
+    API timeouts. Writes don't use this: they go to the API server and fail on their own.
+    """
+    state = _health.state(context)
+    if state.healthy is False:
+        raise HTTPException(status_code=503, detail=f"Cluster {context} is unreachable: {state.error}")
+
+
+def _cached(context: str, kind: str) -> Optional[list]:
+    """Objects from the context's informer cache; None means list from the API server instead."""
+    return _informers.cached_list(context, kind) if K8S_INFORMER_ENABLED else None
+
+
+def _cached_deployment(context: str, namespace: str, name: str):
+    if K8S_INFORMER_ENABLED:
+        synced, d = _informers.cached_get(context, "deployments", namespace, name)
+        if synced:
+            if d is None:
+                raise HTTPException(status_code=404, detail="Not Found")
+            return d
+    try:
+        return _k8s.apps_v1(context).read_namespaced_deployment(name, namespace)
+    except ApiException as e:
+        raise HTTPException(status_code=e.status or 500, detail=e.reason)
 
 
 def _audit(db, user, action, target_type, target_name, detail, result, ip):
@@ -50,97 +104,229 @@ def _get_updated_at(deployment) -> str | None:
     return None
 
 
+def _iso(ts: Optional[str]) -> Optional[str]:
+    """A raw JSON timestamp ('...Z') in the form datetime.isoformat() gives for client models."""
+    if not ts:
+        return None
+    return ts[:-1] + "+00:00" if ts.endswith("Z") else ts
+
+
+def _items_etag(kind: str, context: str, items) -> str:
+    """ETag from the resourceVersion of every listed object: changes iff an item is added, removed or modified."""
+    return make_etag(kind, context, *sorted(
+        f"{i.metadata.namespace}/{i.metadata.name}:{i.metadata.resource_version}" for i in items
+    ))
+
+
+def _raw_items_etag(kind: str, context: str, items: list[dict]) -> str:
+    """_items_etag for objects from a raw JSON list."""
+    return make_etag(kind, context, *sorted(
+        f"{m.get('namespace')}/{m['name']}:{m['resourceVersion']}" for m in (i["metadata"] for i in items)
+    ))
+
+
 # ---------------------------------------------------------------------------
 # Clusters
 # ---------------------------------------------------------------------------
 
+def _cluster_info(ctx: dict, timeout: float) -> ClusterInfoResponse:
+    """Cached health plus node readiness and usage for one kubeconfig context (each API call bounded by timeout)."""
+    cluster_info = _parser.get_cluster_info(ctx["cluster"])
+    api_server = cluster_info["server"] if cluster_info else "unknown"
+    context_name = ctx["name"]
+
+    # Cached; only a context seen for the first time waits for its probe
+    status = _health.status(context_name, wait=timeout)
+    healthy = status == HEALTHY
+
+    node_status = None
+    cpu_usage = None
+    mem_usage = None
+
+    if healthy:
+        try:
+            # Reuse a node cache if the cluster's detail page already started one
+            nodes = _informers.peek(context_name, "nodes")
+            if nodes is None:
+                nodes = _k8s.core_v1(context_name).list_node(_request_timeout=timeout).items
+            ready_count = sum(
+                1 for n in nodes
+                if any(c.type == "Ready" and c.status == "True" for c in (n.status.conditions or []))
+            )
+            node_status = NodeStatus(total=len(nodes), ready=ready_count)
+
+            # Aggregate allocatable resources
+            total_cpu = 0
+            total_mem = 0
+            for n in nodes:
+                alloc = n.status.allocatable or {}
+                total_cpu += parse_cpu(alloc.get("cpu", "0"))
+                total_mem += parse_memory(alloc.get("memory", "0"))
+
+            # Get used from metrics API
+            used_cpu = 0
+            used_mem = 0
+            try:
+                metrics = _k8s.custom_objects(context_name).list_cluster_custom_object(
+                    "metrics.k8s.io", "v1beta1", "nodes", _request_timeout=timeout,
+                )
+                for item in metrics.get("items", []):
+                    usage = item.get("usage", {})
+                    used_cpu += parse_cpu(usage.get("cpu", "0"))
+                    used_mem += parse_memory(usage.get("memory", "0"))
+            except Exception:
+                pass
+
+            cpu_usage = ResourceUsage(
+                total=total_cpu, used=used_cpu,
+                percentage=round(used_cpu / total_cpu * 100, 1) if total_cpu else 0,
+            )
+            mem_usage = ResourceUsage(
+                total=total_mem, used=used_mem,
+                percentage=round(used_mem / total_mem * 100, 1) if total_mem else 0,
+            )
+        except Exception as e:
+            logger.warning("Failed to get cluster details for %s: %s", context_name, e)
+
+    return ClusterInfoResponse(
+        name=ctx["cluster"],
+        context=context_name,
+        apiServer=api_server,
+        status=status,
+        nodes=node_status,
+        cpu=cpu_usage,
+        memory=mem_usage,
+    )
+
+
 @router.get("/clusters", response_model=ClusterListResponse)
-def list_clusters(current_user: User = Depends(get_current_user)):
+def list_clusters(request: Request, response: Response, current_user: User = Depends(get_current_user)):
     try:
-        _parser.load_config()
         contexts = _parser.get_contexts()
     except Exception as e:
         logger.warning("Failed to load kubeconfig: %s", str(e))
         # Return empty list if kubeconfig is not accessible
         return ClusterListResponse(clusters=[], total=0)
 
-    clusters = []
+    # Probe every cluster concurrently; whatever misses the deadline is reported as unknown
+    clusters: list[Optional[ClusterInfoResponse]] = [None] * len(contexts)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(K8S_CLUSTER_WORKERS, len(contexts))))
+    try:
+        futures = {
+            executor.submit(_cluster_info, ctx, K8S_CLUSTER_DEADLINE): i for i, ctx in enumerate(contexts)
+        }
+        done, _ = wait(futures, timeout=K8S_CLUSTER_DEADLINE)
+        for future in done:
+            try:
+                clusters[futures[future]] = future.result()
+            except Exception as e:
+                logger.warning("Failed to probe cluster %s: %s", contexts[futures[future]]["name"], e)
+    finally:
+        # Don't hold the response for stragglers; they finish (bounded by their own timeouts) in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for i, ctx in enumerate(contexts):
+        if clusters[i] is None:
+            logger.warning("Cluster %s did not respond within %.0fs", ctx["name"], K8S_CLUSTER_DEADLINE)
+            cluster_info = _parser.get_cluster_info(ctx["cluster"])
+            clusters[i] = ClusterInfoResponse(
+                name=ctx["cluster"],
+                context=ctx["name"],
+                apiServer=cluster_info["server"] if cluster_info else "unknown",
+                status="unknown",
+            )
+
+    # Health and usage have no resourceVersion: key on the content
+    payload = ClusterListResponse(clusters=clusters, total=len(clusters))
+    return conditional(request, response, content_etag(payload)) or payload
 
-    for ctx in contexts:
-        cluster_info = _parser.get_cluster_info(ctx["cluster"])
-        api_server = cluster_info["server"] if cluster_info else "unknown"
-        context_name = ctx["name"]
 
-        healthy = _k8s.test_connection(context_name)
-        status = "healthy" if healthy else "unhealthy"
+@router.get("/client-stats")
+def client_stats(current_user: User = Depends(get_current_user)):
+    """Connection pool utilization of the cached per-cluster API clients."""
+    return _k8s.stats()
 
-        node_status = None
-        cpu_usage = None
-        mem_usage = None
 
-        if healthy:
-            try:
-                core = _k8s.core_v1(context_name)
-                nodes = core.list_node().items
-                ready_count = sum(
-                    1 for n in nodes
-                    if any(c.type == "Ready" and c.status == "True" for c in (n.status.conditions or []))
-                )
-                node_status = NodeStatus(total=len(nodes), ready=ready_count)
-
-                # Aggregate allocatable resources
-                total_cpu = 0
-                total_mem = 0
-                for n in nodes:
-                    alloc = n.status.allocatable or {}
-                    total_cpu += parse_cpu(alloc.get("cpu", "0"))
-                    total_mem += parse_memory(alloc.get("memory", "0"))
-
-                # Get used from metrics API
-                used_cpu = 0
-                used_mem = 0
-                try:
-                    metrics = _k8s.custom_objects(context_name).list_cluster_custom_object(
-                        "metrics.k8s.io", "v1beta1", "nodes"
-                    )
-                    for item in metrics.get("items", []):
-                        usage = item.get("usage", {})
-                        used_cpu += parse_cpu(usage.get("cpu", "0"))
-                        used_mem += parse_memory(usage.get("memory", "0"))
-                except Exception:
-                    pass
-
-                cpu_usage = ResourceUsage(
-                    total=total_cpu, used=used_cpu,
-                    percentage=round(used_cpu / total_cpu * 100, 1) if total_cpu else 0,
-                )
-                mem_usage = ResourceUsage(
-                    total=total_mem, used=used_mem,
-                    percentage=round(used_mem / total_mem * 100, 1) if total_mem else 0,
-                )
-            except Exception as e:
-                logger.warning("Failed to get cluster details for %s: %s", context_name, e)
-
-        clusters.append(ClusterInfoResponse(
-            name=ctx["cluster"],
-            context=context_name,
-            apiServer=api_server,
-            status=status,
-            nodes=node_status,
-            cpu=cpu_usage,
-            memory=mem_usage,
-        ))
+def _node_response(name: str, status: str, labels: dict, taints: list[NodeTaint], ip: Optional[str],
+                   allocatable: dict, used: dict, created_at: Optional[str]) -> NodeInfoResponse:
+    total_cpu = parse_cpu(allocatable.get("cpu", "0"))
+    total_mem = parse_memory(allocatable.get("memory", "0"))
+
+    # Roles from labels
+    roles = [k.split("/")[1] for k in labels if k.startswith("node-role.kubernetes.io/")] or ["worker"]
 
-    return ClusterListResponse(clusters=clusters, total=len(clusters))
+    return NodeInfoResponse(
+        name=name,
+        status=status,
+        roles=roles,
+        ip=ip,
+        cpu=ResourceUsage(
+            total=total_cpu, used=used["cpu"],
+            percentage=round(used["cpu"] / total_cpu * 100, 1) if total_cpu else 0,
+        ),
+        memory=ResourceUsage(
+            total=total_mem, used=used["memory"],
+            percentage=round(used["memory"] / total_mem * 100, 1) if total_mem else 0,
+        ),
+        taints=taints,
+        labels=labels,
+        createdAt=created_at,
+    )
 
 
-@router.get("/clusters/{context}/nodes", response_model=list[NodeInfoResponse])
-def list_nodes(context: str, current_user: User = Depends(get_current_user)):
-    try:
-        core = _k8s.core_v1(context)
-        nodes = core.list_node().items
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def _node_info(n, node_metrics: dict) -> NodeInfoResponse:
+    # Determine status
+    status = "Unknown"
+    for cond in (n.status.conditions or []):
+        if cond.type == "Ready":
+            status = "Ready" if cond.status == "True" else "NotReady"
+
+    # IP address
+    ip = None
+    for addr in (n.status.addresses or []):
+        if addr.type == "InternalIP":
+            ip = addr.address
+            break
+
+    return _node_response(
+        n.metadata.name, status, dict(n.metadata.labels or {}),
+        [NodeTaint(key=t.key, value=t.value, effect=t.effect) for t in (n.spec.taints or [])],
+        ip, n.status.allocatable or {}, node_metrics.get(n.metadata.name, {"cpu": 0, "memory": 0}),
+        n.metadata.creation_timestamp.isoformat() if n.metadata.creation_timestamp else None,
+    )
+
+
+def _node_info_raw(n: dict, node_metrics: dict) -> NodeInfoResponse:
+    """_node_info for a node from a raw JSON list."""
+    meta, spec, st = n.get("metadata") or {}, n.get("spec") or {}, n.get("status") or {}
+    status = "Unknown"
+    for cond in st.get("conditions") or []:
+        if cond.get("type") == "Ready":
+            status = "Ready" if cond.get("status") == "True" else "NotReady"
+    ip = next((a.get("address") for a in st.get("addresses") or [] if a.get("type") == "InternalIP"), None)
+    return _node_response(
+        meta["name"], status, meta.get("labels") or {},
+        [NodeTaint(key=t["key"], value=t.get("value"), effect=t["effect"]) for t in spec.get("taints") or []],
+        ip, st.get("allocatable") or {}, node_metrics.get(meta["name"], {"cpu": 0, "memory": 0}),
+        _iso(meta.get("creationTimestamp")),
+    )
+
+
+@router.get(
+    "/clusters/{context}/nodes",
+    response_model=list[NodeInfoResponse], dependencies=[Depends(_require_healthy)],
+)
+def list_nodes(context: str, request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    nodes = _cached(context, "nodes")
+    raw_nodes = None
+    if nodes is None:
+        try:
+            if K8S_RAW_LISTS:
+                raw_nodes = _k8s.list_raw(context, client.CoreV1Api, "list_node").get("items") or []
+            else:
+                nodes = _k8s.core_v1(context).list_node().items
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
 
     # Get node metrics
     node_metrics = {}
@@ -158,75 +344,41 @@ def list_nodes(context: str, current_user: User = Depends(get_current_user)):
     except Exception:
         pass
 
-    result = []
-    for n in nodes:
-        alloc = n.status.allocatable or {}
-        total_cpu = parse_cpu(alloc.get("cpu", "0"))
-        total_mem = parse_memory(alloc.get("memory", "0"))
-        used = node_metrics.get(n.metadata.name, {"cpu": 0, "memory": 0})
-
-        # Determine status
-        status = "Unknown"
-        for cond in (n.status.conditions or []):
-            if cond.type == "Ready":
-                status = "Ready" if cond.status == "True" else "NotReady"
-
-        # Roles from labels
-        roles = []
-        for label_key in (n.metadata.labels or {}):
-            if label_key.startswith("node-role.kubernetes.io/"):
-                roles.append(label_key.split("/")[1])
-        if not roles:
-            roles = ["worker"]
-
-        # Taints
-        taints = []
-        for t in (n.spec.taints or []):
-            taints.append(NodeTaint(key=t.key, value=t.value, effect=t.effect))
-
-        # IP address
-        ip = None
-        for addr in (n.status.addresses or []):
-            if addr.type == "InternalIP":
-                ip = addr.address
-                break
-
-        result.append(NodeInfoResponse(
-            name=n.metadata.name,
-            status=status,
-            roles=roles,
-            ip=ip,
-            cpu=ResourceUsage(
-                total=total_cpu, used=used["cpu"],
-                percentage=round(used["cpu"] / total_cpu * 100, 1) if total_cpu else 0,
-            ),
-            memory=ResourceUsage(
-                total=total_mem, used=used["memory"],
-                percentage=round(used["memory"] / total_mem * 100, 1) if total_mem else 0,
-            ),
-            taints=taints,
-            labels=dict(n.metadata.labels or {}),
-            createdAt=n.metadata.creation_timestamp.isoformat() if n.metadata.creation_timestamp else None,
-        ))
+    if raw_nodes is not None:
+        result = [_node_info_raw(n, node_metrics) for n in raw_nodes]
+    else:
+        result = [_node_info(n, node_metrics) for n in nodes]
 
-    return result
+    # Usage comes from metrics-server, not the node objects: key on the content
+    return conditional(request, response, content_etag(result)) or result
 
 
 # ---------------------------------------------------------------------------
 # Namespaces
 # ---------------------------------------------------------------------------
 
-@router.get("/clusters/{context}/namespaces", response_model=list[NamespaceInfoResponse])
+@router.get(
+    "/clusters/{context}/namespaces",
+    response_model=list[NamespaceInfoResponse], dependencies=[Depends(_require_healthy)],
+)
 def list_namespaces(
     context: str,
+    request: Request,
+    response: Response,
     skip_resources: bool = Query(False, description="Skip CPU/Memory metrics for faster response"),
     current_user: User = Depends(get_current_user)
 ):
-    try:
-        core = _k8s.core_v1(context)
-        namespaces = core.list_namespace().items
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    namespaces = _cached(context, "namespaces")
+    if namespaces is None:
+        try:
+            namespaces = _k8s.core_v1(context).list_namespace().items
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    if skip_resources:
+        not_modified = conditional(request, response, _items_etag("namespaces", context, namespaces))
+        if not_modified:
+            return not_modified
 
     ns_metrics: dict[str, dict] = {}
     ns_pod_counts: dict[str, int] = {}
@@ -248,14 +400,15 @@ def list_namespaces(
         except Exception:
             pass
 
-        # Pod counts per namespace
+        # Pod counts per namespace by paging through pod metadata, so memory doesn't grow
+        # with the number of pods
         try:
-            pods = core.list_pod_for_all_namespaces().items
-            for pod in pods:
-                ns = pod.metadata.namespace
+            for meta in _k8s.iter_pod_metadata(context):
+                ns = meta.get("namespace")
                 ns_pod_counts[ns] = ns_pod_counts.get(ns, 0) + 1
-        except Exception:
-            pass
+        except Exception as e:
+            logger.warning("Failed to count pods for %s: %s", context, e)
+            ns_pod_counts.clear()
 
     result = []
     for ns in namespaces:
@@ -270,111 +423,237 @@ def list_namespaces(
             createdAt=ns.metadata.creation_timestamp.isoformat() if ns.metadata.creation_timestamp else None,
         ))
 
-    return result
+    if skip_resources:
+        return result
+    # Metrics and pod counts change without touching the namespaces: key on the content
+    return conditional(request, response, content_etag(result)) or result
 
 
 # ---------------------------------------------------------------------------
 # Deployments
 # ---------------------------------------------------------------------------
 
-@router.get("/clusters/{context}/deployments", response_model=list[DeploymentInfoResponse])
-def list_all_deployments(
-    context: str,
-    current_user: User = Depends(get_current_user),
+def _deployment_status(replicas: int, ready: int) -> str:
+    if ready == replicas and replicas > 0:
+        return "Running"
+    elif ready == 0 and replicas > 0:
+        return "Pending"
+    return "Running"
+
+
+def _deployment_info(d) -> DeploymentInfoResponse:
+    replicas = d.spec.replicas or 0
+    ready = d.status.ready_replicas or 0
+    available = d.status.available_replicas or 0
+
+    image = ""
+    if d.spec.template.spec.containers:
+        image = d.spec.template.spec.containers[0].image or ""
+
+    return DeploymentInfoResponse(
+        name=d.metadata.name,
+        namespace=d.metadata.namespace,
+        replicas=replicas,
+        readyReplicas=ready,
+        availableReplicas=available,
+        status=_deployment_status(replicas, ready),
+        image=image,
+        createdAt=d.metadata.creation_timestamp.isoformat() if d.metadata.creation_timestamp else None,
+        updatedAt=_get_updated_at(d),
+    )
+
+
+def _deployment_info_raw(d: dict) -> DeploymentInfoResponse:
+    """_deployment_info for a deployment from a raw JSON list."""
+    meta, spec, st = d["metadata"], d.get("spec") or {}, d.get("status") or {}
+    replicas = spec.get("replicas") or 0
+    ready = st.get("readyReplicas") or 0
+    containers = ((spec.get("template") or {}).get("spec") or {}).get("containers")
+    # RFC 3339 UTC strings order like the datetimes they encode
+    updated = max((c["lastUpdateTime"] for c in st.get("conditions") or [] if c.get("lastUpdateTime")), default=None)
+    return DeploymentInfoResponse(
+        name=meta["name"],
+        namespace=meta["namespace"],
+        replicas=replicas,
+        readyReplicas=ready,
+        availableReplicas=st.get("availableReplicas") or 0,
+        status=_deployment_status(replicas, ready),
+        image=(containers[0].get("image") or "") if containers else "",
+        createdAt=_iso(meta.get("creationTimestamp")),
+        updatedAt=_iso(updated),
+    )
+
+
+DEPLOYMENT_SORT_FIELDS = ("namespace", "name", "status", "replicas", "readyReplicas", "createdAt", "updatedAt")
+
+
+def _deployment_sort_key(field: str):
+    """Sort key ending in (namespace, name), so keys are unique for cursors; None sorts first."""
+    if field == "namespace":
+        return lambda r: (r.namespace, r.name)
+    if field == "name":
+        return lambda r: (r.name, r.namespace)
+    default = 0 if field in ("replicas", "readyReplicas") else ""
+    return lambda r: (getattr(r, field) or default, r.namespace, r.name)
+
+
+class _DeploymentSet:
+    """Response rows for one informer revision: indexed by namespace, with sort orders built on first use."""
+
+    def __init__(self, revision: int, rows: list[DeploymentInfoResponse]):
+        self.revision = revision
+        self.rows = sorted(rows, key=_deployment_sort_key("namespace"))
+        self.by_namespace: dict[str, list[DeploymentInfoResponse]] = {}
+        for r in self.rows:
+            self.by_namespace.setdefault(r.namespace, []).append(r)
+        self._orders = {"namespace": self.rows}
+
+    def sorted_by(self, field: str, namespace: Optional[str]) -> list[DeploymentInfoResponse]:
+        if field in ("namespace", "name") and namespace is not None:
+            # Within one namespace both orders are the namespace index's (namespace, name) order
+            return self.by_namespace.get(namespace, [])
+        if field not in self._orders:
+            self._orders[field] = sorted(self.rows, key=_deployment_sort_key(field))
+        rows = self._orders[field]
+        return rows if namespace is None else [r for r in rows if r.namespace == namespace]
+
+
+_deployment_sets: dict[str, _DeploymentSet] = {}
+
+
+def _cached_deployment_set(context: str) -> Optional[_DeploymentSet]:
+    """Rows built from the deployment informer, rebuilt only when its revision moves."""
+    if not K8S_INFORMER_ENABLED:
+        return None
+    inf = _informers.synced_informer(context, "deployments")
+    if inf is None:
+        return None
+    ds = _deployment_sets.get(context)
+    if ds is None or ds.revision != inf.revision:
+        revision, deploys = inf.snapshot()
+        ds = _deployment_sets[context] = _DeploymentSet(revision, [_deployment_info(d) for d in deploys])
+    return ds
+
+
+def _query_deployments(
+    context: str, namespace: Optional[str], request: Request, response: Response,
+    label_selector: Optional[str], search: Optional[str], prefix: Optional[str], status: Optional[str],
+    sort: str, limit: Optional[int], cursor: Optional[str],
 ):
+    """
+    Filter, sort and page deployments. Label selectors are evaluated by the API server (live
+    list); everything else runs on the cached rows. The body stays a plain array: the match
+    count goes in X-Total-Count and the next page's cursor, if any, in X-Next-Cursor.
+    """
     try:
-        apps = _k8s.apps_v1(context)
-        deploys = apps.list_deployment_for_all_namespaces().items
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-    result = []
-    for d in deploys:
-        replicas = d.spec.replicas or 0
-        ready = d.status.ready_replicas or 0
-        available = d.status.available_replicas or 0
-
-        if ready == replicas and replicas > 0:
-            status = "Running"
-        elif ready == 0 and replicas > 0:
-            status = "Pending"
+        field, descending = parse_sort(sort, DEPLOYMENT_SORT_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    ds = None if label_selector else _cached_deployment_set(context)
+    if ds is not None:
+        not_modified = conditional(
+            request, response, make_etag("deployments", context, namespace, ds.revision, request.url.query),
+        )
+        if not_modified:
+            return not_modified
+        rows = ds.sorted_by(field, namespace)
+    else:
+        if namespace is None:
+            method, args = "list_deployment_for_all_namespaces", ()
         else:
-            status = "Running"
-
-        image = ""
-        if d.spec.template.spec.containers:
-            image = d.spec.template.spec.containers[0].image or ""
-
-        result.append(DeploymentInfoResponse(
-            name=d.metadata.name,
-            namespace=d.metadata.namespace,
-            replicas=replicas,
-            readyReplicas=ready,
-            availableReplicas=available,
-            status=status,
-            image=image,
-            createdAt=d.metadata.creation_timestamp.isoformat() if d.metadata.creation_timestamp else None,
-            updatedAt=_get_updated_at(d),
-        ))
+            method, args = "list_namespaced_deployment", (namespace,)
+        try:
+            if K8S_RAW_LISTS:
+                deploys = _k8s.list_raw(
+                    context, client.AppsV1Api, method, *args, label_selector=label_selector,
+                ).get("items") or []
+                etag = _raw_items_etag("deployments", context, deploys)
+            else:
+                deploys = getattr(_k8s.apps_v1(context), method)(*args, label_selector=label_selector).items
+                etag = _items_etag("deployments", context, deploys)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        not_modified = conditional(request, response, make_etag(etag, namespace, request.url.query))
+        if not_modified:
+            return not_modified
+        info = _deployment_info_raw if K8S_RAW_LISTS else _deployment_info
+        rows = sorted((info(d) for d in deploys), key=_deployment_sort_key(field))
+
+    if search:
+        q = search.lower()
+        rows = [r for r in rows if q in r.name.lower() or q in r.namespace.lower()]
+    if prefix:
+        rows = [r for r in rows if r.name.startswith(prefix)]
+    if status:
+        rows = [r for r in rows if r.status.lower() == status.lower()]
 
-    return result
+    try:
+        page, next_cursor = paginate(rows, _deployment_sort_key(field), descending, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["X-Total-Count"] = str(len(rows))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return page
+
+
+@router.get(
+    "/clusters/{context}/deployments",
+    response_model=list[DeploymentInfoResponse], dependencies=[Depends(_require_healthy)],
+)
+def list_all_deployments(
+    context: str,
+    request: Request,
+    response: Response,
+    label_selector: Optional[str] = Query(None, alias="labelSelector", description="Passed to the API server"),
+    search: Optional[str] = Query(None, description="Substring of the name or namespace (case-insensitive)"),
+    prefix: Optional[str] = Query(None, description="Name prefix"),
+    status: Optional[str] = Query(None, description="Running / Pending"),
+    sort: str = Query("namespace", description="Field to sort by; prefix - for descending"),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    current_user: User = Depends(get_current_user),
+):
+    return _query_deployments(
+        context, None, request, response, label_selector, search, prefix, status, sort, limit, cursor,
+    )
 
 
-@router.get("/clusters/{context}/namespaces/{namespace}/deployments", response_model=list[DeploymentInfoResponse])
+@router.get(
+    "/clusters/{context}/namespaces/{namespace}/deployments",
+    response_model=list[DeploymentInfoResponse], dependencies=[Depends(_require_healthy)],
+)
 def list_deployments(
     context: str,
     namespace: str,
+    request: Request,
+    response: Response,
+    label_selector: Optional[str] = Query(None, alias="labelSelector", description="Passed to the API server"),
+    search: Optional[str] = Query(None, description="Substring of the name (case-insensitive)"),
+    prefix: Optional[str] = Query(None, description="Name prefix"),
+    status: Optional[str] = Query(None, description="Running / Pending"),
+    sort: str = Query("name", description="Field to sort by; prefix - for descending"),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
     current_user: User = Depends(get_current_user),
 ):
-    try:
-        apps = _k8s.apps_v1(context)
-        deploys = apps.list_namespaced_deployment(namespace).items
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-    result = []
-    for d in deploys:
-        replicas = d.spec.replicas or 0
-        ready = d.status.ready_replicas or 0
-        available = d.status.available_replicas or 0
-
-        if ready == replicas and replicas > 0:
-            status = "Running"
-        elif ready == 0 and replicas > 0:
-            status = "Pending"
-        else:
-            status = "Running"
-
-        image = ""
-        if d.spec.template.spec.containers:
-            image = d.spec.template.spec.containers[0].image or ""
-
-        result.append(DeploymentInfoResponse(
-            name=d.metadata.name,
-            namespace=namespace,
-            replicas=replicas,
-            readyReplicas=ready,
-            availableReplicas=available,
-            status=status,
-            image=image,
-            createdAt=d.metadata.creation_timestamp.isoformat() if d.metadata.creation_timestamp else None,
-            updatedAt=_get_updated_at(d),
-        ))
-
-    return result
+    return _query_deployments(
+        context, namespace, request, response, label_selector, search, prefix, status, sort, limit, cursor,
+    )
 
 
-@router.get("/clusters/{context}/namespaces/{namespace}/deployments/{name}", response_model=DeploymentInfoResponse)
+@router.get(
+    "/clusters/{context}/namespaces/{namespace}/deployments/{name}",
+    response_model=DeploymentInfoResponse, dependencies=[Depends(_require_healthy)],
+)
 def get_deployment(
     context: str,
     namespace: str,
     name: str,
     current_user: User = Depends(get_current_user),
 ):
-    try:
-        d = _k8s.apps_v1(context).read_namespaced_deployment(name, namespace)
-    except ApiException as e:
-        raise HTTPException(status_code=e.status or 500, detail=e.reason)
+    d = _cached_deployment(context, namespace, name)
 
     replicas = d.spec.replicas or 0
     ready = d.status.ready_replicas or 0
@@ -398,83 +677,275 @@ def get_deployment(
     )
 
 
-@router.get("/clusters/{context}/namespaces/{namespace}/deployments/{name}/describe")
-def describe_deployment(
-    context: str,
-    namespace: str,
-    name: str,
-    current_user: User = Depends(get_current_user),
-):
-    try:
-        apps = _k8s.apps_v1(context)
-        core = _k8s.core_v1(context)
-        d = apps.read_namespaced_deployment(name, namespace)
-    except ApiException as e:
-        raise HTTPException(status_code=e.status or 500, detail=e.reason)
+_EVENT_PAGE_SIZE = 100
+
+
+def _label_selector(selector) -> str:
+    """A V1LabelSelector as a label selector query string."""
+    parts = [f"{k}={v}" for k, v in sorted((selector.match_labels or {}).items())]
+    for e in selector.match_expressions or []:
+        if e.operator == "In":
+            parts.append(f"{e.key} in ({','.join(e.values or [])})")
+        elif e.operator == "NotIn":
+            parts.append(f"{e.key} notin ({','.join(e.values or [])})")
+        elif e.operator == "Exists":
+            parts.append(e.key)
+        elif e.operator == "DoesNotExist":
+            parts.append(f"!{e.key}")
+    return ",".join(parts)
+
+
+def _event_time(ev) -> Optional[datetime]:
+    ts = ev.last_timestamp or ev.event_time or ev.first_timestamp or ev.metadata.creation_timestamp
+    if ts is None:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def _event_sort_key(ev) -> datetime:
+    return _event_time(ev) or datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _age(ts: Optional[str]) -> str:
+    if not ts:
+        return ""
+    mins = max(0, int((datetime.now(timezone.utc) - datetime.fromisoformat(ts)).total_seconds() / 60))
+    return f"{mins}m" if mins < 60 else f"{mins // 60}h{mins % 60}m"
+
+
+def _recent_events(core, namespace: str, kind: str, name: str, count: int) -> list:
+    """
+    The `count` most recent events about one object, oldest first. Events are listed in
+    `limit`-sized pages and only the newest `count` are kept between pages, so a noisy
+    object costs bounded memory however many events it has.
+    """
+    newest = []
+    _continue = None
+    while True:
+        kwargs = {"limit": _EVENT_PAGE_SIZE, "_request_timeout": 10}
+        if _continue:
+            kwargs["_continue"] = _continue
+        page = core.list_namespaced_event(
+            namespace, field_selector=f"involvedObject.name={name},involvedObject.kind={kind}", **kwargs,
+        )
+        newest = heapq.nlargest(count, newest + page.items, key=_event_sort_key)
+        _continue = page.metadata._continue
+        if not _continue:
+            return sorted(newest, key=_event_sort_key)
+
+
+def _describe_deployment_info(d) -> DescribeDeployment:
+    containers = []
+    for c in d.spec.template.spec.containers:
+        resources = c.resources
+        containers.append(DescribeContainer(
+            name=c.name,
+            image=c.image,
+            ports=[p.container_port for p in (c.ports or [])],
+            requests=dict(resources.requests or {}) if resources else {},
+            limits=dict(resources.limits or {}) if resources else {},
+        ))
+    return DescribeDeployment(
+        name=d.metadata.name,
+        namespace=d.metadata.namespace,
+        createdAt=d.metadata.creation_timestamp.isoformat() if d.metadata.creation_timestamp else None,
+        labels=dict(d.metadata.labels or {}),
+        selector=_label_selector(d.spec.selector),
+        strategy=d.spec.strategy.type if d.spec.strategy else None,
+        revision=(d.metadata.annotations or {}).get("deployment.kubernetes.io/revision"),
+        replicas=d.spec.replicas or 0,
+        updatedReplicas=d.status.updated_replicas or 0,
+        totalReplicas=d.status.replicas or 0,
+        availableReplicas=d.status.available_replicas or 0,
+        unavailableReplicas=d.status.unavailable_replicas or 0,
+        containers=containers,
+        conditions=[
+            DescribeCondition(type=c.type, status=c.status, reason=c.reason, message=c.message)
+            for c in (d.status.conditions or [])
+        ],
+    )
+
+
+def _describe_replica_set(rs, current_revision: Optional[str]) -> DescribeReplicaSet:
+    revision = (rs.metadata.annotations or {}).get("deployment.kubernetes.io/revision")
+    return DescribeReplicaSet(
+        name=rs.metadata.name,
+        revision=revision,
+        current=revision is not None and revision == current_revision,
+        replicas=rs.spec.replicas or 0,
+        readyReplicas=rs.status.ready_replicas or 0,
+        images=[c.image for c in rs.spec.template.spec.containers],
+        createdAt=rs.metadata.creation_timestamp.isoformat() if rs.metadata.creation_timestamp else None,
+    )
+
 
+def _describe_pod(p) -> DescribePod:
+    statuses = p.status.container_statuses or []
+    owner = next((o.name for o in (p.metadata.owner_references or []) if o.kind == "ReplicaSet"), None)
+    return DescribePod(
+        name=p.metadata.name,
+        phase=p.status.phase or "Unknown",
+        ready=f"{sum(1 for c in statuses if c.ready)}/{len(p.spec.containers)}",
+        restarts=sum(c.restart_count or 0 for c in statuses),
+        node=p.spec.node_name,
+        ip=p.status.pod_ip,
+        replicaSet=owner,
+        createdAt=p.metadata.creation_timestamp.isoformat() if p.metadata.creation_timestamp else None,
+    )
+
+
+def _describe_text(deployment: DescribeDeployment, replica_sets: list[DescribeReplicaSet],
+                   pods: list[DescribePod], events: list[DescribeEvent]) -> str:
+    d = deployment
     lines = []
-    lines.append(f"Name:               {d.metadata.name}")
-    lines.append(f"Namespace:          {namespace}")
-    lines.append(f"CreationTimestamp:   {d.metadata.creation_timestamp}")
-    lines.append(f"Labels:             {d.metadata.labels}")
-    lines.append(f"Replicas:           {d.spec.replicas} desired | "
-                 f"{d.status.updated_replicas or 0} updated | "
-                 f"{d.status.replicas or 0} total | "
-                 f"{d.status.available_replicas or 0} available | "
-                 f"{d.status.unavailable_replicas or 0} unavailable")
+    lines.append(f"Name:               {d.name}")
+    lines.append(f"Namespace:          {d.namespace}")
+    lines.append(f"CreationTimestamp:  {d.createdAt or ''}")
+    lines.append(f"Labels:             {','.join(f'{k}={v}' for k, v in d.labels.items()) or '<none>'}")
+    lines.append(f"Selector:           {d.selector}")
+    lines.append(f"Replicas:           {d.replicas} desired | {d.updatedReplicas} updated | "
+                 f"{d.totalReplicas} total | {d.availableReplicas} available | "
+                 f"{d.unavailableReplicas} unavailable")
+    lines.append(f"StrategyType:       {d.strategy or ''}")
 
     # Containers
-    for c in d.spec.template.spec.containers:
+    for c in d.containers:
         lines.append(f"\nContainer:          {c.name}")
         lines.append(f"  Image:            {c.image}")
         if c.ports:
-            lines.append(f"  Ports:            {', '.join(str(p.container_port) for p in c.ports)}")
-        if c.resources:
-            if c.resources.requests:
-                lines.append(f"  Requests:         cpu={c.resources.requests.get('cpu','')}, memory={c.resources.requests.get('memory','')}")
-            if c.resources.limits:
-                lines.append(f"  Limits:           cpu={c.resources.limits.get('cpu','')}, memory={c.resources.limits.get('memory','')}")
+            lines.append(f"  Ports:            {', '.join(str(p) for p in c.ports)}")
+        if c.requests:
+            lines.append(f"  Requests:         cpu={c.requests.get('cpu', '')}, memory={c.requests.get('memory', '')}")
+        if c.limits:
+            lines.append(f"  Limits:           cpu={c.limits.get('cpu', '')}, memory={c.limits.get('memory', '')}")
 
     # Conditions
     lines.append("\nConditions:")
-    for cond in (d.status.conditions or []):
+    for cond in d.conditions:
         lines.append(f"  {cond.type}: {cond.status} ({cond.reason})")
 
-    # Events
+    if replica_sets:
+        lines.append("\nReplicaSets:")
+        lines.append(f"  {'Name':<45} {'Revision':<10} {'Ready':<10} {'Age'}")
+        for rs in replica_sets:
+            name = f"{rs.name} (current)" if rs.current else rs.name
+            lines.append(f"  {name:<45} {rs.revision or '':<10} {f'{rs.readyReplicas}/{rs.replicas}':<10} "
+                         f"{_age(rs.createdAt)}")
+
+    if pods:
+        lines.append("\nPods:")
+        lines.append(f"  {'Name':<50} {'Status':<10} {'Ready':<7} {'Restarts':<9} {'Node'}")
+        for p in pods:
+            lines.append(f"  {p.name:<50} {p.phase:<10} {p.ready:<7} {p.restarts:<9} {p.node or ''}")
+
+    if events:
+        lines.append("\nEvents:")
+        lines.append(f"  {'Type':<10} {'Reason':<20} {'Age':<15} {'Message'}")
+        for ev in events:
+            age = _age(ev.timestamp)
+            if ev.count > 1:
+                age = f"{age} (x{ev.count})"
+            lines.append(f"  {ev.type or '':<10} {ev.reason or '':<20} {age:<15} {ev.message or ''}")
+
+    return "\n".join(lines)
+
+
+@router.get(
+    "/clusters/{context}/namespaces/{namespace}/deployments/{name}/describe",
+    response_model=DeploymentDescribeResponse, dependencies=[Depends(_require_healthy)],
+)
+def describe_deployment(
+    context: str,
+    namespace: str,
+    name: str,
+    events: int = Query(20, ge=1, le=200, description="Most recent events to include"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    The deployment with its ReplicaSets, pods and most recent events, as structured JSON
+    plus the same content as kubectl-style text in `describe`. The deployment and its
+    events are fetched together, then the ReplicaSets and pods (which need the deployment's
+    selector) together. ReplicaSets, pods and events are best effort: a failed lookup
+    leaves its section empty.
+    """
+    apps = _k8s.apps_v1(context)
+    core = _k8s.core_v1(context)
+    executor = ThreadPoolExecutor(max_workers=4)
     try:
-        events = core.list_namespaced_event(
-            namespace,
-            field_selector=f"involvedObject.name={name},involvedObject.kind=Deployment"
-        ).items
-        if events:
-            lines.append("\nEvents:")
-            lines.append(f"  {'Type':<10} {'Reason':<20} {'Age':<15} {'Message'}")
-            for ev in events[-10:]:
-                age = ""
-                if ev.last_timestamp:
-                    delta = datetime.now(timezone.utc) - ev.last_timestamp.replace(tzinfo=timezone.utc)
-                    mins = int(delta.total_seconds() / 60)
-                    age = f"{mins}m" if mins < 60 else f"{mins // 60}h{mins % 60}m"
-                lines.append(f"  {ev.type or '':<10} {ev.reason or '':<20} {age:<15} {ev.message or ''}")
-    except Exception:
-        pass
+        events_future = executor.submit(_recent_events, core, namespace, "Deployment", name, events)
+        try:
+            d = executor.submit(apps.read_namespaced_deployment, name, namespace, _request_timeout=10).result()
+        except ApiException as e:
+            raise HTTPException(status_code=e.status or 500, detail=e.reason)
+        selector = _label_selector(d.spec.selector)
+        rs_future = executor.submit(
+            lambda: apps.list_namespaced_replica_set(namespace, label_selector=selector, _request_timeout=10).items,
+        )
+        pods_future = executor.submit(
+            lambda: core.list_namespaced_pod(namespace, label_selector=selector, _request_timeout=10).items,
+        )
+
+        def result(future, what: str) -> list:
+            try:
+                return future.result()
+            except Exception as e:
+                logger.warning("describe %s/%s: failed to list %s: %s", namespace, name, what, str(e))
+                return []
+
+        replica_sets = result(rs_future, "replicasets")
+        pods = result(pods_future, "pods")
+        recent = result(events_future, "events")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    deployment = _describe_deployment_info(d)
+    # Selectors can overlap between deployments: keep what this one owns
+    owned = [
+        rs for rs in replica_sets
+        if any(o.uid == d.metadata.uid for o in (rs.metadata.owner_references or []))
+    ]
+    rs_names = {rs.metadata.name for rs in owned}
+    rs_info = sorted(
+        (_describe_replica_set(rs, deployment.revision) for rs in owned),
+        key=lambda rs: int(rs.revision) if (rs.revision or "").isdigit() else 0, reverse=True,
+    )
+    pod_info = sorted(
+        (p for p in map(_describe_pod, pods) if p.replicaSet in rs_names),
+        key=lambda p: p.name,
+    )
+    event_info = []
+    for ev in recent:
+        ts = _event_time(ev)
+        event_info.append(DescribeEvent(
+            type=ev.type, reason=ev.reason, message=ev.message, count=ev.count or 1,
+            timestamp=ts.isoformat() if ts else None,
+        ))
 
-    return {"describe": "\n".join(lines)}
+    return DeploymentDescribeResponse(
+        describe=_describe_text(deployment, rs_info, pod_info, event_info),
+        deployment=deployment,
+        replicaSets=rs_info,
+        pods=pod_info,
+        events=event_info,
+    )
 
 
-@router.get("/clusters/{context}/namespaces/{namespace}/deployments/{name}/logs", response_model=DeploymentLogsResponse)
+@router.get(
+    "/clusters/{context}/namespaces/{namespace}/deployments/{name}/logs",
+    response_model=DeploymentLogsResponse, dependencies=[Depends(_require_healthy)],
+)
 def get_deployment_logs(
     context: str,
     namespace: str,
     name: str,
     tailLines: int = Query(100, ge=1, le=1000),
+    sinceSeconds: Optional[int] = Query(None, ge=1, description="Only lines newer than this many seconds"),
+    limitBytes: int = Query(1024 * 1024, ge=1, le=10 * 1024 * 1024, description="Per-container cap"),
+    merged: bool = Query(False, description="Also return all containers' lines merged by timestamp"),
     current_user: User = Depends(get_current_user),
 ):
-    try:
-        core = _k8s.core_v1(context)
-        d = _k8s.apps_v1(context).read_namespaced_deployment(name, namespace)
-    except ApiException as e:
-        raise HTTPException(status_code=e.status or 500, detail=e.reason)
+    core = _k8s.core_v1(context)
+    d = _cached_deployment(context, namespace, name)
 
     # Find pods by label selector
     selector = d.spec.selector.match_labels or {}
@@ -485,40 +956,171 @@ def get_deployment_logs(
     except Exception:
         pods = []
 
-    pod_logs = []
-    for pod in pods:
-        pod_status = pod.status.phase or "Unknown"
-        for container in pod.spec.containers:
-            log_text = ""
-            try:
-                log_text = core.read_namespaced_pod_log(
-                    pod.metadata.name,
-                    namespace,
-                    container=container.name,
-                    tail_lines=tailLines,
-                )
-            except Exception as e:
-                log_text = f"Error reading logs: {e}"
+    targets = [(pod, container.name) for pod in pods for container in pod.spec.containers]
 
-            pod_logs.append(PodLogEntry(
-                podName=pod.metadata.name,
-                containerName=container.name,
-                status=pod_status,
-                logs=log_text,
-            ))
+    def read_log(target) -> tuple[PodLogEntry, bool]:
+        pod, container = target
+        try:
+            log_text = core.read_namespaced_pod_log(
+                pod.metadata.name,
+                namespace,
+                container=container,
+                tail_lines=tailLines,
+                since_seconds=sinceSeconds,
+                limit_bytes=limitBytes,
+                timestamps=merged,
+            )
+            ok = True
+        except Exception as e:
+            log_text = f"Error reading logs: {e}"
+            ok = False
+        entry = PodLogEntry(
+            podName=pod.metadata.name,
+            containerName=container,
+            status=pod.status.phase or "Unknown",
+            logs=log_text,
+        )
+        return entry, ok
+
+    results = []
+    if targets:
+        with ThreadPoolExecutor(max_workers=min(K8S_LOG_WORKERS, len(targets))) as executor:
+            results = list(executor.map(read_log, targets))
+
+    merged_lines = None
+    if merged:
+        # Each container's log is already in time order: k-way merge instead of sorting everything
+        streams = [_timestamped_lines(entry) for entry, ok in results if ok]
+        merged_lines = [line for _, line in heapq.merge(*streams, key=lambda item: item[0])]
+        # The lines now live in `merged`; keep only error text per container
+        for entry, ok in results:
+            if ok:
+                entry.logs = ""
 
     return DeploymentLogsResponse(
         deployment=name,
-        pods=pod_logs,
+        pods=[entry for entry, _ in results],
         totalPods=len(pods),
+        merged=merged_lines,
     )
 
 
+def _log_sort_key(timestamp: str) -> tuple[str, int]:
+    """RFC3339Nano drops trailing zeros of the fraction, so compare seconds and nanoseconds separately."""
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    nanos = int(fraction.ljust(9, "0")[:9]) if fraction.isdigit() else 0
+    return seconds, nanos
+
+
+def _timestamped_lines(entry: PodLogEntry):
+    """(sort key, MergedLogLine) per line of a timestamps=true log, already in time order per container."""
+    last_key = ("", 0)
+    for raw in entry.logs.splitlines():
+        timestamp, _, line = raw.partition(" ")
+        if timestamp[:1].isdigit():
+            last_key = max(last_key, _log_sort_key(timestamp))
+        else:
+            # Not a timestamp (e.g. a line cut by limitBytes): keep it with the previous line
+            timestamp, line = "", raw
+        yield last_key, MergedLogLine(
+            timestamp=timestamp, podName=entry.podName, containerName=entry.containerName, line=line,
+        )
+
+
+@router.websocket("/ws/logs")
+async def ws_logs(ws: WebSocket):
+    """
+    Follow the logs of every pod of a deployment, including pods that start later.
+    Query: token, context, namespace, name, tailLines.
+
+    Sends {"type": "logs", "lines": [{"pod", "container", "line"}, ...], "dropped": n}
+    batches, {"type": "stream", "pod", "container", "state"} when a container's stream
+    starts or ends, and {"type": "ping"} when idle. `dropped` is the number of lines
+    discarded so far because the client read slower than the pods wrote.
+    """
+    token = ws.query_params.get("token")
+    ctx = ws.query_params.get("context")
+    ns = ws.query_params.get("namespace")
+    name = ws.query_params.get("name")
+    try:
+        tail_lines = min(max(int(ws.query_params.get("tailLines", "100")), 0), 1000)
+    except ValueError:
+        tail_lines = 100
+
+    if not all([token, ctx, ns, name]):
+        await ws.close(code=1008, reason="Missing parameters")
+        return
+
+    try:
+        from deps import decode_token
+        decode_token(token)
+    except Exception:
+        await ws.close(code=1008, reason="Invalid token")
+        return
+
+    try:
+        _require_healthy(ctx)
+        d = await asyncio.to_thread(_cached_deployment, ctx, ns, name)
+    except HTTPException as e:
+        await ws.close(code=1011, reason=str(e.detail)[:120])
+        return
+
+    await ws.accept()
+    selector = d.spec.selector.match_labels or {}
+    follower = LogFollower(
+        _k8s.core_v1(ctx), ns, ",".join(f"{k}={v}" for k, v in selector.items()),
+        tail_lines=tail_lines, maxsize=K8S_LOG_FOLLOW_BUFFER,
+    )
+    follower.start()
+
+    async def wait_disconnect():
+        while True:
+            await ws.receive_text()
+
+    receiver = asyncio.create_task(wait_disconnect())
+    try:
+        while True:
+            getter = asyncio.create_task(follower.queue.get())
+            done, _ = await asyncio.wait({getter, receiver}, timeout=30, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+                if receiver in done:
+                    break
+                await ws.send_json({"type": "ping"})
+                continue
+
+            # Send whatever has queued up meanwhile in one batch, keeping stream events in order
+            messages = [getter.result()]
+            while not follower.queue.empty() and len(messages) < 500:
+                messages.append(follower.queue.get_nowait())
+            lines = []
+            for message in messages:
+                if message["type"] == "log":
+                    lines.append({"pod": message["pod"], "container": message["container"], "line": message["line"]})
+                    continue
+                if lines:
+                    await ws.send_json({"type": "logs", "lines": lines, "dropped": follower.dropped})
+                    lines = []
+                await ws.send_json(message)
+            if lines:
+                await ws.send_json({"type": "logs", "lines": lines, "dropped": follower.dropped})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.debug("Log follow closed: %s", str(e))
+    finally:
+        receiver.cancel()
+        follower.stop()
+
+
 # ---------------------------------------------------------------------------
 # YAML edit
 # ---------------------------------------------------------------------------
 
-@router.get("/clusters/{context}/namespaces/{namespace}/deployments/{name}/yaml", response_model=DeploymentYamlResponse)
+@router.get(
+    "/clusters/{context}/namespaces/{namespace}/deployments/{name}/yaml",
+    response_model=DeploymentYamlResponse, dependencies=[Depends(_require_healthy)],
+)
 def get_deployment_yaml(
     context: str,
     namespace: str,
@@ -540,7 +1142,10 @@ def get_deployment_yaml(
     return DeploymentYamlResponse(yaml=yaml_lib.dump(raw, default_flow_style=False, allow_unicode=True))
 
 
-@router.put("/clusters/{context}/namespaces/{namespace}/deployments/{name}/yaml", response_model=MessageResponse)
+@router.put(
+    "/clusters/{context}/namespaces/{namespace}/deployments/{name}/yaml",
+    response_model=MessageResponse,
+)
 def update_deployment_yaml(
     context: str,
     namespace: str,
@@ -575,26 +1180,41 @@ def update_deployment_yaml(
 # Pods for exec
 # ---------------------------------------------------------------------------
 
-@router.get("/clusters/{context}/namespaces/{namespace}/deployments/{name}/pods", response_model=list[PodInfoResponse])
+@router.get(
+    "/clusters/{context}/namespaces/{namespace}/deployments/{name}/pods",
+    response_model=list[PodInfoResponse], dependencies=[Depends(_require_healthy)],
+)
 def get_deployment_pods(
     context: str,
     namespace: str,
     name: str,
     current_user: User = Depends(get_current_user),
 ):
-    try:
-        d = _k8s.apps_v1(context).read_namespaced_deployment(name, namespace)
-    except ApiException as e:
-        raise HTTPException(status_code=e.status or 500, detail=e.reason)
+    d = _cached_deployment(context, namespace, name)
 
     selector = d.spec.selector.match_labels or {}
     label_selector = ",".join(f"{k}={v}" for k, v in selector.items())
 
+    # Pods are always listed live: a cluster-wide pod cache costs far more memory than the
+    # namespaced, label-selected list for one deployment
     try:
-        core = _k8s.core_v1(context)
-        pods = core.list_namespaced_pod(namespace, label_selector=label_selector).items
+        if K8S_RAW_LISTS:
+            pods = _k8s.list_raw(
+                context, client.CoreV1Api, "list_namespaced_pod", namespace, label_selector=label_selector,
+            ).get("items") or []
+        else:
+            pods = _k8s.core_v1(context).list_namespaced_pod(namespace, label_selector=label_selector).items
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if K8S_RAW_LISTS:
+        return [
+            PodInfoResponse(
+                name=p["metadata"]["name"],
+                status=(p.get("status") or {}).get("phase") or "Unknown",
+                containers=[ContainerInfo(name=c["name"]) for c in p["spec"]["containers"]],
+            )
+            for p in pods
+        ]
 
     return [
         PodInfoResponse(
@@ -612,9 +1232,7 @@ def get_deployment_pods(
 
 @router.websocket("/ws/exec")
 async def ws_exec(ws: WebSocket):
-    import asyncio
-    import threading
-
+    """Interactive shell in a pod container; see services.exec_bridge.bridge for the frame protocol."""
     token = ws.query_params.get("token")
     ctx = ws.query_params.get("context")
     ns = ws.query_params.get("namespace")
@@ -637,22 +1255,14 @@ async def ws_exec(ws: WebSocket):
 
     # Open K8s exec stream
     try:
-        core = _k8s.core_v1(ctx)
-        exec_stream = k8s_stream.stream(
-            core.connect_get_namespaced_pod_exec,
-            pod, ns,
-            container=container,
-            command=["/bin/sh"],
-            stderr=True, stdin=True, stdout=True, tty=True,
-            _preload_content=False,
-        )
+        k8s_ws = await open_exec(_k8s.api_client(ctx), ns, pod, container, ["/bin/sh"])
     except Exception as e:
-        await ws.send_text(f"\r\nError: {e}\r\n")
+        await ws.send_json({"type": "error", "message": str(e)})
         await ws.close()
         return
 
     # Audit log
-    try:
+    def audit():
         db_gen = _get_db()
         db = next(db_gen)
         from models import User as UserModel
@@ -660,50 +1270,23 @@ async def ws_exec(ws: WebSocket):
         if user:
             _audit(db, user, "exec", "pod", f"{ctx}/{ns}/{pod}/{container}", {}, "success", "")
         db.close()
-    except Exception:
-        pass
-
-    closed = False
-
-    # K8s stream -> WebSocket
-    def read_from_k8s():
-        nonlocal closed
-        try:
-            while exec_stream.is_open() and not closed:
-                exec_stream.update(timeout=1)
-                if exec_stream.peek_stdout():
-                    data = exec_stream.read_stdout()
-                    asyncio.run_coroutine_threadsafe(ws.send_text(data), loop)
-                if exec_stream.peek_stderr():
-                    data = exec_stream.read_stderr()
-                    asyncio.run_coroutine_threadsafe(ws.send_text(data), loop)
-        except Exception:
-            pass
-        finally:
-            closed = True
 
-    loop = asyncio.get_event_loop()
-    reader_thread = threading.Thread(target=read_from_k8s, daemon=True)
-    reader_thread.start()
-
-    # WebSocket -> K8s stream
     try:
-        while not closed:
-            data = await ws.receive_text()
-            if exec_stream.is_open():
-                exec_stream.write_stdin(data)
-    except WebSocketDisconnect:
+        await asyncio.to_thread(audit)
+    except Exception:
         pass
-    finally:
-        closed = True
-        exec_stream.close()
+
+    await bridge(ws, k8s_ws)
 
 
 # ---------------------------------------------------------------------------
 # Actions (scale, restart) - with audit log
 # ---------------------------------------------------------------------------
 
-@router.patch("/clusters/{context}/namespaces/{namespace}/deployments/{name}/scale", response_model=ScaleResponse)
+@router.patch(
+    "/clusters/{context}/namespaces/{namespace}/deployments/{name}/scale",
+    response_model=ScaleResponse,
+)
 def scale_deployment(
     context: str,
     namespace: str,
@@ -732,7 +1315,26 @@ def scale_deployment(
     return ScaleResponse(success=True, message=f"Scaled to {req.replicas}", replicas=req.replicas)
 
 
-@router.post("/clusters/{context}/namespaces/{namespace}/deployments/{name}/restart", response_model=MessageResponse)
+def _restart_patch() -> dict:
+    """Rolling restart via annotation update, as `kubectl rollout restart` does."""
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "spec": {
+            "template": {
+                "metadata": {
+                    "annotations": {
+                        "kubectl.kubernetes.io/restartedAt": now,
+                    }
+                }
+            }
+        }
+    }
+
+
+@router.post(
+    "/clusters/{context}/namespaces/{namespace}/deployments/{name}/restart",
+    response_model=MessageResponse,
+)
 def restart_deployment(
     context: str,
     namespace: str,
@@ -743,20 +1345,7 @@ def restart_deployment(
 ):
     try:
         apps = _k8s.apps_v1(context)
-        # Rolling restart via annotation update
-        now = datetime.now(timezone.utc).isoformat()
-        body = {
-            "spec": {
-                "template": {
-                    "metadata": {
-                        "annotations": {
-                            "kubectl.kubernetes.io/restartedAt": now,
-                        }
-                    }
-                }
-            }
-        }
-        apps.patch_namespaced_deployment(name, namespace, body)
+        apps.patch_namespaced_deployment(name, namespace, _restart_patch())
     except ApiException as e:
         _audit(db, current_user, "restart", "deployment", f"{context}/{namespace}/{name}",
                {"error": str(e)}, "failed",
@@ -768,3 +1357,124 @@ def restart_deployment(
            request.client.host if request.client else "")
 
     return MessageResponse(message=f"Deployment {name} restarting")
+
+
+def _bulk_targets(context: str, req: DeploymentBulkRequest) -> list[tuple[str, str, Optional[int]]]:
+    """(namespace, name, current replicas if known) of every deployment a bulk request selects."""
+    if req.targets:
+        if req.namespace or req.labelSelector:
+            raise HTTPException(status_code=400, detail="Give either targets or namespace/labelSelector, not both")
+        return [(ns, name, None) for ns, name in dict.fromkeys((t.namespace, t.name) for t in req.targets)]
+    if not req.namespace and not req.labelSelector:
+        raise HTTPException(status_code=400, detail="Give targets, a namespace or a labelSelector")
+
+    # Resolved live so the action sees deployments created since the cache last synced
+    if req.namespace:
+        method, args = "list_namespaced_deployment", (req.namespace,)
+    else:
+        method, args = "list_deployment_for_all_namespaces", ()
+    try:
+        items = _k8s.list_raw(
+            context, client.AppsV1Api, method, *args, label_selector=req.labelSelector, _request_timeout=30,
+        ).get("items") or []
+    except ApiException as e:
+        raise HTTPException(status_code=e.status or 500, detail=e.reason)
+    return sorted(
+        (d["metadata"]["namespace"], d["metadata"]["name"], (d.get("spec") or {}).get("replicas")) for d in items
+    )
+
+
+def _bulk_apply(
+    context: str, action: str, targets: list[tuple[str, str, Optional[int]]],
+    apply: Callable[[client.AppsV1Api, str, str], None], describe: Callable[[Optional[int]], dict],
+    done_message: str, request: Request, user: User, db: Session,
+) -> DeploymentBulkResponse:
+    """
+    Run `apply(apps, namespace, name)` on every target through a bounded pool, then record
+    one audit row per target in a single commit. Failures are reported per item, not raised.
+    """
+    apps = _k8s.apps_v1(context)
+
+    def run(ns: str, name: str) -> Optional[str]:
+        try:
+            apply(apps, ns, name)
+            return None
+        except Exception as e:
+            reason = getattr(e, "reason", None) or str(e)
+            logger.warning("Bulk %s of %s/%s in %s failed: %s", action, ns, name, context, reason)
+            return reason
+
+    errors: dict[int, Optional[str]] = {}
+    if targets:
+        with ThreadPoolExecutor(max_workers=min(K8S_BULK_WORKERS, len(targets))) as executor:
+            futures = {executor.submit(run, ns, name): i for i, (ns, name, _) in enumerate(targets)}
+            for future in as_completed(futures):
+                errors[futures[future]] = future.result()
+
+    ip_address = request.client.host if request.client else ""
+    results = []
+    for i, (ns, name, replicas) in enumerate(targets):
+        error = errors[i]
+        detail = describe(replicas)
+        if error:
+            detail["error"] = error
+        results.append(DeploymentBulkItemResult(
+            namespace=ns, name=name, success=error is None,
+            message=f"{action.capitalize()} failed: {error}" if error else done_message,
+        ))
+        db.add(AuditLog(
+            user_id=user.id, action=action, menu="k8s",
+            target_type="deployment", target_name=f"{context}/{ns}/{name}",
+            detail={**detail, "bulk": True}, result="failed" if error else "success", ip_address=ip_address,
+        ))
+    db.commit()
+
+    succeeded = sum(1 for r in results if r.success)
+    logger.info("Bulk %s on %s: %d succeeded, %d failed", action, context, succeeded, len(results) - succeeded)
+    return DeploymentBulkResponse(results=results, succeeded=succeeded, failed=len(results) - succeeded)
+
+
+@router.post(
+    "/clusters/{context}/deployments/bulk/scale",
+    response_model=DeploymentBulkResponse,
+)
+def bulk_scale_deployments(
+    context: str,
+    req: DeploymentBulkScaleRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Scale every selected deployment to `replicas`; one result per deployment."""
+    if req.replicas < 0:
+        raise HTTPException(status_code=400, detail="Replicas must be >= 0")
+    targets = _bulk_targets(context, req)
+    body = {"spec": {"replicas": req.replicas}}
+    return _bulk_apply(
+        context, "scale", targets,
+        lambda apps, ns, name: apps.patch_namespaced_deployment_scale(name, ns, body, _request_timeout=30),
+        lambda replicas: {"to": req.replicas} if replicas is None else {"from": replicas, "to": req.replicas},
+        f"Scaled to {req.replicas}", request, current_user, db,
+    )
+
+
+@router.post(
+    "/clusters/{context}/deployments/bulk/restart",
+    response_model=DeploymentBulkResponse,
+)
+def bulk_restart_deployments(
+    context: str,
+    req: DeploymentBulkRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Rolling-restart every selected deployment; one result per deployment."""
+    targets = _bulk_targets(context, req)
+    body = _restart_patch()
+    return _bulk_apply(
+        context, "restart", targets,
+        lambda apps, ns, name: apps.patch_namespaced_deployment(name, ns, body, _request_timeout=30),
+        lambda replicas: {},
+        "Restarting", request, current_user, db,
+    )
@@ -78,6 +78,20 @@ class RollbackRequest(BaseModel):
     targetVersion: str
 
 
+class RollbackJobResponse(BaseModel):
+    id: int
+    appName: str
+    env: str
+    targetVersion: str
+    status: str  # queued / running / success / failed
+    startedBy: int
+    startedByName: str = ""
+    log: Optional[str] = None
+    startedAt: str
+    finishedAt: Optional[str] = None
+    message: str = ""
+
+
 class ReplicaChangeRequest(BaseModel):
     appName: str
     env: str
@@ -85,6 +99,25 @@ class ReplicaChangeRequest(BaseModel):
     replicas: int
 
 
+class ReplicaBatchRequest(BaseModel):
+    items: list[ReplicaChangeRequest]
+
+
+class ReplicaBatchItemResult(BaseModel):
+    appName: str
+    env: str
+    componentName: str
+    replicas: int
+    success: bool
+    message: str
+
+
+class ReplicaBatchResponse(BaseModel):
+    results: list[ReplicaBatchItemResult]
+    succeeded: int
+    failed: int
+
+
 # --- User Management ---
 class CreateUserRequest(BaseModel):
     userId: str
@@ -232,10 +265,18 @@ class PodLogEntry(BaseModel):
     logs: str
 
 
+class MergedLogLine(BaseModel):
+    timestamp: str
+    podName: str
+    containerName: str
+    line: str
+
+
 class DeploymentLogsResponse(BaseModel):
     deployment: str
     pods: list[PodLogEntry]
     totalPods: int
+    merged: Optional[list[MergedLogLine]] = None  # merged=true: all containers' lines in time order
 
 
 class ScaleRequest(BaseModel):
@@ -248,6 +289,104 @@ class ScaleResponse(BaseModel):
     replicas: int
 
 
+class DeploymentRef(BaseModel):
+    namespace: str
+    name: str
+
+
+class DeploymentBulkRequest(BaseModel):
+    """Either explicit `targets`, or every deployment matching namespace and/or labelSelector."""
+    namespace: Optional[str] = None
+    labelSelector: Optional[str] = None
+    targets: Optional[list[DeploymentRef]] = None
+
+
+class DeploymentBulkScaleRequest(DeploymentBulkRequest):
+    replicas: int
+
+
+class DeploymentBulkItemResult(BaseModel):
+    namespace: str
+    name: str
+    success: bool
+    message: str
+
+
+class DeploymentBulkResponse(BaseModel):
+    results: list[DeploymentBulkItemResult]
+    succeeded: int
+    failed: int
+
+
+class DescribeContainer(BaseModel):
+    name: str
+    image: Optional[str] = None
+    ports: list[int] = []
+    requests: dict[str, str] = {}
+    limits: dict[str, str] = {}
+
+
+class DescribeCondition(BaseModel):
+    type: str
+    status: str
+    reason: Optional[str] = None
+    message: Optional[str] = None
+
+
+class DescribeDeployment(BaseModel):
+    name: str
+    namespace: str
+    createdAt: Optional[str] = None
+    labels: dict[str, str] = {}
+    selector: str
+    strategy: Optional[str] = None
+    revision: Optional[str] = None
+    replicas: int
+    updatedReplicas: int
+    totalReplicas: int
+    availableReplicas: int
+    unavailableReplicas: int
+    containers: list[DescribeContainer]
+    conditions: list[DescribeCondition]
+
+
+class DescribeReplicaSet(BaseModel):
+    name: str
+    revision: Optional[str] = None
+    current: bool  # the deployment's current revision
+    replicas: int
+    readyReplicas: int
+    images: list[str]
+    createdAt: Optional[str] = None
+
+
+class DescribePod(BaseModel):
+    name: str
+    phase: str
+    ready: str  # "1/2"
+    restarts: int
+    node: Optional[str] = None
+    ip: Optional[str] = None
+    replicaSet: Optional[str] = None
+    createdAt: Optional[str] = None
+
+
+class DescribeEvent(BaseModel):
+    type: Optional[str] = None
+    reason: Optional[str] = None
+    message: Optional[str] = None
+    count: int = 1
+    timestamp: Optional[str] = None
+
+
+class DeploymentDescribeResponse(BaseModel):
+    describe: str  # kubectl-style text of the fields below
+    deployment: DescribeDeployment
+    replicaSets: list[DescribeReplicaSet]
+    pods: list[DescribePod]
+    events: list[DescribeEvent]  # oldest first, the most recent `events` only
+
+
 class DeploymentYamlResponse(BaseModel):
     yaml: str
 
@@ -0,0 +1,55 @@
+import logging
+
+from kubernetes import client
+from kubernetes.client.exceptions import ApiException
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_K8S_INFO = {"k8sVersion": "unknown", "replicaDesired": 0, "replicaCurrent": 0}
+
+
+def deployment_k8s_info(d: client.V1Deployment) -> dict:
+    """Extract the /apps fields (image tag, desired/ready replicas) from a deployment."""
+    image = ""
+    containers = d.spec.template.spec.containers if d.spec and d.spec.template else None
+    if containers:
+        image = containers[0].image or ""
+    return {
+        "k8sVersion": image.split(":")[-1] if ":" in image else "unknown",
+        "replicaDesired": (d.spec.replicas if d.spec else 0) or 0,
+        "replicaCurrent": (d.status.ready_replicas if d.status else 0) or 0,
+    }
+
+
+def list_deployments_by_namespace(apps: client.AppsV1Api, namespaces: set[str]) -> dict[tuple[str, str], dict]:
+    """
+    Build a (namespace, deployment name) -> k8s info index for the given namespaces.
+    Tries a single cluster-wide list first and falls back to one
+    list_namespaced_deployment per namespace when RBAC only allows namespaced reads.
+    """
+    index: dict[tuple[str, str], dict] = {}
+    if not namespaces:
+        return index
+
+    try:
+        deploys = apps.list_deployment_for_all_namespaces(_request_timeout=30).items
+        for d in deploys:
+            if d.metadata.namespace in namespaces:
+                index[(d.metadata.namespace, d.metadata.name)] = deployment_k8s_info(d)
+        return index
+    except ApiException as e:
+        if e.status != 403:
+            raise
+        logger.info("Cluster-wide deployment list forbidden, listing %d namespaces", len(namespaces))
+
+    for ns in sorted(namespaces):
+        try:
+            deploys = apps.list_namespaced_deployment(ns, _request_timeout=30).items
+        except ApiException as e:
+            if e.status not in (403, 404):
+                raise
+            logger.debug("Cannot list deployments in %s: %s", ns, e.reason)
+            continue
+        for d in deploys:
+            index[(ns, d.metadata.name)] = deployment_k8s_info(d)
+    return index
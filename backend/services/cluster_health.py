@@ -0,0 +1,149 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+HEALTHY = "healthy"
+UNHEALTHY = "unhealthy"
+UNKNOWN = "unknown"
+
+
+@dataclass
+class HealthState:
+    healthy: Optional[bool] = None  # None until the first probe finishes
+    checked_at: float = 0.0
+    next_probe_at: float = 0.0
+    consecutive_failures: int = 0
+    error: Optional[str] = None
+    probing: bool = False
+    last_read: float = 0.0
+
+    @property
+    def status(self) -> str:
+        if self.healthy is None:
+            return UNKNOWN
+        return HEALTHY if self.healthy else UNHEALTHY
+
+
+class ClusterHealth:
+    """
+    Cached API server health per kubeconfig context.
+
+    `probe(context, timeout)` must raise when the cluster is down. Readers get the cached
+    state and never wait on a probe, except a first read of a context that asks to `wait`
+    for the initial result. Stale entries are re-probed in the background: healthy ones every
+    `ttl` seconds, failing ones after ttl * 2^(failures-1), capped at `max_backoff`, so
+    dead clusters aren't hammered with requests that can only time out.
+
+    A context only turns unhealthy after `failure_threshold` probes in a row fail; until then
+    it keeps its previous state and is re-probed after `retry_interval`, so one dropped
+    request doesn't take a cluster offline for a whole backoff period. Contexts nobody has
+    read for `idle_timeout` seconds are forgotten, and at most `max_contexts` are tracked.
+    """
+
+    def __init__(self, probe: Callable[[str, float], None], ttl: float = 30, max_backoff: float = 300,
+                 probe_timeout: float = 3, workers: int = 8, failure_threshold: int = 3,
+                 retry_interval: float = 5, idle_timeout: float = 3600, max_contexts: int = 256):
+        self._probe = probe
+        self._ttl = ttl
+        self._max_backoff = max_backoff
+        self._probe_timeout = probe_timeout
+        self._failure_threshold = max(1, failure_threshold)
+        self._retry_interval = retry_interval
+        self._idle_timeout = idle_timeout
+        self._max_contexts = max_contexts
+        self._states: dict[str, HealthState] = {}
+        self._first_probe: dict[str, threading.Event] = {}
+        self._next_prune_at = 0.0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cluster-health")
+
+    def state(self, context: str) -> HealthState:
+        """Cached state, scheduling a background probe if it is due."""
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_prune_at:
+                self._prune(now)
+            state = self._states.get(context)
+            if state is None:
+                if len(self._states) >= self._max_contexts:
+                    self._evict_oldest()
+                state = self._states[context] = HealthState()
+                self._first_probe[context] = threading.Event()
+            state.last_read = now
+            if not state.probing and now >= state.next_probe_at:
+                state.probing = True
+                self._executor.submit(self._run_probe, context)
+            return state
+
+    def status(self, context: str, wait: float = 0) -> str:
+        """healthy / unhealthy / unknown. `wait` bounds how long a never-probed context may block."""
+        state = self.state(context)
+        if state.healthy is None and wait > 0:
+            event = self._first_probe.get(context)
+            if event is not None:
+                event.wait(wait)
+        return state.status
+
+    def is_unhealthy(self, context: str) -> bool:
+        return self.state(context).healthy is False
+
+    def _forget(self, context: str):
+        self._states.pop(context, None)
+        event = self._first_probe.pop(context, None)
+        if event is not None:
+            event.set()  # release status() waiters
+
+    def _prune(self, now: float):
+        """Drop contexts that haven't been read for idle_timeout. Caller holds the lock."""
+        self._next_prune_at = now + min(self._ttl, self._idle_timeout)
+        idle = [ctx for ctx, s in self._states.items() if not s.probing and now - s.last_read > self._idle_timeout]
+        for ctx in idle:
+            self._forget(ctx)
+
+    def _evict_oldest(self):
+        """Make room for one more context by dropping the least recently read. Caller holds the lock."""
+        candidates = [(s.last_read, ctx) for ctx, s in self._states.items() if not s.probing]
+        if candidates:
+            self._forget(min(candidates)[1])
+
+    def _run_probe(self, context: str):
+        try:
+            self._probe(context, self._probe_timeout)
+            error = None
+        except Exception as e:
+            error = str(e) or type(e).__name__
+
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.get(context)
+            if state is None:
+                return
+            if error is None:
+                if state.healthy is False:
+                    logger.info("Cluster %s is reachable again", context)
+                state.healthy = True
+                state.consecutive_failures = 0
+                state.next_probe_at = now + self._ttl
+            else:
+                state.consecutive_failures += 1
+                failures = state.consecutive_failures - self._failure_threshold
+                if failures < 0:
+                    logger.info("Cluster %s health probe failed (%d/%d): %s", context,
+                                state.consecutive_failures, self._failure_threshold, error)
+                    state.next_probe_at = now + self._retry_interval
+                else:
+                    if state.healthy is not False:
+                        logger.warning("Cluster %s health probe failed: %s", context, error)
+                    state.healthy = False
+                    state.next_probe_at = now + min(self._ttl * 2 ** failures, self._max_backoff)
+            state.error = error
+            state.checked_at = time.time()
+            state.probing = False
+            event = self._first_probe.get(context)
+        if event is not None:
+            event.set()
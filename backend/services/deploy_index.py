@@ -0,0 +1,230 @@
+import json
+import logging
+import os
+import subprocess
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+EXCLUDED_DIRS = {"common-chart", ".git", "admin-dashboard-frontend", "admin-dashboard-backend"}
+
+
+@dataclass
+class AppEntry:
+    envs: dict[str, str] = field(default_factory=dict)  # env -> image tag (image/{env}.yaml)
+    components: dict[str, str] = field(default_factory=dict)  # component folder -> deployment name
+
+
+@dataclass
+class DeployIndex:
+    """Parsed view of the deploy repo at one git commit."""
+    commit: str
+    apps: dict[str, AppEntry] = field(default_factory=dict)
+    app_git_urls: dict[str, str] = field(default_factory=dict)  # apps-git.yaml
+
+    def deploy_version(self, app_name: str, env: str) -> str:
+        entry = self.apps.get(app_name)
+        return entry.envs.get(env, "unknown") if entry else "unknown"
+
+    def deploy_name(self, app_name: str, component_name: str) -> str:
+        entry = self.apps.get(app_name)
+        if not entry:
+            return component_name
+        return entry.components.get(component_name, component_name)
+
+    def has_env(self, app_name: str, env: str) -> bool:
+        entry = self.apps.get(app_name)
+        return bool(entry) and env in entry.envs
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeployIndex":
+        return cls(
+            commit=data["commit"],
+            apps={name: AppEntry(**entry) for name, entry in data.get("apps", {}).items()},
+            app_git_urls=data.get("app_git_urls", {}),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def _read_image_tag(env_yaml_path: str) -> str:
+    try:
+        with open(env_yaml_path, "r") as f:
+            data = yaml.safe_load(f)
+    except Exception as e:
+        logger.warning("Failed to read %s: %s", env_yaml_path, str(e))
+        return "unknown"
+    return data.get("image", {}).get("tag", "unknown") if data else "unknown"
+
+
+def _read_deploy_name(common_yaml_path: str, component_name: str) -> str:
+    """Deployment name from common.yaml: app.name (production format), then appname (legacy)."""
+    try:
+        with open(common_yaml_path, "r") as f:
+            common_data = yaml.safe_load(f)
+        if common_data:
+            name = common_data.get("app", {}).get("name") or common_data.get("appname")
+            if name:
+                return name
+            logger.warning("No app.name or appname found in %s, using folder name: %s", common_yaml_path, component_name)
+        else:
+            logger.warning("Empty yaml data in %s", common_yaml_path)
+    except Exception as e:
+        logger.warning("Failed to read appname from %s: %s, using folder name: %s", common_yaml_path, str(e), component_name)
+    return component_name
+
+
+def _read_app_git_urls(deploy_path: str) -> dict[str, str]:
+    """apps-git.yaml format: app_name: git_url (simple string)"""
+    apps_git_path = os.path.join(deploy_path, "apps-git.yaml")
+    if not os.path.isfile(apps_git_path):
+        logger.warning("apps-git.yaml not found at %s", apps_git_path)
+        return {}
+    try:
+        with open(apps_git_path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        return data or {}
+    except Exception as e:
+        logger.error("Failed to read apps-git.yaml: %s", str(e))
+        return {}
+
+
+def parse_app(deploy_path: str, app_name: str) -> Optional[AppEntry]:
+    """Parse one app folder; None if it is not an app (no image/ directory)."""
+    repo_path = os.path.join(deploy_path, app_name)
+    image_dir = os.path.join(repo_path, "image")
+    if app_name in EXCLUDED_DIRS or not os.path.isdir(image_dir):
+        return None
+
+    entry = AppEntry()
+    for env_file in os.listdir(image_dir):
+        if env_file.endswith(".yaml"):
+            env = env_file[: -len(".yaml")]
+            entry.envs[env] = _read_image_tag(os.path.join(image_dir, env_file))
+
+    # Components are folders ending with -ui that contain a common.yaml
+    for item in os.listdir(repo_path):
+        common_yaml = os.path.join(repo_path, item, "common.yaml")
+        if item.endswith("-ui") and os.path.isfile(common_yaml):
+            entry.components[item] = _read_deploy_name(common_yaml, item)
+    return entry
+
+
+def build_index(deploy_path: str, commit: str) -> DeployIndex:
+    index = DeployIndex(commit=commit, app_git_urls=_read_app_git_urls(deploy_path))
+    for name in os.listdir(deploy_path):
+        if os.path.isdir(os.path.join(deploy_path, name)):
+            entry = parse_app(deploy_path, name)
+            if entry is not None:
+                index.apps[name] = entry
+    return index
+
+
+def update_index(deploy_path: str, previous: DeployIndex, commit: str, changed_paths: list[str]) -> DeployIndex:
+    """Derive the index for `commit` from `previous`, re-parsing only the top-level entries touched by the diff."""
+    changed_top = {path.split("/", 1)[0] for path in changed_paths}
+    index = DeployIndex(
+        commit=commit,
+        apps=dict(previous.apps),
+        app_git_urls=_read_app_git_urls(deploy_path) if "apps-git.yaml" in changed_top else previous.app_git_urls,
+    )
+    for name in changed_top:
+        entry = parse_app(deploy_path, name) if os.path.isdir(os.path.join(deploy_path, name)) else None
+        if entry is None:
+            index.apps.pop(name, None)
+        else:
+            index.apps[name] = entry
+    return index
+
+
+def head_commit(deploy_path: str) -> Optional[str]:
+    result = subprocess.run(
+        ["git", "-C", deploy_path, "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10,
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def changed_files(deploy_path: str, old_commit: str, new_commit: str) -> Optional[list[str]]:
+    """Paths changed between two commits, or None if the diff is unavailable (e.g. old commit gone)."""
+    result = subprocess.run(
+        ["git", "-C", deploy_path, "diff", "--name-only", old_commit, new_commit],
+        capture_output=True, text=True, timeout=30,
+    )
+    if result.returncode != 0:
+        logger.debug("git diff %s..%s failed: %s", old_commit[:12], new_commit[:12], result.stderr)
+        return None
+    return [line for line in result.stdout.splitlines() if line]
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class DeployIndexStore:
+    """
+    Holds the DeployIndex for the current HEAD commit. The repo is parsed once per
+    commit and the result is written to `snapshot_path`, so a restart on an unchanged
+    checkout loads the snapshot instead of re-parsing every YAML file. When HEAD
+    advances, only the apps touched by `git diff --name-only` are re-parsed.
+    """
+
+    def __init__(self, snapshot_path: str):
+        self._snapshot_path = snapshot_path
+        self._lock = threading.Lock()
+        self._index: Optional[DeployIndex] = self._load_snapshot()
+
+    @property
+    def current(self) -> Optional[DeployIndex]:
+        return self._index
+
+    def get(self, deploy_path: str) -> DeployIndex:
+        """Return the index for the checkout's HEAD (caller holds the repo lock)."""
+        commit = head_commit(deploy_path) or ""
+        with self._lock:
+            if self._index is not None and commit and self._index.commit == commit:
+                return self._index
+            changed = None
+            if self._index is not None and self._index.commit and commit:
+                changed = changed_files(deploy_path, self._index.commit, commit)
+            if changed is not None:
+                index = update_index(deploy_path, self._index, commit, changed)
+                logger.info("Updated deploy index %s..%s (%d files changed)",
+                            self._index.commit[:12], commit[:12], len(changed))
+            else:
+                index = build_index(deploy_path, commit)
+                logger.info("Built deploy index for %s (%d apps)", commit[:12] or "unknown commit", len(index.apps))
+            self._index = index
+            if commit:
+                self._save_snapshot(index)
+            return index
+
+    def _load_snapshot(self) -> Optional[DeployIndex]:
+        if not os.path.isfile(self._snapshot_path):
+            return None
+        try:
+            with open(self._snapshot_path, "r", encoding="utf-8") as f:
+                index = DeployIndex.from_dict(json.load(f))
+            logger.info("Loaded deploy index snapshot for %s", index.commit[:12])
+            return index
+        except Exception as e:
+            logger.warning("Ignoring unreadable deploy index snapshot %s: %s", self._snapshot_path, str(e))
+            return None
+
+    def _save_snapshot(self, index: DeployIndex):
+        tmp_path = f"{self._snapshot_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._snapshot_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index.to_dict(), f)
+            os.replace(tmp_path, self._snapshot_path)
+        except Exception as e:
+            logger.warning("Failed to write deploy index snapshot %s: %s", self._snapshot_path, str(e))
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+RESYNC = {"type": "resync"}
+
+
+class EventHub:
+    """
+    Fan-out from worker threads to async subscribers (WebSocket handlers).
+
+    publish() may be called from any thread; each subscriber gets its own bounded
+    asyncio.Queue on its event loop. A subscriber that falls `maxsize` messages behind
+    has its backlog replaced by a single RESYNC message, telling it to re-fetch.
+    """
+
+    def __init__(self, maxsize: int = 100):
+        self._maxsize = maxsize
+        self._subscribers: dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register the calling coroutine's loop; pair with unsubscribe() in a finally block."""
+        queue: asyncio.Queue = asyncio.Queue(self._maxsize)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, message: Any):
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, message)
+            except RuntimeError:
+                # Loop closed without unsubscribing
+                self.unsubscribe(queue)
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, message: Any):
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC)
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import logging
+import ssl
+from typing import Optional
+
+from fastapi import WebSocket
+from kubernetes import client
+from websockets.asyncio.client import ClientConnection, connect
+
+logger = logging.getLogger(__name__)
+
+# Kubernetes remotecommand channels: the first byte of every binary frame
+STDIN, STDOUT, STDERR, ERROR, RESIZE = 0, 1, 2, 3, 4
+SUBPROTOCOLS = ["v5.channel.k8s.io", "v4.channel.k8s.io"]
+
+
+def _ssl_context(configuration: client.Configuration) -> Optional[ssl.SSLContext]:
+    if not configuration.host.startswith("https"):
+        return None
+    if configuration.verify_ssl:
+        ctx = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if configuration.assert_hostname is False:
+            ctx.check_hostname = False
+    else:
+        ctx = ssl.create_default_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    if configuration.cert_file:
+        ctx.load_cert_chain(configuration.cert_file, configuration.key_file)
+    return ctx
+
+
+async def open_exec(api_client: client.ApiClient, namespace: str, pod: str, container: str,
+                    command: list[str], tty: bool = True) -> ClientConnection:
+    """
+    Open a pod exec session as an asyncio websocket. The URL and auth headers come from the
+    API client (so token refresh hooks still apply); frames are then read as they arrive,
+    without a thread or polling per session.
+    """
+    query = [("container", container), ("stdin", "true"), ("stdout", "true"),
+             ("stderr", str(not tty).lower()), ("tty", str(tty).lower())]
+    query += [("command", c) for c in command]
+    _, url, headers, _, _ = api_client.param_serialize(
+        "GET", "/api/v1/namespaces/{namespace}/pods/{name}/exec",
+        path_params={"namespace": namespace, "name": pod},
+        query_params=query,
+        auth_settings=["BearerToken"],
+    )
+    configuration = api_client.configuration
+    ctx = _ssl_context(configuration)
+    kwargs = {}
+    if ctx is not None:
+        kwargs["ssl"] = ctx
+        if configuration.tls_server_name:
+            kwargs["server_hostname"] = configuration.tls_server_name
+    return await connect(
+        "ws" + url.removeprefix("http"),
+        subprotocols=SUBPROTOCOLS,
+        additional_headers={k: v for k, v in headers.items() if k.lower() == "authorization"},
+        compression=None,
+        proxy=configuration.proxy or None,
+        open_timeout=15,
+        **kwargs,
+    )
+
+
+async def bridge(ws: WebSocket, k8s_ws: ClientConnection):
+    """
+    Relay one exec session until either side closes.
+
+    Browser -> pod: binary frames are stdin as-is; text frames are JSON control messages,
+    {"type": "resize", "cols", "rows"} or {"type": "stdin", "data"}. Pod -> browser:
+    stdout/stderr bytes go out as binary frames without decoding; the command's exit
+    status is sent as a text frame {"type": "exit", "status", "message"}.
+    """
+
+    async def pod_to_browser():
+        async for frame in k8s_ws:
+            data = frame if isinstance(frame, bytes) else frame.encode()
+            if len(data) < 2:
+                continue
+            channel, payload = data[0], data[1:]
+            if channel in (STDOUT, STDERR):
+                await ws.send_bytes(payload)
+            elif channel == ERROR:  # other channels (v5 stream close) carry nothing to show
+                try:
+                    status = json.loads(payload)
+                except ValueError:
+                    status = {"status": "Failure", "message": payload.decode(errors="replace")}
+                await ws.send_json({
+                    "type": "exit", "status": status.get("status"), "message": status.get("message", ""),
+                })
+
+    async def browser_to_pod():
+        while True:
+            message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            if message.get("bytes") is not None:
+                await k8s_ws.send(bytes([STDIN]) + message["bytes"])
+                continue
+            text = message.get("text") or ""
+            try:
+                control = json.loads(text)
+            except ValueError:
+                control = None
+            kind = control.get("type") if isinstance(control, dict) else None
+            if kind == "resize":
+                size = {"Width": int(control.get("cols", 80)), "Height": int(control.get("rows", 24))}
+                await k8s_ws.send(bytes([RESIZE]) + json.dumps(size).encode())
+            elif kind == "stdin":
+                await k8s_ws.send(bytes([STDIN]) + str(control.get("data", "")).encode())
+            else:
+                # Plain text (older clients) is stdin
+                await k8s_ws.send(bytes([STDIN]) + text.encode())
+
+    tasks = [asyncio.create_task(pod_to_browser()), asyncio.create_task(browser_to_pod())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() and not isinstance(task.exception(), asyncio.CancelledError):
+                logger.debug("Exec bridge closed: %s", str(task.exception()))
+    finally:
+        for task in tasks:
+            task.cancel()
+        await k8s_ws.close()
@@ -0,0 +1,137 @@
+import logging
+import subprocess
+import threading
+from typing import Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobOutput:
+    """Append-only output of one job. Readers block in wait() until there is new text or the job ends."""
+
+    def __init__(self):
+        self._text = ""
+        self._status = "queued"
+        self._cond = threading.Condition()
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @property
+    def finished(self) -> bool:
+        return self._status in ("success", "failed")
+
+    def write(self, text: str):
+        with self._cond:
+            self._text += text
+            self._cond.notify_all()
+
+    def set_status(self, status: str):
+        with self._cond:
+            self._status = status
+            self._cond.notify_all()
+
+    def wait(self, offset: int, timeout: float) -> tuple[str, bool]:
+        """Return (text after offset, finished), waiting up to timeout for something new."""
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._text) > offset or self.finished, timeout)
+            return self._text[offset:], self.finished
+
+
+def run_streaming(cmd: list[str], cwd: str, output: JobOutput, timeout: float) -> int:
+    """Run a command, streaming merged stdout/stderr into output line by line. Returns the exit code."""
+    proc = subprocess.Popen(
+        cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, bufsize=1, errors="replace",
+    )
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            output.write(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+    if returncode < 0:
+        output.write(f"\nKilled after {timeout:.0f}s timeout\n")
+    return returncode
+
+
+class JobRunner:
+    """
+    Runs jobs in background threads. Jobs sharing a key run one at a time, in submission
+    order. Output is kept in memory for live streaming and handed to `persist`
+    (job_id, status, log) on every status change and at most every `persist_interval`
+    seconds while running.
+    """
+
+    def __init__(self, persist: Callable[[int, str, str], None], persist_interval: float = 2.0, keep_finished: int = 50):
+        self._persist = persist
+        self._persist_interval = persist_interval
+        self._keep_finished = keep_finished
+        self._outputs: dict[int, JobOutput] = {}
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def output(self, job_id: int) -> Optional[JobOutput]:
+        return self._outputs.get(job_id)
+
+    def busy(self, key: Hashable) -> bool:
+        lock = self._key_locks.get(key)
+        return bool(lock and lock.locked())
+
+    def submit(self, job_id: int, key: Hashable, work: Callable[[JobOutput], bool]) -> JobOutput:
+        output = JobOutput()
+        with self._lock:
+            self._outputs[job_id] = output
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+            self._prune()
+        threading.Thread(
+            target=self._run, args=(job_id, key_lock, work, output), name=f"job-{job_id}", daemon=True,
+        ).start()
+        return output
+
+    def _run(self, job_id: int, key_lock: threading.Lock, work: Callable[[JobOutput], bool], output: JobOutput):
+        with key_lock:
+            self._set_status(job_id, output, "running")
+            stop = threading.Event()
+            flusher = threading.Thread(target=self._flush_loop, args=(job_id, output, stop), daemon=True)
+            flusher.start()
+            try:
+                success = work(output)
+            except Exception as e:
+                logger.exception("Job %s failed", job_id)
+                output.write(f"\nError: {e}\n")
+                success = False
+            finally:
+                stop.set()
+                flusher.join()
+            self._set_status(job_id, output, "success" if success else "failed")
+
+    def _flush_loop(self, job_id: int, output: JobOutput, stop: threading.Event):
+        persisted = len(output.text)
+        while not stop.wait(self._persist_interval):
+            if len(output.text) != persisted:
+                persisted = len(output.text)
+                self._safe_persist(job_id, output.status, output.text)
+
+    def _set_status(self, job_id: int, output: JobOutput, status: str):
+        # Persist before notifying readers so a client that sees the end can re-read the final row
+        self._safe_persist(job_id, status, output.text)
+        output.set_status(status)
+
+    def _safe_persist(self, job_id: int, status: str, log: str):
+        try:
+            self._persist(job_id, status, log)
+        except Exception as e:
+            logger.warning("Failed to persist job %s: %s", job_id, str(e))
+
+    def _prune(self):
+        finished = [job_id for job_id, out in self._outputs.items() if out.finished]
+        for job_id in sorted(finished)[:-self._keep_finished or None]:
+            del self._outputs[job_id]
@@ -1,10 +1,27 @@
+import hashlib
+import json
 import logging
-from typing import Optional
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
 
 from kubernetes import client, config
+from kubernetes.client.exceptions import ApiException
+
+from config import K8S_KUBECONFIG_CHECK_INTERVAL, K8S_POOL_MAXSIZE, KUBECONFIG_PATH
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional; several times faster than json on large list responses
+    json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Ask for metadata only; servers that can't convert fall back to full objects
+METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+
 
 def parse_cpu(cpu_str: str) -> int:
     """Convert CPU string to millicores. '1' -> 1000, '500m' -> 500, '100n' -> 0"""
@@ -35,45 +52,250 @@ def parse_memory(mem_str: str) -> int:
     return int(mem_str)
 
 
+@dataclass
+class _ClientEntry:
+    api_client: client.ApiClient
+    created_at: float
+    apis: dict[type, Any] = field(default_factory=dict)
+
+
 class K8sClientManager:
-    """Manages Kubernetes API clients for multiple clusters."""
+    """
+    Manages Kubernetes API clients for multiple clusters.
+
+    Clients are built once per context under a per-context lock, so concurrent first
+    requests from the threadpool share one client instead of racing to build several.
+    Each client's urllib3 pool keeps up to `pool_maxsize` connections alive, and the
+    API wrappers (CoreV1Api, ...) are cached with it. At most every `check_interval`
+    seconds the kubeconfig's mtime and size are checked; when its content hash changed,
+    every context is rebuilt on next use. Replaced clients keep serving requests already
+    in flight and are closed `retire_after` seconds later.
+    """
 
-    def __init__(self, kubeconfig_path: str):
+    def __init__(self, kubeconfig_path: str, pool_maxsize: Optional[int] = None,
+                 check_interval: float = 2, retire_after: float = 300):
         self._kubeconfig = kubeconfig_path
-        self._clients: dict[str, client.ApiClient] = {}
+        self._pool_maxsize = pool_maxsize
+        self._check_interval = check_interval
+        self._retire_after = retire_after
+        self._clients: dict[str, _ClientEntry] = {}
+        self._build_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._retired: list[tuple[float, client.ApiClient]] = []
+        self._stat: Optional[tuple[int, int]] = None
+        self._digest: Optional[str] = None
+        self._checked_at = float("-inf")
+        self._generation = 0
 
-    def _get_client(self, context_name: str) -> client.ApiClient:
-        if context_name not in self._clients:
-            api_client = config.new_client_from_config(
+    # -- kubeconfig change detection ----------------------------------------
+
+    def _kubeconfig_digest(self) -> Optional[str]:
+        try:
+            with open(self._kubeconfig, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def _check_kubeconfig(self):
+        """Drop every client if the kubeconfig changed since they were built."""
+        now = time.monotonic()
+        if now - self._checked_at < self._check_interval:
+            return
+        with self._lock:
+            if now - self._checked_at < self._check_interval:
+                return
+            self._checked_at = now
+            expired = [c for deadline, c in self._retired if deadline <= now]
+            self._retired = [(deadline, c) for deadline, c in self._retired if deadline > now]
+            self._reload_if_changed(now)
+        for c in expired:
+            c.close()
+
+    def _reload_if_changed(self, now: float):
+        try:
+            st = os.stat(self._kubeconfig)
+            stat = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stat = None
+        if stat == self._stat:
+            return
+        self._stat = stat
+        # Touched or rewritten with the same content (e.g. a configmap resync) is not a change
+        digest = self._kubeconfig_digest()
+        if digest == self._digest:
+            return
+        if self._clients:
+            logger.info("Kubeconfig %s changed, rebuilding %d client(s)", self._kubeconfig, len(self._clients))
+        self._digest = digest
+        self._generation += 1
+        self._retired.extend((now + self._retire_after, e.api_client) for e in self._clients.values())
+        self._clients = {}
+
+    # -- clients --------------------------------------------------------------
+
+    def _build_client(self, context_name: str) -> client.ApiClient:
+        configuration = client.Configuration()
+        if not context_name and not os.path.isfile(self._kubeconfig):
+            config.load_incluster_config(client_configuration=configuration)
+        else:
+            config.load_kube_config(
                 config_file=self._kubeconfig,
-                context=context_name,
+                context=context_name or None,
+                client_configuration=configuration,
             )
-            self._clients[context_name] = api_client
-        return self._clients[context_name]
+        if self._pool_maxsize:
+            # Read by the REST client when it creates its pool manager
+            configuration.connection_pool_maxsize = self._pool_maxsize
+        return client.ApiClient(configuration)
+
+    def _entry(self, context_name: str) -> _ClientEntry:
+        self._check_kubeconfig()
+        entry = self._clients.get(context_name)
+        if entry is not None:
+            return entry
+        with self._lock:
+            build_lock = self._build_locks.setdefault(context_name, threading.Lock())
+        # Only requests for the same context wait on a build (exec auth plugins can be slow)
+        with build_lock:
+            entry = self._clients.get(context_name)
+            if entry is None:
+                generation = self._generation
+                entry = _ClientEntry(self._build_client(context_name), time.time())
+                with self._lock:
+                    if generation == self._generation:
+                        self._clients[context_name] = entry
+                    else:
+                        # The kubeconfig changed while building: serve this request, rebuild on the next
+                        self._retired.append((time.monotonic() + self._retire_after, entry.api_client))
+        return entry
+
+    def _get_client(self, context_name: str) -> client.ApiClient:
+        """Return the client for a context. An empty context means the kubeconfig's
+        current-context, or the in-cluster service account when no kubeconfig exists."""
+        return self._entry(context_name).api_client
+
+    def _api(self, context: str, api_class: type):
+        entry = self._entry(context)
+        api = entry.apis.get(api_class)
+        if api is None:
+            # Wrappers hold no state besides the client; a duplicate from a race is harmless
+            api = entry.apis.setdefault(api_class, api_class(entry.api_client))
+        return api
+
+    def api_client(self, context: str) -> client.ApiClient:
+        return self._get_client(context)
 
     def core_v1(self, context: str) -> client.CoreV1Api:
-        return client.CoreV1Api(self._get_client(context))
+        return self._api(context, client.CoreV1Api)
 
     def apps_v1(self, context: str) -> client.AppsV1Api:
-        return client.AppsV1Api(self._get_client(context))
+        return self._api(context, client.AppsV1Api)
 
     def custom_objects(self, context: str) -> client.CustomObjectsApi:
-        return client.CustomObjectsApi(self._get_client(context))
+        return self._api(context, client.CustomObjectsApi)
+
+    def probe(self, context: str, timeout: float = 5):
+        """Raise unless the API server answers GET /livez (or /version where /livez is
+        forbidden or missing). Neither call touches etcd, unlike listing objects."""
+        api_client = self._get_client(context)
+        method, url, headers, body, post_params = api_client.param_serialize(
+            "GET", "/livez", header_params={"Accept": "text/plain"}, auth_settings=["BearerToken"],
+        )
+        resp = api_client.call_api(method, url, headers, body, post_params, _request_timeout=timeout)
+        resp.read()
+        if resp.status in (401, 403, 404):
+            client.VersionApi(api_client).get_code(_request_timeout=timeout)
+        elif not 200 <= resp.status <= 299:
+            raise ApiException(http_resp=resp)
+
+    def iter_pod_metadata(self, context: str, page_size: int = 500, timeout: float = 30) -> Iterator[dict]:
+        """Yield the metadata dict of every pod in the cluster, one `page_size` page in memory at a time.
+        Pages are fetched as raw PartialObjectMetadataList JSON, skipping client model deserialization."""
+        core = self.core_v1(context)
+        _continue = None
+        while True:
+            kwargs = {"limit": page_size, "_request_timeout": timeout}
+            if _continue:
+                kwargs["_continue"] = _continue
+            resp = core.list_pod_for_all_namespaces(
+                _preload_content=False, _headers={"Accept": METADATA_ACCEPT}, **kwargs,
+            )
+            try:
+                page = json_loads(resp.data)
+            finally:
+                resp.release_conn()
+            for item in page.get("items") or []:
+                yield item.get("metadata") or {}
+            _continue = (page.get("metadata") or {}).get("continue")
+            if not _continue:
+                return
+
+    def list_raw(self, context: str, api_class: type, method: str, *args, **kwargs) -> dict:
+        """Call a list method of `api_class` and return the response as plain JSON (camelCase keys,
+        timestamps as strings), skipping client model deserialization. Raises ApiException like
+        the model-returning call."""
+        resp = getattr(self._api(context, api_class), method)(*args, _preload_content=False, **kwargs)
+        try:
+            return json_loads(resp.data)
+        finally:
+            resp.release_conn()
 
-    def test_connection(self, context: str) -> bool:
+    def test_connection(self, context: str, timeout: float = 5) -> bool:
         try:
-            self.core_v1(context).list_namespace(_request_timeout=5)
+            self.probe(context, timeout)
             return True
         except Exception as e:
             logger.warning("Connection test failed for %s: %s", context, e)
             return False
 
+    def stats(self) -> dict:
+        """Connection pool utilization per context, for spotting undersized pools."""
+        with self._lock:
+            entries = dict(self._clients)
+            generation = self._generation
+            retired = len(self._retired)
+        contexts = {}
+        for name, entry in entries.items():
+            pools = []
+            manager = entry.api_client.rest_client.pool_manager
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None or pool.pool is None:
+                    continue
+                # The queue holds idle connections plus unused (None) slots
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+                free_slots = pool.pool.qsize()
+                pools.append({
+                    "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                    "maxsize": pool.pool.maxsize,
+                    "inUse": pool.pool.maxsize - free_slots,
+                    "idle": idle,
+                    "connectionsCreated": pool.num_connections,
+                    "requests": pool.num_requests,
+                })
+            contexts[name or "(default)"] = {
+                "createdAt": entry.created_at,
+                "poolMaxsize": entry.api_client.configuration.connection_pool_maxsize,
+                "pools": pools,
+            }
+        return {"kubeconfigGeneration": generation, "retiredClients": retired, "contexts": contexts}
+
     def close_client(self, context: str):
-        c = self._clients.pop(context, None)
-        if c:
-            c.close()
+        with self._lock:
+            entry = self._clients.pop(context, None)
+        if entry:
+            entry.api_client.close()
 
     def close_all(self):
-        for c in self._clients.values():
+        with self._lock:
+            clients = [e.api_client for e in self._clients.values()] + [c for _, c in self._retired]
+            self._clients = {}
+            self._retired = []
+        for c in clients:
             c.close()
-        self._clients.clear()
+
+
+# Shared by every router so each context gets one connection pool and one kubeconfig watcher
+k8s_manager = K8sClientManager(
+    KUBECONFIG_PATH, pool_maxsize=K8S_POOL_MAXSIZE, check_interval=K8S_KUBECONFIG_CHECK_INTERVAL,
+)
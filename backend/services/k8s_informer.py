@@ -0,0 +1,285 @@
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from kubernetes import watch
+from kubernetes.client.exceptions import ApiException
+
+from services.k8s_client import K8sClientManager
+
+logger = logging.getLogger(__name__)
+
+# kind -> (K8sClientManager accessor, cluster-wide list method)
+KINDS = {
+    "nodes": ("core_v1", "list_node"),
+    "namespaces": ("core_v1", "list_namespace"),
+    "deployments": ("apps_v1", "list_deployment_for_all_namespaces"),
+}
+
+Handler = Callable[[str, Any], None]
+
+# Revisions are unique across informers, so a recreated informer never reuses one
+_revisions = itertools.count(1)
+
+
+def object_key(obj) -> tuple[str, str]:
+    return obj.metadata.namespace or "", obj.metadata.name
+
+
+class Informer:
+    """
+    In-memory list+watch cache of one resource kind.
+
+    The initial list is paged (`page_size` per request) and every `resync_period`
+    seconds the cache is rebuilt from a fresh list, so missed deletes cannot linger.
+    Between lists a watch applies ADDED/MODIFIED/DELETED events; an expired
+    resourceVersion (410 Gone) triggers an immediate relist, other errors back off.
+
+    Handlers get (event_type, object) for every change. After a relist they get
+    "SYNC" for every listed object and "DELETED" for objects that vanished meanwhile.
+    """
+
+    def __init__(self, name: str, list_func: Callable[[], Callable], resync_period: float = 600,
+                 watch_timeout: int = 300, page_size: int = 500, max_backoff: float = 60):
+        self.name = name
+        self._list_func = list_func  # returns the bound list method; re-resolved per (re)list
+        self._resync_period = resync_period
+        self._watch_timeout = watch_timeout
+        self._page_size = page_size
+        self._max_backoff = max_backoff
+        self._store: dict[tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+        self._handlers: list[Handler] = []
+        self._synced = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[watch.Watch] = None
+        self._listed_at = 0.0
+        self._revision = next(_revisions)  # changes with every change to the store
+        self._last_error: Optional[str] = None
+        self.last_access = time.monotonic()
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def add_handler(self, handler: Handler):
+        self._handlers.append(handler)
+
+    @property
+    def has_handlers(self) -> bool:
+        return bool(self._handlers)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=f"informer-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._watch:
+            self._watch.stop()
+
+    # -- readers -----------------------------------------------------------
+
+    @property
+    def synced(self) -> bool:
+        return self._synced.is_set()
+
+    def wait_synced(self, timeout: float) -> bool:
+        # Don't make readers wait on an informer that is failing before its first sync
+        if self._last_error and not self.synced:
+            return False
+        return self._synced.wait(timeout)
+
+    def list(self) -> list:
+        self.last_access = time.monotonic()
+        with self._lock:
+            return list(self._store.values())
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    def snapshot(self) -> tuple[int, list]:
+        """(revision, objects): the revision changes whenever the cached set does."""
+        self.last_access = time.monotonic()
+        with self._lock:
+            return self._revision, list(self._store.values())
+
+    def get(self, namespace: str, name: str) -> Optional[Any]:
+        self.last_access = time.monotonic()
+        with self._lock:
+            return self._store.get((namespace or "", name))
+
+    # -- list + watch ------------------------------------------------------
+
+    def _loop(self):
+        backoff = 1.0
+        resource_version = None
+        while not self._stop.is_set():
+            try:
+                if resource_version is None or time.monotonic() - self._listed_at > self._resync_period:
+                    resource_version = self._relist()
+                resource_version = self._watch_from(resource_version)
+                backoff = 1.0
+            except ApiException as e:
+                resource_version = None
+                self._last_error = f"{e.status} {e.reason}"
+                if e.status == 410:
+                    logger.info("Informer %s: resourceVersion expired, relisting", self.name)
+                    # Relist right away, unless the fresh list's resourceVersion was rejected too
+                    if time.monotonic() - self._listed_at > backoff:
+                        continue
+                logger.warning("Informer %s failed (%s): %s", self.name, e.status, e.reason)
+                self._stop.wait(self._max_backoff if e.status in (401, 403) else backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+            except Exception as e:
+                resource_version = None
+                self._last_error = str(e)
+                logger.warning("Informer %s failed: %s", self.name, str(e))
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+
+    def _relist(self) -> str:
+        list_func = self._list_func()
+        store: dict[tuple[str, str], Any] = {}
+        resource_version = None
+        _continue = None
+        while True:
+            kwargs = {"limit": self._page_size, "_request_timeout": 60}
+            if _continue:
+                kwargs["_continue"] = _continue
+            page = list_func(**kwargs)
+            # Every page is served from the snapshot of the first one
+            resource_version = resource_version or page.metadata.resource_version
+            for obj in page.items:
+                store[object_key(obj)] = obj
+            _continue = page.metadata._continue
+            if not _continue:
+                break
+
+        with self._lock:
+            gone = [obj for key, obj in self._store.items() if key not in store]
+            self._store = store
+            self._revision = next(_revisions)
+        self._listed_at = time.monotonic()
+        self._last_error = None
+        self._synced.set()
+        logger.info("Informer %s: listed %d objects at %s", self.name, len(store), resource_version)
+
+        for obj in gone:
+            self._emit("DELETED", obj)
+        for obj in store.values():
+            self._emit("SYNC", obj)
+        return resource_version
+
+    def _watch_from(self, resource_version: str) -> str:
+        """Apply events until the server closes the watch; returns the last seen resourceVersion."""
+        self._watch = watch.Watch()
+        # Watch no longer than the time left until the next resync
+        timeout = int(max(1, min(self._watch_timeout, self._resync_period - (time.monotonic() - self._listed_at))))
+        try:
+            # ERROR events (including 410 Gone) are raised by the stream as ApiException
+            for event in self._watch.stream(
+                self._list_func(),
+                resource_version=resource_version,
+                timeout_seconds=timeout,
+                allow_watch_bookmarks=True,
+                _request_timeout=timeout + 30,
+            ):
+                if self._stop.is_set():
+                    break
+                event_type, obj = event["type"], event["object"]
+                if event_type == "BOOKMARK":
+                    continue
+                with self._lock:
+                    if event_type == "DELETED":
+                        self._store.pop(object_key(obj), None)
+                    else:
+                        self._store[object_key(obj)] = obj
+                    self._revision = next(_revisions)
+                self._emit(event_type, obj)
+        finally:
+            self._watch.stop()
+        # Tracks both object and bookmark resourceVersions
+        return self._watch.resource_version or resource_version
+
+    def _emit(self, event_type: str, obj):
+        for handler in self._handlers:
+            try:
+                handler(event_type, obj)
+            except Exception:
+                logger.exception("Informer %s: handler failed", self.name)
+
+
+class InformerManager:
+    """
+    Informers per (context, kind), started on first use. Informers without handlers
+    that nobody has read for `idle_timeout` seconds are stopped, so contexts that are
+    no longer viewed don't keep watches open.
+    """
+
+    def __init__(self, k8s: K8sClientManager, resync_period: float = 600, idle_timeout: float = 900,
+                 sync_wait: float = 3):
+        self._k8s = k8s
+        self._resync_period = resync_period
+        self._idle_timeout = idle_timeout
+        self._sync_wait = sync_wait
+        self._informers: dict[tuple[str, str], Informer] = {}
+        self._lock = threading.Lock()
+
+    def informer(self, context: str, kind: str) -> Informer:
+        accessor, method = KINDS[kind]
+        with self._lock:
+            self._reap_idle()
+            inf = self._informers.get((context, kind))
+            if inf is None:
+                inf = Informer(
+                    f"{context or 'default'}/{kind}",
+                    lambda: getattr(getattr(self._k8s, accessor)(context), method),
+                    resync_period=self._resync_period,
+                )
+                self._informers[(context, kind)] = inf
+                inf.start()
+        return inf
+
+    def cached_list(self, context: str, kind: str) -> Optional[list]:
+        """Objects from the informer cache, or None if it could not sync within sync_wait (caller lists directly)."""
+        inf = self.informer(context, kind)
+        if inf.wait_synced(self._sync_wait):
+            return inf.list()
+        return None
+
+    def synced_informer(self, context: str, kind: str) -> Optional[Informer]:
+        """The informer once synced (within sync_wait), for callers that derive views from its snapshots."""
+        inf = self.informer(context, kind)
+        return inf if inf.wait_synced(self._sync_wait) else None
+
+    def cached_get(self, context: str, kind: str, namespace: str, name: str) -> tuple[bool, Optional[Any]]:
+        """(synced, object): object is None when the synced cache doesn't have it."""
+        inf = self.informer(context, kind)
+        if inf.wait_synced(self._sync_wait):
+            return True, inf.get(namespace, name)
+        return False, None
+
+    def peek(self, context: str, kind: str) -> Optional[list]:
+        """Cached objects only if that informer is already running and synced; never starts one."""
+        inf = self._informers.get((context, kind))
+        return inf.list() if inf and inf.synced else None
+
+    def _reap_idle(self):
+        now = time.monotonic()
+        for key, inf in list(self._informers.items()):
+            if not inf.has_handlers and now - inf.last_access > self._idle_timeout:
+                logger.info("Stopping idle informer %s", inf.name)
+                inf.stop()
+                del self._informers[key]
+
+    def stop_all(self):
+        with self._lock:
+            for inf in self._informers.values():
+                inf.stop()
+            self._informers.clear()
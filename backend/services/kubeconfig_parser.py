@@ -1,51 +1,106 @@
+import hashlib
 import logging
+import os
+import threading
+from dataclasses import dataclass, field
 from typing import Optional
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# libyaml's loader is several times faster on large kubeconfigs (embedded CA data)
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass
+class _Parsed:
+    config: dict = field(default_factory=dict)
+    contexts: list[dict] = field(default_factory=list)
+    contexts_by_name: dict[str, dict] = field(default_factory=dict)
+    clusters_by_name: dict[str, dict] = field(default_factory=dict)
+
+
+def _index(config: dict) -> _Parsed:
+    parsed = _Parsed(config=config)
+    for ctx in config.get("contexts") or []:
+        info = {
+            "name": ctx["name"],
+            "cluster": ctx["context"]["cluster"],
+            "user": ctx["context"].get("user", ""),
+            "namespace": ctx["context"].get("namespace", "default"),
+        }
+        parsed.contexts.append(info)
+        parsed.contexts_by_name[info["name"]] = info
+    for cluster in config.get("clusters") or []:
+        c = cluster.get("cluster", {})
+        # First entry wins, like the linear scan this replaces
+        parsed.clusters_by_name.setdefault(cluster["name"], {
+            "server": c.get("server", ""),
+            "certificate_authority": c.get("certificate-authority-data", ""),
+            "insecure_skip_tls": c.get("insecure-skip-tls-verify", False),
+        })
+    return parsed
+
 
 class KubeconfigParser:
+    """
+    Parsed kubeconfig with contexts and clusters indexed by name.
+
+    Every read stats the file and re-parses only when its mtime, size or inode changed
+    and the content hash differs, so per-request calls cost a stat instead of a YAML
+    parse. If a changed file fails to parse (e.g. caught mid-write), the previous
+    document keeps being served and the next read retries.
+    """
+
     def __init__(self, kubeconfig_path: str):
         self._path = kubeconfig_path
-        self._config: dict = {}
+        self._parsed: Optional[_Parsed] = None
+        self._stat: Optional[tuple[int, int, int]] = None
+        self._digest: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _current(self) -> _Parsed:
+        st = os.stat(self._path)
+        stat = (st.st_mtime_ns, st.st_size, st.st_ino)
+        parsed = self._parsed
+        if parsed is not None and stat == self._stat:
+            return parsed
+        with self._lock:
+            if self._parsed is not None and stat == self._stat:
+                return self._parsed
+            with open(self._path, "rb") as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if self._parsed is None or digest != self._digest:
+                try:
+                    parsed = _index(yaml.load(data, Loader=_Loader) or {})
+                except Exception as e:
+                    if self._parsed is None:
+                        raise
+                    logger.warning("Failed to reload kubeconfig %s, keeping the previous one: %s", self._path, e)
+                    return self._parsed
+                if self._parsed is not None:
+                    logger.info("Kubeconfig %s reloaded (%d contexts)", self._path, len(parsed.contexts))
+                self._parsed = parsed
+                self._digest = digest
+            self._stat = stat
+            return self._parsed
 
     def load_config(self) -> dict:
-        with open(self._path, "r") as f:
-            self._config = yaml.safe_load(f)
-        return self._config
+        return self._current().config
 
     def get_contexts(self) -> list[dict]:
-        if not self._config:
-            self.load_config()
-        contexts = []
-        for ctx in self._config.get("contexts", []):
-            contexts.append({
-                "name": ctx["name"],
-                "cluster": ctx["context"]["cluster"],
-                "user": ctx["context"].get("user", ""),
-                "namespace": ctx["context"].get("namespace", "default"),
-            })
-        return contexts
+        return list(self._current().contexts)
+
+    def get_context(self, context_name: str) -> Optional[dict]:
+        return self._current().contexts_by_name.get(context_name)
 
     def get_cluster_info(self, cluster_name: str) -> Optional[dict]:
-        if not self._config:
-            self.load_config()
-        for cluster in self._config.get("clusters", []):
-            if cluster["name"] == cluster_name:
-                c = cluster.get("cluster", {})
-                return {
-                    "server": c.get("server", ""),
-                    "certificate_authority": c.get("certificate-authority-data", ""),
-                    "insecure_skip_tls": c.get("insecure-skip-tls-verify", False),
-                }
-        return None
+        return self._current().clusters_by_name.get(cluster_name)
 
     def get_current_context(self) -> str:
-        if not self._config:
-            self.load_config()
-        return self._config.get("current-context", "")
+        return self._current().config.get("current-context", "")
 
     def get_all_context_names(self) -> list[str]:
-        return [ctx["name"] for ctx in self.get_contexts()]
+        return list(self._current().contexts_by_name)
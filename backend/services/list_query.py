@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Optional, Sequence
+
+SortKey = tuple
+
+
+def encode_cursor(key: SortKey) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key), separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """Raises ValueError for cursors this module didn't produce."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("invalid cursor") from e
+    if not isinstance(key, list) or not key:
+        raise ValueError("invalid cursor")
+    return tuple(key)
+
+
+def parse_sort(sort: str, fields: Sequence[str]) -> tuple[str, bool]:
+    """'name' / '-createdAt' -> (field, descending). Raises ValueError for unknown fields."""
+    descending = sort.startswith("-")
+    field = sort.lstrip("-+")
+    if field not in fields:
+        raise ValueError(f"sort must be one of {', '.join(fields)} (prefix - for descending)")
+    return field, descending
+
+
+def paginate(
+    rows: Sequence[Any], key: Callable[[Any], SortKey], descending: bool,
+    limit: Optional[int], cursor: Optional[str],
+) -> tuple[list, Optional[str]]:
+    """
+    Page through rows already sorted ascending by key; returns (page, next_cursor). The
+    cursor is the sort key of the last row returned (keyset pagination), so rows added or
+    removed between requests don't shift later pages the way offsets would. Keys must be
+    unique, e.g. end in (namespace, name).
+    """
+    keys = [key(r) for r in rows]
+    start, end = 0, len(rows)
+    if cursor:
+        after = decode_cursor(cursor)
+        try:
+            if descending:
+                end = bisect_left(keys, after)
+            else:
+                start = bisect_right(keys, after)
+        except TypeError as e:
+            raise ValueError("cursor does not match the sort order") from e
+
+    window = list(rows[start:end])
+    if descending:
+        window.reverse()
+    if limit is None or len(window) <= limit:
+        return window, None
+    page = window[:limit]
+    return page, encode_cursor(key(page[-1]))
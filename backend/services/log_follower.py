@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Any, Optional
+
+from kubernetes import client
+from kubernetes.watch.watch import iter_resp_lines
+
+logger = logging.getLogger(__name__)
+
+
+class LogFollower:
+    """
+    Follow the logs of every container of the pods matching a label selector.
+
+    One thread per container streams `follow=true` logs; a discovery thread re-lists the
+    pods every `discover_interval` seconds, so new pods (scale-up, rollout) are picked up
+    and streams that ended while their pod still runs (container restart) are resumed
+    from where they stopped. Messages go to a bounded asyncio.Queue on the caller's loop;
+    when the consumer is too slow the newest lines are dropped and counted in `dropped`
+    instead of buffering without limit.
+
+    Queue messages: {"type": "log", "pod", "container", "line"} and
+    {"type": "stream", "pod", "container", "state": "started" | "ended"}.
+    """
+
+    def __init__(self, core: client.CoreV1Api, namespace: str, label_selector: str, tail_lines: int = 100,
+                 maxsize: int = 1000, max_streams: int = 100, discover_interval: float = 5):
+        self._core = core
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._tail_lines = tail_lines
+        self._max_streams = max_streams
+        self._discover_interval = discover_interval
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._streams: dict[tuple[str, str], Any] = {}  # (pod, container) -> open response, None while connecting
+        self._ended_at: dict[tuple[str, str], float] = {}
+
+    def start(self):
+        """Call from the consuming coroutine; messages are delivered on its event loop."""
+        self._loop = asyncio.get_running_loop()
+        threading.Thread(target=self._discover_loop, name="logs-discover", daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+        with self._lock:
+            responses = [r for r in self._streams.values() if r is not None]
+        # Closing the connection unblocks followers waiting for the next line
+        for resp in responses:
+            try:
+                resp.close()
+            except Exception:
+                pass
+
+    # -- producer side (worker threads) -----------------------------------
+
+    def _emit(self, message: dict):
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, message)
+        except RuntimeError:
+            # Loop closed: the consumer is gone
+            self._stop.set()
+
+    def _deliver(self, message: dict):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def _discover_loop(self):
+        while not self._stop.is_set():
+            try:
+                pods = self._core.list_namespaced_pod(
+                    self._namespace, label_selector=self._label_selector, _request_timeout=10,
+                ).items
+                for pod in pods:
+                    if pod.status.phase not in ("Running", "Succeeded", "Failed"):
+                        continue  # Pending pods have no logs yet
+                    for container in pod.spec.containers:
+                        # Only running pods can have more output after a stream ends
+                        self._follow(pod.metadata.name, container.name, resume=pod.status.phase == "Running")
+                with self._lock:
+                    names = {pod.metadata.name for pod in pods}
+                    for key in [k for k in self._ended_at if k[0] not in names]:
+                        del self._ended_at[key]
+            except Exception as e:
+                logger.warning("Log follower failed to list pods in %s: %s", self._namespace, str(e))
+            self._stop.wait(self._discover_interval)
+
+    def _follow(self, pod: str, container: str, resume: bool):
+        key = (pod, container)
+        with self._lock:
+            ended_at = self._ended_at.get(key)
+            if key in self._streams or len(self._streams) >= self._max_streams or (ended_at and not resume):
+                return
+            self._streams[key] = None
+        # A resumed stream continues after the previous one; a new one starts with the tail
+        if ended_at is None:
+            kwargs = {"tail_lines": self._tail_lines}
+        else:
+            kwargs = {"since_seconds": max(1, math.ceil(time.monotonic() - ended_at))}
+        threading.Thread(
+            target=self._stream, args=(pod, container, kwargs), name=f"logs-{pod}-{container}", daemon=True,
+        ).start()
+
+    def _stream(self, pod: str, container: str, kwargs: dict):
+        key = (pod, container)
+        resp = None
+        started = False
+        try:
+            resp = self._core.read_namespaced_pod_log(
+                pod, self._namespace, container=container, follow=True, _preload_content=False, **kwargs,
+            )
+            with self._lock:
+                self._streams[key] = resp
+            if self._stop.is_set():
+                return
+            started = True
+            self._emit({"type": "stream", "pod": pod, "container": container, "state": "started"})
+            for line in iter_resp_lines(resp):
+                if self._stop.is_set():
+                    break
+                self._emit({"type": "log", "pod": pod, "container": container, "line": line})
+        except Exception as e:
+            if not self._stop.is_set():
+                logger.info("Log stream %s/%s ended: %s", pod, container, str(e))
+        finally:
+            if resp is not None:
+                resp.release_conn()
+            with self._lock:
+                self._streams.pop(key, None)
+                self._ended_at[key] = time.monotonic()
+            if started and not self._stop.is_set():
+                self._emit({"type": "stream", "pod": pod, "container": container, "state": "ended"})
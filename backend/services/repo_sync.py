@@ -0,0 +1,121 @@
+import logging
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def run_git(args: list[str], cwd: str = None, timeout: int = 120) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], capture_output=True, text=True, cwd=cwd, timeout=timeout)
+
+
+@dataclass
+class _RepoState:
+    lock: threading.RLock = field(default_factory=threading.RLock)
+    generation: int = 0  # completed sync attempts
+    last_sync: float = 0.0  # monotonic time of the last successful sync
+    last_error: Optional[str] = None
+
+
+class RepoSyncManager:
+    """
+    Keeps local git checkouts in sync with their remotes.
+
+    - One RLock per checkout: hold `lock(path)` while reading or modifying the working
+      tree so a concurrent sync cannot reset it underneath you.
+    - Single flight: callers that queue up behind a running sync reuse its result
+      instead of fetching again.
+    - Rate limit: at most one fetch per `min_interval` seconds unless forced.
+    - A cheap `git ls-remote` skips fetch + reset when the remote head hasn't moved.
+    """
+
+    def __init__(self, min_interval: float):
+        self._min_interval = min_interval
+        self._states: dict[str, _RepoState] = {}
+        self._states_lock = threading.Lock()
+
+    def _state(self, local_path: str) -> _RepoState:
+        with self._states_lock:
+            if local_path not in self._states:
+                self._states[local_path] = _RepoState()
+            return self._states[local_path]
+
+    def lock(self, local_path: str) -> threading.RLock:
+        """Per-checkout lock; reentrant so a holder may call sync() itself."""
+        return self._state(local_path).lock
+
+    def sync(self, git_url: str, local_path: str, branch: str = "master", force: bool = False) -> str:
+        """Clone or fast-forward the checkout to origin/{branch}. Returns local_path."""
+        state = self._state(local_path)
+        arrived_at = state.generation
+        with state.lock:
+            if state.generation != arrived_at:
+                # Another caller synced while we waited for the lock: share its result
+                if state.last_error:
+                    raise RuntimeError(state.last_error)
+                return local_path
+            has_checkout = os.path.isdir(os.path.join(local_path, ".git"))
+            if has_checkout and not force and time.monotonic() - state.last_sync < self._min_interval:
+                return local_path
+
+            try:
+                if has_checkout:
+                    self._update(git_url, local_path, branch)
+                else:
+                    self._clone(git_url, local_path, branch)
+                state.last_error = None
+                state.last_sync = time.monotonic()
+            except Exception as e:
+                state.last_error = str(e)
+                raise
+            finally:
+                state.generation += 1
+        return local_path
+
+    def _clone(self, git_url: str, local_path: str, branch: str):
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        result = run_git(["clone", "-b", branch, git_url, local_path])
+        if result.returncode != 0:
+            raise RuntimeError(f"git clone failed: {result.stderr}")
+        logger.info("Cloned repo to %s", local_path)
+
+    def _update(self, git_url: str, local_path: str, branch: str):
+        remote_head = self._remote_head(git_url, branch)
+        if remote_head and remote_head == self._local_head(local_path) and self._is_clean(local_path):
+            logger.debug("Remote head of %s unchanged (%s), skipping fetch", local_path, remote_head[:12])
+            return
+
+        # Fetch latest changes from remote
+        result = run_git(["-C", local_path, "fetch", "--all", "--tags"])
+        if result.returncode != 0:
+            logger.warning("git fetch failed for %s: %s", local_path, result.stderr)
+            # Continue with existing state if fetch fails (network issues, etc.)
+
+        # Reset to match remote branch exactly (discards local changes)
+        result = run_git(["-C", local_path, "reset", "--hard", f"origin/{branch}"])
+        if result.returncode != 0:
+            logger.error("git reset failed for %s: %s", local_path, result.stderr)
+            raise RuntimeError(f"Failed to sync repo: {result.stderr}")
+        logger.info("Synced repo %s to %s", local_path, branch)
+
+    @staticmethod
+    def _remote_head(git_url: str, branch: str) -> Optional[str]:
+        result = run_git(["ls-remote", git_url, f"refs/heads/{branch}"], timeout=30)
+        if result.returncode != 0 or not result.stdout.strip():
+            logger.debug("git ls-remote failed for branch %s: %s", branch, result.stderr)
+            return None
+        return result.stdout.split()[0]
+
+    @staticmethod
+    def _local_head(local_path: str) -> Optional[str]:
+        result = run_git(["-C", local_path, "rev-parse", "HEAD"], timeout=10)
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    @staticmethod
+    def _is_clean(local_path: str) -> bool:
+        result = run_git(["-C", local_path, "status", "--porcelain", "--untracked-files=no"], timeout=10)
+        return result.returncode == 0 and not result.stdout.strip()
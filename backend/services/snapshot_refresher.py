@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Snapshot:
+    data: Any
+    timestamp: float
+    version: int
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.timestamp
+
+
+class SnapshotRefresher:
+    """
+    Rebuilds a snapshot in a background thread, every `interval` seconds and whenever
+    a refresh is requested. Readers always get the last good snapshot immediately;
+    a failed build keeps the previous one. Concurrent refresh requests coalesce:
+    callers that ask while a build is running join that build instead of queueing another.
+    Partial updates published while a build runs are re-applied to its result, so the
+    build can't publish data that predates them.
+    """
+
+    def __init__(self, name: str, build: Callable[[], Any], interval: float):
+        self._name = name
+        self._build = build
+        self._interval = interval
+        self._snapshot: Optional[Snapshot] = None
+        self._cond = threading.Condition()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._refreshing = False
+        self._pending: list[Callable[[Any], Any]] = []  # update() transforms since the running build started
+        self._started_gen = 0  # builds started
+        self._done_gen = 0  # builds finished (success or failure)
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self):
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name=f"{self._name}-refresher", daemon=True)
+            self._thread.start()
+        logger.info("Started %s snapshot refresher (interval: %ss)", self._name, self._interval)
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self):
+        while not self._stop.is_set():
+            # Clear before building so an invalidation arriving mid-build triggers another pass
+            self._wakeup.clear()
+            self._run_build()
+            self._wakeup.wait(self._interval)
+
+    def _run_build(self):
+        with self._cond:
+            self._refreshing = True
+            self._pending = []
+            self._started_gen += 1
+        try:
+            start = time.time()
+            data = self._build()
+            with self._cond:
+                for transform in self._pending:
+                    data = transform(data)
+                version = self._snapshot.version + 1 if self._snapshot else 1
+                self._snapshot = Snapshot(data=data, timestamp=time.time(), version=version)
+            logger.info("Refreshed %s snapshot v%d in %.2fs", self._name, version, time.time() - start)
+        except Exception as e:
+            logger.warning("Failed to refresh %s snapshot, keeping previous: %s", self._name, str(e))
+        finally:
+            with self._cond:
+                self._refreshing = False
+                self._pending = []
+                self._done_gen += 1
+                self._cond.notify_all()
+
+    # -- readers -----------------------------------------------------------
+
+    @property
+    def refreshing(self) -> bool:
+        return self._refreshing
+
+    def get(self) -> Optional[Snapshot]:
+        """Return the last good snapshot without blocking (None before the first build)."""
+        return self._snapshot
+
+    def request_refresh(self):
+        """Schedule a rebuild without waiting for it (cache invalidation)."""
+        self._wakeup.set()
+
+    def update(self, transform: Callable[[Any], Any]) -> Optional[Snapshot]:
+        """
+        Publish transform(current data) as a new version without a full rebuild (partial
+        refresh). The timestamp of the last full build is kept, so `age` never understates
+        how stale the rest of the data is. No-op before the first build.
+
+        While a build is running the transform is also kept and applied to that build's
+        result before it is published, so it must be safe to apply to newer data.
+        """
+        with self._cond:
+            if self._refreshing:
+                self._pending.append(transform)
+            if self._snapshot is None:
+                return None
+            self._snapshot = Snapshot(
+                data=transform(self._snapshot.data),
+                timestamp=self._snapshot.timestamp,
+                version=self._snapshot.version + 1,
+            )
+            return self._snapshot
+
+    def refresh(self, timeout: float = 120) -> Optional[Snapshot]:
+        """Wait for a fresh snapshot, joining the build already in flight if there is one."""
+        self.start()
+        with self._cond:
+            if self._refreshing:
+                target = self._started_gen
+            else:
+                target = self._started_gen + 1
+                self._wakeup.set()
+            self._cond.wait_for(lambda: self._done_gen >= target, timeout)
+            return self._snapshot
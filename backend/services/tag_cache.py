@@ -0,0 +1,128 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from services.repo_sync import run_git
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _TagEntry:
+    refs_hash: str = ""
+    tags: list[dict] = field(default_factory=list)  # [{"tag", "createdAt"}], newest first
+    checked_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class TagCache:
+    """
+    Tag listings per app repo, without cloning a working tree.
+
+    `git ls-remote --tags` decides whether anything changed: the listing is keyed by a
+    hash of the advertised refs and only rebuilt when that hash moves. Creator dates come
+    from a treeless fetch of refs/tags/* into a bare repo under `repos_path`. Within
+    `ttl` seconds of the last check the cached listing is returned without contacting
+    the remote. If that fetch fails, tags are listed by name only, highest version first.
+    """
+
+    def __init__(self, repos_path: str, ttl: float):
+        self._repos_path = repos_path
+        self._ttl = ttl
+        self._entries: dict[str, _TagEntry] = {}
+        self._entries_lock = threading.Lock()
+        self._warming = threading.Lock()
+
+    def _entry(self, app_name: str) -> _TagEntry:
+        with self._entries_lock:
+            if app_name not in self._entries:
+                self._entries[app_name] = _TagEntry()
+            return self._entries[app_name]
+
+    def get_tags(self, app_name: str, git_url: str, force: bool = False) -> list[dict]:
+        entry = self._entry(app_name)
+        with entry.lock:
+            if not force and entry.checked_at and time.monotonic() - entry.checked_at < self._ttl:
+                return entry.tags
+
+            # Version-sorted so the names-only fallback below is already newest first
+            result = run_git(["ls-remote", "--tags", "--sort=-v:refname", git_url], timeout=30)
+            if result.returncode != 0:
+                raise RuntimeError(f"git ls-remote failed: {result.stderr}")
+            refs_hash = hashlib.sha256(result.stdout.encode()).hexdigest()
+
+            if refs_hash != entry.refs_hash:
+                entry.tags = self._list_tags(app_name, git_url, result.stdout)
+                entry.refs_hash = refs_hash
+                logger.info("Refreshed %d tags for %s", len(entry.tags), app_name)
+            entry.checked_at = time.monotonic()
+            return entry.tags
+
+    def _list_tags(self, app_name: str, git_url: str, ls_remote_output: str) -> list[dict]:
+        bare_path = os.path.join(self._repos_path, f"{app_name}.git")
+        if not os.path.isdir(bare_path):
+            os.makedirs(self._repos_path, exist_ok=True)
+            result = run_git(["init", "--bare", "-q", bare_path])
+            if result.returncode != 0:
+                raise RuntimeError(f"git init failed: {result.stderr}")
+
+        # Commits and tag objects only: enough for creator dates, no trees or blobs
+        fetch = ["-C", bare_path, "fetch", "--quiet", "--prune", "--no-tags"]
+        refspec = [git_url, "+refs/tags/*:refs/tags/*"]
+        result = run_git(fetch + ["--filter=tree:0"] + refspec)
+        if result.returncode != 0:
+            logger.debug("Treeless tag fetch failed for %s, retrying without filter: %s", app_name, result.stderr)
+            result = run_git(fetch + refspec)
+
+        if result.returncode == 0:
+            result = run_git([
+                "-C", bare_path, "for-each-ref", "refs/tags",
+                "--sort=-creatordate",
+                "--format=%(refname:short) %(creatordate:iso8601)",
+            ])
+        if result.returncode != 0:
+            logger.warning("Tag dates unavailable for %s, listing names only: %s", app_name, result.stderr)
+            return self._tags_from_ls_remote(ls_remote_output)
+
+        tags = []
+        for line in result.stdout.strip().split("\n"):
+            if not line.strip():
+                continue
+            parts = line.strip().split(" ", 1)
+            tags.append({"tag": parts[0], "createdAt": parts[1] if len(parts) > 1 else ""})
+        return tags
+
+    @staticmethod
+    def _tags_from_ls_remote(output: str) -> list[dict]:
+        """Tag names in ls-remote order (-v:refname, i.e. highest version first); no dates without a fetch."""
+        names = {}
+        for line in output.splitlines():
+            ref = line.split("\t", 1)[-1]
+            if ref.startswith("refs/tags/"):
+                names.setdefault(ref[len("refs/tags/"):].removesuffix("^{}"), None)
+        return [{"tag": name, "createdAt": ""} for name in names]
+
+    def warm(self, repos: dict[str, str], max_workers: int = 4):
+        """Refresh every repo's listing in a background thread (no-op if a warm-up is running)."""
+        if not self._warming.acquire(blocking=False):
+            return
+
+        def _warm_one(item):
+            app_name, git_url = item
+            try:
+                self.get_tags(app_name, git_url)
+            except Exception as e:
+                logger.warning("Failed to warm tags for %s: %s", app_name, str(e))
+
+        def _run():
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(_warm_one, repos.items()))
+            finally:
+                self._warming.release()
+
+        threading.Thread(target=_run, name="tag-warmer", daemon=True).start()
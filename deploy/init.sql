@@ -73,6 +73,22 @@ CREATE INDEX idx_audit_created_at ON audit_logs(created_at);
 CREATE INDEX idx_audit_user_id ON audit_logs(user_id);
 CREATE INDEX idx_audit_menu ON audit_logs(menu);
 
+CREATE TABLE IF NOT EXISTS rollback_jobs (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  app_name VARCHAR(100) NOT NULL,
+  env VARCHAR(50) NOT NULL,
+  target_version VARCHAR(200) NOT NULL,
+  status ENUM('queued','running','success','failed') NOT NULL DEFAULT 'queued',
+  started_by INT NOT NULL,
+  log MEDIUMTEXT,
+  started_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  finished_at DATETIME,
+  FOREIGN KEY (started_by) REFERENCES users(id) ON DELETE CASCADE,
+  INDEX idx_rollback_jobs_target (app_name, env)
+);
+-- Tables created before the column was widened
+ALTER TABLE rollback_jobs MODIFY log MEDIUMTEXT;
+
 -- Phase 3: Server Management
 CREATE TABLE IF NOT EXISTS server_groups (
   id INT AUTO_INCREMENT PRIMARY KEY,
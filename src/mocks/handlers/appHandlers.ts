@@ -40,7 +40,23 @@ export function handleRollback(body: RollbackRequest, userName: string) {
     createdAt: new Date().toISOString(),
   })
 
-  return { status: 200, data: { message: `${body.appName} ${body.env}를 ${body.targetVersion}으로 롤백했습니다.` } }
+  const now = new Date().toISOString()
+  return {
+    status: 200,
+    data: {
+      id: Date.now(),
+      appName: body.appName,
+      env: body.env,
+      targetVersion: body.targetVersion,
+      status: 'success',
+      startedBy: 1,
+      startedByName: userName,
+      log: null,
+      startedAt: now,
+      finishedAt: now,
+      message: `${body.appName} ${body.env}를 ${body.targetVersion}으로 롤백했습니다.`,
+    },
+  }
 }
 
 export function handleChangeReplica(body: ReplicaChangeRequest, userName: string) {
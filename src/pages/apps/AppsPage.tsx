@@ -34,16 +34,60 @@ export default function AppsPage() {
     }
 
     try {
-      const data = await appService.getApps(forceRefresh)
-      setApps(data)
+      if (forceRefresh && filterEnv) {
+        // Only the visible environment needs fresh data
+        const data = await appService.getApps(true, { env: filterEnv })
+        setApps((prev) => [...prev.filter((a) => a.env !== filterEnv), ...data])
+      } else {
+        const data = await appService.getApps(forceRefresh)
+        setApps(data)
+      }
     } finally {
       setLoading(false)
       setRefreshing(false)
     }
   }
 
+  // Reload one app/env slice and merge it into the list
+  const refreshApp = async (appName: string, env: string) => {
+    const data = await appService.getApps(true, { appName, env })
+    setApps((prev) => {
+      const others = prev.filter((a) => !(a.appName === appName && a.env === env))
+      return [...others, ...data]
+    })
+  }
+
   useEffect(() => { fetchApps() }, [])
 
+  // Live sync-status deltas pushed from the backend's deployment watch
+  useEffect(() => {
+    const token = localStorage.getItem('token') || ''
+    const { protocol, host, pathname } = window.location
+    const wsProto = protocol === 'https:' ? 'wss:' : 'ws:'
+    const match = pathname.match(/^(\/[^/]+\/[^/]+)/)
+    const basePath = match ? `${match[1]}/api` : '/api'
+    const ws = new WebSocket(`${wsProto}//${host}${basePath}/apps/ws/status?token=${encodeURIComponent(token)}`)
+
+    ws.onmessage = (ev) => {
+      const msg = JSON.parse(ev.data)
+      if (msg.type === 'app') {
+        const updated = msg.app as AppStatus
+        setApps((prev) => [
+          ...prev.filter((a) => !(a.appName === updated.appName && a.env === updated.env)),
+          updated,
+        ])
+      } else if (msg.type === 'removed') {
+        setApps((prev) => prev.filter((a) => !(a.appName === msg.appName && a.env === msg.env)))
+      } else if (msg.type === 'resync') {
+        appService.getApps().then(setApps)
+      }
+    }
+
+    return () => {
+      ws.close()
+    }
+  }, [])
+
   const envOptions = useMemo(() => {
     const envs = new Set(apps.map((a) => a.env))
     return Array.from(envs).sort()
@@ -336,7 +380,7 @@ export default function AppsPage() {
           onClose={() => setRollbackTarget(null)}
           onComplete={() => {
             setRollbackTarget(null)
-            fetchApps()
+            refreshApp(rollbackTarget.appName, rollbackTarget.env)
           }}
         />
       )}
@@ -349,7 +393,7 @@ export default function AppsPage() {
           onClose={() => setReplicaTarget(null)}
           onComplete={() => {
             setReplicaTarget(null)
-            fetchApps()
+            refreshApp(replicaTarget.app.appName, replicaTarget.app.env)
           }}
         />
       )}
@@ -1,7 +1,7 @@
-import { useEffect, useMemo, useState } from 'react'
+import { useEffect, useMemo, useRef, useState } from 'react'
 import { Search } from 'lucide-react'
 import { appService } from '../../services/appService'
-import type { AppStatus, AppTag } from '../../types/app'
+import type { AppStatus, AppTag, RollbackJob } from '../../types/app'
 import Modal from '../../components/ui/Modal'
 import ConfirmModal from '../../components/ui/ConfirmModal'
 import Button from '../../components/ui/Button'
@@ -23,6 +23,24 @@ export default function RollbackModal({ app, onClose, onComplete }: RollbackModa
   const [executing, setExecuting] = useState(false)
   const [filterVersion, setFilterVersion] = useState('')
   const [elapsed, setElapsed] = useState(0)
+  const [jobLog, setJobLog] = useState('')
+  const [failed, setFailed] = useState(false)
+  const logRef = useRef<HTMLPreElement>(null)
+  const wsRef = useRef<WebSocket | null>(null)
+  const retryRef = useRef<ReturnType<typeof setTimeout> | null>(null)
+  const unmountedRef = useRef(false)
+
+  useEffect(() => () => {
+    unmountedRef.current = true
+    if (retryRef.current) clearTimeout(retryRef.current)
+    wsRef.current?.close()
+  }, [])
+
+  useEffect(() => {
+    if (logRef.current) {
+      logRef.current.scrollTop = logRef.current.scrollHeight
+    }
+  }, [jobLog])
 
   useEffect(() => {
     if (!executing) { setElapsed(0); return }
@@ -42,40 +60,121 @@ export default function RollbackModal({ app, onClose, onComplete }: RollbackModa
     return tags.filter((t) => t.tag.toLowerCase().includes(filterVersion.toLowerCase()))
   }, [tags, filterVersion])
 
+  const finishJob = (job: RollbackJob) => {
+    setExecuting(false)
+    if (job.log) setJobLog(job.log)
+    if (job.status === 'success') {
+      toast('success', `${app.appName} ${app.env}를 ${selectedTag}으로 변경했습니다.`)
+      onComplete()
+      onClose()
+    } else {
+      setFailed(true)
+      toast('error', '버전 변경에 실패했습니다.')
+    }
+  }
+
+  // Stream the job output; the socket closes once the job has finished. If it closes earlier
+  // (idle proxy timeout, failed connect), check the job and reconnect while it is still running.
+  const streamJob = (job: RollbackJob, statusErrors = 0) => {
+    const token = localStorage.getItem('token') || ''
+    const { protocol, host, pathname } = window.location
+    const wsProto = protocol === 'https:' ? 'wss:' : 'ws:'
+    const match = pathname.match(/^(\/[^/]+\/[^/]+)/)
+    const basePath = match ? `${match[1]}/api` : '/api'
+    const wsUrl = `${wsProto}//${host}${basePath}/apps/ws/rollback?jobId=${job.id}&token=${encodeURIComponent(token)}`
+
+    const ws = new WebSocket(wsUrl)
+    wsRef.current = ws
+    // Every connection replays the output from the start
+    let received = false
+    ws.onmessage = (ev) => {
+      if (!ev.data) return // keepalive
+      setJobLog((prev) => (received ? prev + ev.data : ev.data))
+      received = true
+    }
+    ws.onclose = () => {
+      wsRef.current = null
+      if (unmountedRef.current) return
+      const retry = (errors: number) => {
+        retryRef.current = setTimeout(() => streamJob(job, errors), 3000)
+      }
+      appService.getRollbackJob(job.id)
+        .then((current) => {
+          if (current.status === 'success' || current.status === 'failed') {
+            finishJob(current)
+          } else {
+            if (current.log) setJobLog(current.log)
+            retry(0)
+          }
+        })
+        .catch((err) => {
+          if (statusErrors < 4) {
+            retry(statusErrors + 1)
+            return
+          }
+          setExecuting(false)
+          setFailed(true)
+          toast('error', err instanceof Error ? err.message : '버전 변경 상태를 확인할 수 없습니다.')
+        })
+    }
+  }
+
   const handleRollback = async () => {
     setConfirmOpen(false)
     setExecuting(true)
+    setFailed(false)
+    setJobLog('')
     try {
-      await appService.rollback({
+      const job = await appService.rollback({
         appName: app.appName,
         env: app.env,
         targetVersion: selectedTag,
       })
-      toast('success', `${app.appName} ${app.env}를 ${selectedTag}으로 변경했습니다.`)
-      onComplete()
-      onClose()
+      if (job.status === 'success' || job.status === 'failed') {
+        finishJob(job)
+      } else {
+        streamJob(job)
+      }
     } catch (err) {
-      toast('error', err instanceof Error ? err.message : '버전 변경에 실패했습니다.')
-    } finally {
       setExecuting(false)
+      toast('error', err instanceof Error ? err.message : '버전 변경에 실패했습니다.')
     }
   }
 
   return (
     <>
       <Modal open onClose={executing ? () => {} : onClose} title={`배포 버전 선택 - ${app.appName} (${app.env})`}>
-        {executing ? (
-          <div className="flex flex-col items-center justify-center py-10 gap-3">
-            <Spinner className="h-8 w-8" />
-            <p className="text-sm text-text-secondary">
-              {app.appName} {app.env}를 {selectedTag}으로 배포 중
-              <span className="inline-block w-4 text-left">
-                {'.'.repeat((elapsed % 3) + 1)}
-              </span>
-            </p>
-            <p className="text-xs text-text-tertiary">
-              경과 시간: {elapsed}초
-            </p>
+        {executing || failed ? (
+          <div className="flex flex-col gap-3">
+            {executing ? (
+              <div className="flex flex-col items-center justify-center pt-4 gap-3">
+                <Spinner className="h-8 w-8" />
+                <p className="text-sm text-text-secondary">
+                  {app.appName} {app.env}를 {selectedTag}으로 배포 중
+                  <span className="inline-block w-4 text-left">
+                    {'.'.repeat((elapsed % 3) + 1)}
+                  </span>
+                </p>
+                <p className="text-xs text-text-tertiary">
+                  경과 시간: {elapsed}초
+                </p>
+              </div>
+            ) : (
+              <p className="text-sm text-danger">{selectedTag}(으)로 변경하지 못했습니다.</p>
+            )}
+            {jobLog && (
+              <pre
+                ref={logRef}
+                className="text-xs text-[#cdd6f4] bg-[#1e1e2e] rounded-md p-3 font-mono whitespace-pre-wrap max-h-60 overflow-y-auto"
+              >
+                {jobLog}
+              </pre>
+            )}
+            {failed && (
+              <div className="flex justify-end">
+                <Button variant="secondary" onClick={onClose}>닫기</Button>
+              </div>
+            )}
           </div>
         ) : loading ? (
           <div className="flex justify-center py-8">
@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from 'react'
+import { useEffect, useState } from 'react'
 import { Link } from 'react-router-dom'
 import { RefreshCw, Search, MoreHorizontal } from 'lucide-react'
 import { k8sService } from '../../services/k8sService'
@@ -51,17 +51,21 @@ export default function AllDeploymentList({ context, initialSearch = '' }: Props
   const fetchDeploys = async () => {
     setLoading(true)
     try {
-      setDeployments(await k8sService.getAllDeployments(context))
+      // Search runs server-side against the cached deployment set
+      setDeployments(await k8sService.getAllDeployments(context, { search }))
     } finally {
       setLoading(false)
     }
   }
 
   useEffect(() => {
-    fetchDeploys()
+    const timer = setTimeout(fetchDeploys, search ? 300 : 0)
     const interval = setInterval(fetchDeploys, 10000)
-    return () => clearInterval(interval)
-  }, [context])
+    return () => {
+      clearTimeout(timer)
+      clearInterval(interval)
+    }
+  }, [context, search])
 
   const showToast = (message: string, type: 'success' | 'error') => {
     setToast({ message, type })
@@ -83,13 +87,6 @@ export default function AllDeploymentList({ context, initialSearch = '' }: Props
     }
   }
 
-  const filtered = useMemo(() => {
-    if (!search) return deployments
-    const q = search.toLowerCase()
-    return deployments.filter(
-      (d) => d.name.toLowerCase().includes(q) || d.namespace.toLowerCase().includes(q),
-    )
-  }, [deployments, search])
 
   const columns = [
     {
@@ -208,7 +205,7 @@ export default function AllDeploymentList({ context, initialSearch = '' }: Props
 
       <Table
         columns={columns}
-        data={filtered}
+        data={deployments}
         keyExtractor={(d) => `${d.namespace}/${d.name}`}
       />
 
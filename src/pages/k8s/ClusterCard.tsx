@@ -27,7 +27,7 @@ function formatCores(millicores: number): string {
 }
 
 export default function ClusterCard({ cluster }: { cluster: ClusterInfo }) {
-  const statusVariant = cluster.status === 'healthy' ? 'success' : 'danger'
+  const statusVariant = cluster.status === 'healthy' ? 'success' : cluster.status === 'unknown' ? 'warning' : 'danger'
 
   return (
     <Link
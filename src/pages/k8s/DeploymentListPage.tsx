@@ -1,6 +1,6 @@
 import { useEffect, useState } from 'react'
 import { useParams, Link } from 'react-router-dom'
-import { ChevronRight, MoreHorizontal, RefreshCw } from 'lucide-react'
+import { ChevronRight, MoreHorizontal, RefreshCw, RotateCw } from 'lucide-react'
 import { k8sService } from '../../services/k8sService'
 import type { DeploymentInfo } from '../../types/k8s'
 import Table from '../../components/ui/Table'
@@ -37,6 +37,7 @@ export default function DeploymentListPage() {
   const [editTarget, setEditTarget] = useState<DeploymentInfo | null>(null)
   const [execTarget, setExecTarget] = useState<DeploymentInfo | null>(null)
   const [restarting, setRestarting] = useState(false)
+  const [restartAllOpen, setRestartAllOpen] = useState(false)
   const [toast, setToast] = useState<{ message: string; type: 'success' | 'error' } | null>(null)
 
   if (!context || !namespace) return null
@@ -71,6 +72,25 @@ export default function DeploymentListPage() {
     }
   }
 
+  const handleRestartAll = async () => {
+    setRestarting(true)
+    try {
+      const res = await k8sService.bulkRestartDeployments(context, { namespace })
+      if (res.failed === 0) {
+        showToast(`${res.succeeded}개 Deployment 재시작 요청 완료`, 'success')
+      } else {
+        const failed = res.results.filter((r) => !r.success).map((r) => r.name).join(', ')
+        showToast(`${res.succeeded}개 성공, ${res.failed}개 실패: ${failed}`, 'error')
+      }
+      setRestartAllOpen(false)
+      fetchDeploys()
+    } catch (e) {
+      showToast(e instanceof Error ? e.message : '재시작 실패', 'error')
+    } finally {
+      setRestarting(false)
+    }
+  }
+
   const showToast = (message: string, type: 'success' | 'error') => {
     setToast({ message, type })
     setTimeout(() => setToast(null), 3000)
@@ -166,10 +186,16 @@ export default function DeploymentListPage() {
         <h1 className="text-lg font-semibold text-text-primary">
           Deployments — {namespace}
         </h1>
-        <Button variant="ghost" size="sm" onClick={fetchDeploys}>
-          <RefreshCw size={14} className="mr-1" />
-          새로고침
-        </Button>
+        <div className="flex items-center gap-2">
+          <Button variant="ghost" size="sm" onClick={() => setRestartAllOpen(true)} disabled={deployments.length === 0}>
+            <RotateCw size={14} className="mr-1" />
+            전체 재시작
+          </Button>
+          <Button variant="ghost" size="sm" onClick={fetchDeploys}>
+            <RefreshCw size={14} className="mr-1" />
+            새로고침
+          </Button>
+        </div>
       </div>
 
       <Table
@@ -229,6 +255,17 @@ export default function DeploymentListPage() {
         loading={restarting}
       />
 
+      <ConfirmModal
+        open={restartAllOpen}
+        onClose={() => setRestartAllOpen(false)}
+        onConfirm={handleRestartAll}
+        title="전체 Deployment 재시작"
+        message={`${namespace}의 모든 Deployment를 재시작합니다. 계속하시겠습니까?`}
+        confirmText="전체 재시작"
+        danger
+        loading={restarting}
+      />
+
       {toast && (
         <div className={`fixed bottom-4 right-4 z-50 px-4 py-2 rounded-md text-sm text-white shadow-lg ${toast.type === 'success' ? 'bg-success' : 'bg-danger'}`}>
           {toast.message}
@@ -85,14 +85,32 @@ export default function ExecModal({ context, namespace, deploymentName, onClose
     xtermRef.current = term
 
     const ws = new WebSocket(wsUrl)
+    ws.binaryType = 'arraybuffer'
     wsRef.current = ws
 
+    const sendResize = () => {
+      if (ws.readyState === WebSocket.OPEN) {
+        ws.send(JSON.stringify({ type: 'resize', cols: term.cols, rows: term.rows }))
+      }
+    }
+
     ws.onopen = () => {
       setConnected(true)
+      sendResize()
     }
 
+    // Binary frames are raw terminal output; text frames are control messages
     ws.onmessage = (ev) => {
-      term.write(ev.data)
+      if (ev.data instanceof ArrayBuffer) {
+        term.write(new Uint8Array(ev.data))
+        return
+      }
+      const msg = JSON.parse(ev.data)
+      if (msg.type === 'error') {
+        term.write(`\r\nError: ${msg.message}\r\n`)
+      } else if (msg.type === 'exit' && msg.status !== 'Success') {
+        term.write(`\r\n\x1b[31m${msg.message}\x1b[0m\r\n`)
+      }
     }
 
     ws.onclose = () => {
@@ -105,11 +123,13 @@ export default function ExecModal({ context, namespace, deploymentName, onClose
       term.write('\r\n\x1b[31m연결 오류가 발생했습니다.\x1b[0m\r\n')
     }
 
+    const encoder = new TextEncoder()
     term.onData((data: string) => {
       if (ws.readyState === WebSocket.OPEN) {
-        ws.send(data)
+        ws.send(encoder.encode(data))
       }
     })
+    term.onResize(sendResize)
   }
 
   const disconnect = () => {
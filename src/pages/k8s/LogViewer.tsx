@@ -1,12 +1,15 @@
 import { useEffect, useState } from 'react'
 import { RefreshCw } from 'lucide-react'
 import { k8sService } from '../../services/k8sService'
-import type { DeploymentLogsResponse } from '../../types/k8s'
+import type { DeploymentLogsResponse, FollowLogLine } from '../../types/k8s'
 import Modal from '../../components/ui/Modal'
 import Button from '../../components/ui/Button'
 import Spinner from '../../components/ui/Spinner'
 import Badge from '../../components/ui/Badge'
 
+// Lines kept on screen while following
+const MAX_FOLLOW_LINES = 2000
+
 interface Props {
   context: string
   namespace: string
@@ -19,12 +22,16 @@ export default function LogViewer({ context, namespace, deploymentName, onClose
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
   const [expandedPod, setExpandedPod] = useState<string | null>(null)
+  const [merged, setMerged] = useState(false)
+  const [follow, setFollow] = useState(false)
+  const [followLines, setFollowLines] = useState<FollowLogLine[]>([])
+  const [dropped, setDropped] = useState(0)
 
   const fetchLogs = async () => {
     setLoading(true)
     setError('')
     try {
-      const result = await k8sService.getDeploymentLogs(context, namespace, deploymentName, 200)
+      const result = await k8sService.getDeploymentLogs(context, namespace, deploymentName, 200, merged)
       setData(result)
       if (result.pods.length > 0 && !expandedPod) {
         setExpandedPod(result.pods[0].podName)
@@ -36,7 +43,35 @@ export default function LogViewer({ context, namespace, deploymentName, onClose
     }
   }
 
-  useEffect(() => { fetchLogs() }, [])
+  useEffect(() => { fetchLogs() }, [merged])
+
+  // Follow mode: the backend streams every pod's log lines, including pods started later
+  useEffect(() => {
+    if (!follow) return
+    setFollowLines([])
+    setDropped(0)
+    const token = localStorage.getItem('token') || ''
+    const { protocol, host, pathname } = window.location
+    const wsProto = protocol === 'https:' ? 'wss:' : 'ws:'
+    const match = pathname.match(/^(\/[^/]+\/[^/]+)/)
+    const basePath = match ? `${match[1]}/api` : '/api'
+    const ws = new WebSocket(`${wsProto}//${host}${basePath}/k8s/ws/logs?context=${encodeURIComponent(context)}&namespace=${encodeURIComponent(namespace)}&name=${encodeURIComponent(deploymentName)}&tailLines=100&token=${encodeURIComponent(token)}`)
+
+    ws.onmessage = (ev) => {
+      const msg = JSON.parse(ev.data)
+      if (msg.type === 'logs') {
+        setFollowLines((prev) => [...prev, ...(msg.lines as FollowLogLine[])].slice(-MAX_FOLLOW_LINES))
+        setDropped(msg.dropped)
+      }
+    }
+    ws.onclose = (ev) => {
+      if (ev.code !== 1000 && ev.reason) setError(ev.reason)
+    }
+
+    return () => {
+      ws.close()
+    }
+  }, [follow])
 
   return (
     <Modal open onClose={onClose} title={`Logs — ${deploymentName}`} maxWidth="max-w-3xl">
@@ -45,10 +80,18 @@ export default function LogViewer({ context, namespace, deploymentName, onClose
           <span className="text-xs text-text-secondary">
             {data ? `${data.totalPods} pod(s)` : ''}
           </span>
-          <Button variant="ghost" size="sm" onClick={fetchLogs} disabled={loading}>
-            <RefreshCw size={12} className="mr-1" />
-            새로고침
-          </Button>
+          <div className="flex items-center gap-1">
+            <Button variant="ghost" size="sm" onClick={() => setFollow(!follow)}>
+              {follow ? '실시간 중지' : '실시간'}
+            </Button>
+            <Button variant="ghost" size="sm" onClick={() => setMerged(!merged)} disabled={loading || follow}>
+              {merged ? 'Pod별 보기' : '시간순 통합 보기'}
+            </Button>
+            <Button variant="ghost" size="sm" onClick={fetchLogs} disabled={loading || follow}>
+              <RefreshCw size={12} className="mr-1" />
+              새로고침
+            </Button>
+          </div>
         </div>
 
         {loading && !data && (
@@ -64,11 +107,32 @@ export default function LogViewer({ context, namespace, deploymentName, onClose
           </div>
         )}
 
-        {data && data.pods.length === 0 && (
+        {!follow && data && data.pods.length === 0 && (
           <p className="text-sm text-text-tertiary text-center py-8">로그가 없습니다.</p>
         )}
 
-        {data && data.pods.map((pod) => (
+        {follow && (
+          <>
+            {dropped > 0 && (
+              <p className="text-xs text-warning mb-1">수신이 느려 {dropped}줄이 누락되었습니다.</p>
+            )}
+            <pre className="mb-3 p-3 bg-[#1e1e1e] text-[#d4d4d4] text-xs font-mono overflow-x-auto max-h-[400px] overflow-y-auto rounded-md border border-border-primary whitespace-pre-wrap">
+              {followLines.length > 0
+                ? followLines.map((l) => `[${l.pod}/${l.container}] ${l.line}`).join('\n')
+                : '(waiting for logs...)'}
+            </pre>
+          </>
+        )}
+
+        {!follow && data?.merged && (
+          <pre className="mb-3 p-3 bg-[#1e1e1e] text-[#d4d4d4] text-xs font-mono overflow-x-auto max-h-[400px] overflow-y-auto rounded-md border border-border-primary whitespace-pre-wrap">
+            {data.merged.length > 0
+              ? data.merged.map((l) => `${l.timestamp} [${l.podName}/${l.containerName}] ${l.line}`).join('\n')
+              : '(empty)'}
+          </pre>
+        )}
+
+        {!follow && data && data.pods.filter((pod) => !data.merged || pod.logs).map((pod) => (
           <div key={`${pod.podName}-${pod.containerName}`} className="mb-3">
             <button
               onClick={() => setExpandedPod(expandedPod === pod.podName ? null : pod.podName)}
@@ -1,10 +1,13 @@
 import { apiClient } from './api'
-import type { AppStatus, AppTag, RollbackRequest, ReplicaChangeRequest } from '../types/app'
+import type { AppStatus, AppTag, RollbackRequest, RollbackJob, ReplicaChangeRequest, ReplicaBatchResponse } from '../types/app'
 
 export const appService = {
-  getApps(forceRefresh = false) {
-    const params = forceRefresh ? '?force_refresh=true' : ''
-    return apiClient<AppStatus[]>('GET', `/apps${params}`)
+  getApps(forceRefresh = false, scope: { appName?: string; env?: string } = {}) {
+    const query: Record<string, string> = {}
+    if (forceRefresh) query.force_refresh = 'true'
+    if (scope.appName) query.appName = scope.appName
+    if (scope.env) query.env = scope.env
+    return apiClient<AppStatus[]>('GET', '/apps', { query })
   },
 
   getTags(appName: string, env: string) {
@@ -12,10 +15,18 @@ export const appService = {
   },
 
   rollback(data: RollbackRequest) {
-    return apiClient<{ message: string }>('POST', '/apps/rollback', { body: data })
+    return apiClient<RollbackJob>('POST', '/apps/rollback', { body: data })
+  },
+
+  getRollbackJob(jobId: number) {
+    return apiClient<RollbackJob>('GET', `/apps/rollback/jobs/${jobId}`)
   },
 
   changeReplica(data: ReplicaChangeRequest) {
     return apiClient<{ message: string }>('POST', '/apps/replica', { body: data })
   },
+
+  changeReplicasBatch(items: ReplicaChangeRequest[]) {
+    return apiClient<ReplicaBatchResponse>('POST', '/apps/replica/batch', { body: { items } })
+  },
 }
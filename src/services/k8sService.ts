@@ -4,11 +4,24 @@ import type {
   NodeInfo,
   NamespaceInfo,
   DeploymentInfo,
+  DeploymentListQuery,
   DeploymentLogsResponse,
+  DeploymentDescribeResponse,
   ScaleResponse,
+  DeploymentBulkRequest,
+  DeploymentBulkResponse,
   PodInfo,
 } from '../types/k8s'
 
+// Drop unset filters; the API filters, sorts and pages server-side
+function deploymentQuery(query: DeploymentListQuery): Record<string, string> {
+  const params: Record<string, string> = {}
+  for (const [key, value] of Object.entries(query)) {
+    if (value !== undefined && value !== '') params[key] = String(value)
+  }
+  return params
+}
+
 export const k8sService = {
   getClusters() {
     return apiClient<ClusterListResponse>('GET', '/k8s/clusters')
@@ -23,25 +36,31 @@ export const k8sService = {
     return apiClient<NamespaceInfo[]>('GET', `/k8s/clusters/${context}/namespaces${params}`)
   },
 
-  getAllDeployments(context: string) {
-    return apiClient<DeploymentInfo[]>('GET', `/k8s/clusters/${context}/deployments`)
+  getAllDeployments(context: string, query: DeploymentListQuery = {}) {
+    return apiClient<DeploymentInfo[]>('GET', `/k8s/clusters/${context}/deployments`, {
+      query: deploymentQuery(query),
+    })
   },
 
-  getDeployments(context: string, namespace: string) {
-    return apiClient<DeploymentInfo[]>('GET', `/k8s/clusters/${context}/namespaces/${namespace}/deployments`)
+  getDeployments(context: string, namespace: string, query: DeploymentListQuery = {}) {
+    return apiClient<DeploymentInfo[]>('GET', `/k8s/clusters/${context}/namespaces/${namespace}/deployments`, {
+      query: deploymentQuery(query),
+    })
   },
 
   getDeployment(context: string, namespace: string, name: string) {
     return apiClient<DeploymentInfo>('GET', `/k8s/clusters/${context}/namespaces/${namespace}/deployments/${name}`)
   },
 
-  describeDeployment(context: string, namespace: string, name: string) {
-    return apiClient<{ describe: string }>('GET', `/k8s/clusters/${context}/namespaces/${namespace}/deployments/${name}/describe`)
+  describeDeployment(context: string, namespace: string, name: string, events = 20) {
+    return apiClient<DeploymentDescribeResponse>('GET', `/k8s/clusters/${context}/namespaces/${namespace}/deployments/${name}/describe`, {
+      query: { events: String(events) },
+    })
   },
 
-  getDeploymentLogs(context: string, namespace: string, name: string, tailLines = 100) {
+  getDeploymentLogs(context: string, namespace: string, name: string, tailLines = 100, merged = false) {
     return apiClient<DeploymentLogsResponse>('GET', `/k8s/clusters/${context}/namespaces/${namespace}/deployments/${name}/logs`, {
-      query: { tailLines: String(tailLines) },
+      query: { tailLines: String(tailLines), ...(merged ? { merged: 'true' } : {}) },
     })
   },
 
@@ -55,6 +74,18 @@ export const k8sService = {
     return apiClient<{ message: string }>('POST', `/k8s/clusters/${context}/namespaces/${namespace}/deployments/${name}/restart`)
   },
 
+  bulkScaleDeployments(context: string, selection: DeploymentBulkRequest, replicas: number) {
+    return apiClient<DeploymentBulkResponse>('POST', `/k8s/clusters/${context}/deployments/bulk/scale`, {
+      body: { ...selection, replicas },
+    })
+  },
+
+  bulkRestartDeployments(context: string, selection: DeploymentBulkRequest) {
+    return apiClient<DeploymentBulkResponse>('POST', `/k8s/clusters/${context}/deployments/bulk/restart`, {
+      body: selection,
+    })
+  },
+
   getDeploymentYaml(context: string, namespace: string, name: string) {
     return apiClient<{ yaml: string }>('GET', `/k8s/clusters/${context}/namespaces/${namespace}/deployments/${name}/yaml`)
   },
@@ -30,9 +30,36 @@ export interface RollbackRequest {
   targetVersion: string
 }
 
+export type RollbackJobStatus = 'queued' | 'running' | 'success' | 'failed'
+
+export interface RollbackJob {
+  id: number
+  appName: string
+  env: string
+  targetVersion: string
+  status: RollbackJobStatus
+  startedBy: number
+  startedByName: string
+  log: string | null
+  startedAt: string
+  finishedAt: string | null
+  message: string
+}
+
 export interface ReplicaChangeRequest {
   appName: string
   env: string
   componentName: string
   replicas: number
 }
+
+export interface ReplicaBatchItemResult extends ReplicaChangeRequest {
+  success: boolean
+  message: string
+}
+
+export interface ReplicaBatchResponse {
+  results: ReplicaBatchItemResult[]
+  succeeded: number
+  failed: number
+}
@@ -63,6 +63,16 @@ export interface DeploymentInfo {
   updatedAt: string | null
 }
 
+export interface DeploymentListQuery {
+  labelSelector?: string
+  search?: string
+  prefix?: string
+  status?: string
+  sort?: string
+  limit?: number
+  cursor?: string
+}
+
 export interface PodInfo {
   name: string
   status: string
@@ -76,10 +86,24 @@ export interface PodLogEntry {
   logs: string
 }
 
+export interface MergedLogLine {
+  timestamp: string
+  podName: string
+  containerName: string
+  line: string
+}
+
+export interface FollowLogLine {
+  pod: string
+  container: string
+  line: string
+}
+
 export interface DeploymentLogsResponse {
   deployment: string
   pods: PodLogEntry[]
   totalPods: number
+  merged: MergedLogLine[] | null
 }
 
 export interface ScaleRequest {
@@ -91,3 +115,75 @@ export interface ScaleResponse {
   message: string
   replicas: number
 }
+
+// Bulk actions select either explicit targets or every deployment matching namespace/labelSelector
+export interface DeploymentBulkRequest {
+  namespace?: string
+  labelSelector?: string
+  targets?: { namespace: string; name: string }[]
+}
+
+export interface DeploymentBulkItemResult {
+  namespace: string
+  name: string
+  success: boolean
+  message: string
+}
+
+export interface DeploymentBulkResponse {
+  results: DeploymentBulkItemResult[]
+  succeeded: number
+  failed: number
+}
+
+export interface DescribeReplicaSet {
+  name: string
+  revision: string | null
+  current: boolean
+  replicas: number
+  readyReplicas: number
+  images: string[]
+  createdAt: string | null
+}
+
+export interface DescribePod {
+  name: string
+  phase: string
+  ready: string
+  restarts: number
+  node: string | null
+  ip: string | null
+  replicaSet: string | null
+  createdAt: string | null
+}
+
+export interface DescribeEvent {
+  type: string | null
+  reason: string | null
+  message: string | null
+  count: number
+  timestamp: string | null
+}
+
+export interface DeploymentDescribeResponse {
+  describe: string
+  deployment: {
+    name: string
+    namespace: string
+    createdAt: string | null
+    labels: Record<string, string>
+    selector: string
+    strategy: string | null
+    revision: string | null
+    replicas: number
+    updatedReplicas: number
+    totalReplicas: number
+    availableReplicas: number
+    unavailableReplicas: number
+    containers: { name: string; image: string | null; ports: number[]; requests: Record<string, string>; limits: Record<string, string> }[]
+    conditions: { type: string; status: string; reason: string | null; message: string | null }[]
+  }
+  replicaSets: DescribeReplicaSet[]
+  pods: DescribePod[]
+  events: DescribeEvent[]  // oldest first
+}